@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+import argparse
+import multiprocessing
+import time
+import tyrell.spec as S
+from tyrell.enumerator import SmtEnumerator
+
+# Soft predicates that replace the ones of the example specs, so that the enumerator has a cost to minimize
+toy_predicates = '''
+predicate occurs(mult, 70);
+predicate not_occurs(const, 30);
+predicate is_parent(plus, minus, 40);
+predicate is_parent(mult, plus, 60);
+'''
+deepcoder_predicates = '''
+predicate occurs(filter, 70);
+predicate not_occurs(sort, 40);
+predicate is_parent(map, get_mfn, 55);
+predicate is_parent(filter, get_fn, 65);
+predicate occurs(sum, 80);
+'''
+
+# (spec file, extra predicates, depth, loc)
+default_configs = [
+    ('example/toy.tyrell', toy_predicates, 3, 2),
+    ('example/toy.tyrell', toy_predicates, 4, 3),
+    ('example/deepcoder.tyrell', deepcoder_predicates, 4, 3),
+]
+default_engines = ['lsu', 'core', 'z3']
+
+
+def measure(spec_file, predicates, depth, loc, engine, num_models):
+    with open(spec_file, 'r') as f:
+        lines = [x for x in f if not x.startswith('predicate')]
+    spec = S.parse(''.join(lines) + predicates)
+    enumerator = SmtEnumerator(spec, depth=depth, loc=loc, optimizer=engine)
+
+    start = time.perf_counter()
+    num_found = 0
+    cost = 0
+    prog = enumerator.next()
+    while prog is not None and num_found < num_models:
+        num_found += 1
+        cost = enumerator.optimizer.computeCost(enumerator.model)
+        enumerator.update()
+        prog = enumerator.next()
+    solve_time = time.perf_counter() - start
+    return solve_time, num_found, cost
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare the optimization engines of SmtEnumerator on specs with soft predicates')
+    parser.add_argument('-n', '--models', type=int, default=200,
+                        help='Number of models to enumerate per configuration')
+    parser.add_argument('-e', '--engines', nargs='+', default=default_engines,
+                        choices=default_engines, help='Engines to compare')
+    args = parser.parse_args()
+
+    header = '{:<30} {:>5} {:>3} {:<6} {:>9} {:>6} {:>9}'
+    row = '{:<30} {:>5} {:>3} {:<6} {:>9.3f} {:>6} {:>9}'
+    print(header.format('spec', 'depth', 'loc', 'engine',
+                        'solve(s)', 'models', 'last cost'))
+    # Each measurement runs in a fresh process so that the runs do not share any solver state
+    ctx = multiprocessing.get_context('spawn')
+    with ctx.Pool(1, maxtasksperchild=1) as pool:
+        for spec_file, predicates, depth, loc in default_configs:
+            for engine in args.engines:
+                solve_time, num_found, cost = pool.apply(
+                    measure, (spec_file, predicates, depth, loc, engine, args.models))
+                print(row.format(spec_file, depth, loc, engine,
+                                 solve_time, num_found, cost))
+
+
+if __name__ == '__main__':
+    main()
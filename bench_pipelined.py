@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+
+import argparse
+import functools
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+import tyrell.spec as S
+from tyrell.interpreter import PostOrderInterpreter
+from tyrell.enumerator import SmtEnumerator
+from tyrell.decider import Example, ExampleConstraintDecider
+from tyrell.synthesizer import Synthesizer, PipelinedSynthesizer
+
+spec_file = 'example/toy.tyrell'
+# (depth, loc, examples of the target program)
+default_tasks = {
+    # mult(minus(@param0, @param1), @param1)
+    'toy-3-2': (3, 2, [([4, 3], 3), ([6, 3], 9), ([1, 2], -2), ([1, 1], 0)]),
+    # plus(mult(@param0, @param0), minus(@param1, @param0))
+    'toy-4-3': (4, 3, [([2, 3], 5), ([3, 1], 7), ([-1, 4], 6), ([0, 2], 2)]),
+    # no solution, so that the whole space is enumerated
+    'toy-4-3-none': (4, 3, [([2, 3], 1000), ([3, 1], -999), ([-1, 4], 17)]),
+}
+# Threads are left out, since the decider uses z3
+default_modes = ['sequential', 'processes']
+
+
+class ToyInterpreter(PostOrderInterpreter):
+    '''The interpreter of the toy spec, where every call waits for `latency` seconds as if it went to an external interpreter, e.g. R'''
+
+    def __init__(self, latency=0.0):
+        self._latency = latency
+
+    def _wait(self):
+        if self._latency > 0:
+            time.sleep(self._latency)
+
+    def eval_SmallInt(self, v):
+        return int(v)
+
+    def eval_const(self, node, args):
+        return args[0]
+
+    def eval_plus(self, node, args):
+        self._wait()
+        return args[0] + args[1]
+
+    def eval_minus(self, node, args):
+        self._wait()
+        return args[0] - args[1]
+
+    def eval_mult(self, node, args):
+        self._wait()
+        return args[0] * args[1]
+
+    def eval_empty(self, node, args):
+        return args[0]
+
+    def apply_is_positive(self, val):
+        return val > 0
+
+
+def make_decider(examples, latency):
+    spec = S.parse_file(spec_file)
+    return ExampleConstraintDecider(
+        spec=spec,
+        interpreter=ToyInterpreter(latency),
+        examples=[Example(input=x, output=y) for x, y in examples]
+    )
+
+
+def measure(task, mode, latency, num_workers):
+    depth, loc, examples = default_tasks[task]
+    enumerator = SmtEnumerator(S.parse_file(spec_file), depth=depth, loc=loc)
+    if mode == 'sequential':
+        synthesizer = Synthesizer(enumerator, make_decider(examples, latency))
+        num_attempts = 0
+        start = time.perf_counter()
+        with synthesizer:
+            prog = synthesizer.enumerator.next()
+            while prog is not None:
+                num_attempts += 1
+                if synthesizer.try_program(prog):
+                    break
+                prog = synthesizer.enumerator.next()
+        elapsed = time.perf_counter() - start
+    else:
+        synthesizer = PipelinedSynthesizer(
+            enumerator, functools.partial(make_decider, examples, latency),
+            num_workers=num_workers, processes=(mode == 'processes'))
+        with synthesizer:
+            prog = synthesizer.synthesize()
+        num_attempts = synthesizer.num_attempts
+        elapsed = synthesizer.elapsed
+    return elapsed, num_attempts, None if prog is None else str(prog)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare the throughput of the sequential synthesis loop with PipelinedSynthesizer on the toy spec')
+    parser.add_argument('-l', '--latency', type=float, nargs='+', default=[0.0, 0.001],
+                        help='Simulated time per interpreter call, in seconds')
+    parser.add_argument('-j', '--jobs', type=int, default=2,
+                        help='Number of decider workers of the pipelined synthesizer')
+    parser.add_argument('-t', '--tasks', nargs='+', default=sorted(default_tasks),
+                        choices=sorted(default_tasks), help='Tasks to run')
+    parser.add_argument('-m', '--modes', nargs='+', default=default_modes,
+                        choices=default_modes, help='Synthesis loops to compare')
+    args = parser.parse_args()
+
+    header = '{:<12} {:>8} {:<10} {:>8} {:>9} {:>10}  {}'
+    row = '{:<12} {:>8} {:<10} {:>8.3f} {:>9} {:>10.1f}  {}'
+    print(header.format('task', 'latency', 'mode', 'time(s)',
+                        'attempts', 'cand/sec', 'program'))
+    # Each measurement runs in a fresh process so that the runs do not share any solver state.
+    # Unlike the workers of multiprocessing.Pool, these are allowed to start the workers of the pipeline.
+    ctx = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(1, mp_context=ctx, max_tasks_per_child=1) as pool:
+        for task in args.tasks:
+            for latency in args.latency:
+                for mode in args.modes:
+                    elapsed, num_attempts, prog = pool.submit(
+                        measure, task, mode, latency, args.jobs).result()
+                    print(row.format(task, latency, mode, elapsed, num_attempts,
+                                     num_attempts / elapsed if elapsed > 0 else 0.0,
+                                     prog if prog is not None else '-'))
+
+
+if __name__ == '__main__':
+    main()
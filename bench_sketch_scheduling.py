@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+import argparse
+import glob
+import multiprocessing
+import os
+import time
+from tyrell.enumerator import SketchScheduler
+
+# Single-table tasks, since morpheus_enumerator.py ignores the second input table
+benchmark_dir = 'benchmarks/pldi17'
+default_strategies = ['queue', 'schedule']
+
+
+def find_tasks():
+    tasks = []
+    for input0 in glob.glob(os.path.join(benchmark_dir, 'p*_input1.csv')):
+        name = os.path.basename(input0).split('_')[0]
+        output = os.path.join(benchmark_dir, name + '_output1.csv')
+        input1 = os.path.join(benchmark_dir, name + '_input2.csv')
+        if os.path.exists(output) and not os.path.exists(input1):
+            tasks.append((name, input0, output))
+    return sorted(tasks, key=lambda x: int(x[0][1:]))
+
+
+def measure(input0, output, loc, strategy, sketches):
+    # Imported here since it loads R in the worker process
+    from morpheus_enumerator import make_synthesizer
+    depth = loc + 1
+    start = time.perf_counter()
+    if strategy == 'schedule':
+        synthesizer = make_synthesizer(
+            input0, output, depth, loc, scheduler=SketchScheduler(sketches))
+    else:
+        synthesizer = make_synthesizer(
+            input0, output, depth, loc, sketches=sketches)
+    with synthesizer:
+        prog = synthesizer.synthesize()
+    return time.perf_counter() - start, None if prog is None else str(prog)
+
+
+def solve(pool, task, strategy, sketches, max_loc, timeout):
+    '''Time to solution over increasing LOC bounds, or None if the task times out or is not solved'''
+    _, input0, output = task
+    elapsed = 0.0
+    for loc in range(1, max_loc + 1):
+        result = pool.apply_async(
+            measure, (input0, output, loc, strategy, sketches))
+        try:
+            solve_time, prog = result.get(max(0.0, timeout - elapsed))
+        except multiprocessing.TimeoutError:
+            return None, None
+        elapsed += solve_time
+        if prog is not None:
+            return elapsed, prog
+    return None, None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare the time to solution of BidirectEnumerator with the sketches in n-gram order and with SketchScheduler on the Morpheus benchmarks')
+    parser.add_argument('-t', '--timeout', type=float, default=300,
+                        help='Time limit per task and strategy, in seconds')
+    parser.add_argument('-l', '--max-loc', type=int, default=3,
+                        help='Largest LOC bound that is tried')
+    parser.add_argument('-b', '--benchmarks', nargs='+',
+                        help='Names of the tasks to run, e.g. p1 p2 (default: all single-table tasks)')
+    parser.add_argument('-s', '--strategies', nargs='+', default=default_strategies,
+                        choices=default_strategies, help='Strategies to compare')
+    args = parser.parse_args()
+
+    tasks = find_tasks()
+    if args.benchmarks is not None:
+        tasks = [x for x in tasks if x[0] in args.benchmarks]
+    with open('ngram.txt', 'r') as f:
+        sketches = [line.strip() for line in f]
+
+    header = '{:<6} {:<9} {:>9}  {}'
+    row = '{:<6} {:<9} {:>9}  {}'
+    print(header.format('task', 'strategy', 'time(s)', 'program'))
+    times = {x: [] for x in args.strategies}
+    for task in tasks:
+        for strategy in args.strategies:
+            # Each task runs in a fresh process, which is dropped on timeout
+            ctx = multiprocessing.get_context('spawn')
+            pool = ctx.Pool(1, maxtasksperchild=1)
+            try:
+                solve_time, prog = solve(
+                    pool, task, strategy, sketches, args.max_loc, args.timeout)
+            finally:
+                pool.terminate()
+                pool.join()
+            times[strategy].append(
+                args.timeout if solve_time is None else solve_time)
+            print(row.format(task[0], strategy,
+                             'timeout' if solve_time is None else '{:.3f}'.format(solve_time),
+                             prog if prog is not None else '-'))
+
+    # Timeouts count as the time limit, which underestimates the mean
+    for strategy in args.strategies:
+        values = times[strategy]
+        if len(values) > 0:
+            num_solved = sum(1 for x in values if x < args.timeout)
+            print('{}: solved {}/{}, mean time to solution {:.3f}s'.format(
+                strategy, num_solved, len(values), sum(values) / len(values)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+import argparse
+import multiprocessing
+import time
+import tyrell.spec as S
+from tyrell.enumerator import SmtEnumerator
+
+# (spec file, depth, loc)
+default_configs = [
+    ('example/toy.tyrell', 3, 2),
+    ('example/toy.tyrell', 4, 3),
+    ('example/simplestring.tyrell', 4, 3),
+    ('example/deepcoder.tyrell', 4, 3),
+    ('example/morpheus.tyrell', 3, 2),
+    ('example/morpheus.tyrell', 4, 3),
+]
+
+
+def measure(spec_file, depth, loc, sparse, num_models):
+    spec = S.parse_file(spec_file)
+
+    start = time.perf_counter()
+    enumerator = SmtEnumerator(spec, depth=depth, loc=loc, sparse=sparse)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    num_found = 0
+    prog = enumerator.next()
+    while prog is not None and num_found < num_models:
+        num_found += 1
+        enumerator.update()
+        prog = enumerator.next()
+    solve_time = time.perf_counter() - start
+
+    num_vars = len(enumerator.variables) + len(enumerator.variables_fun)
+    return len(enumerator.nodes), num_vars, build_time, solve_time, num_found
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare the complete and the type-directed sparse k-tree encodings of SmtEnumerator')
+    parser.add_argument('-n', '--models', type=int, default=100,
+                        help='Number of models to enumerate per configuration')
+    args = parser.parse_args()
+
+    header = '{:<30} {:>5} {:>3} {:<8} {:>6} {:>6} {:>9} {:>9} {:>6}'
+    row = '{:<30} {:>5} {:>3} {:<8} {:>6} {:>6} {:>9.3f} {:>9.3f} {:>6}'
+    print(header.format('spec', 'depth', 'loc', 'encoding',
+                        'nodes', 'vars', 'build(s)', 'solve(s)', 'models'))
+    # Each measurement runs in a fresh process so that the runs do not share any solver state
+    ctx = multiprocessing.get_context('spawn')
+    with ctx.Pool(1, maxtasksperchild=1) as pool:
+        for spec_file, depth, loc in default_configs:
+            for sparse in [False, True]:
+                nodes, num_vars, build_time, solve_time, num_found = pool.apply(
+                    measure, (spec_file, depth, loc, sparse, args.models))
+                print(row.format(spec_file, depth, loc,
+                                 'sparse' if sparse else 'full',
+                                 nodes, num_vars, build_time, solve_time, num_found))
+
+
+if __name__ == '__main__':
+    main()
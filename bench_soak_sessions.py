@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+import argparse
+import gc
+import multiprocessing
+import resource
+import time
+import tyrell.spec as S
+from tyrell.enumerator import SmtEnumerator
+from tyrell.decider import Example, ExampleConstraintDecider
+from tyrell.synthesizer import Synthesizer
+from demo_smt_enumerator import ToyInterpreter
+
+# A small task, so that many sessions fit in a soak: mult(plus(@param0, @param1), @param1)
+toy_examples = [
+    Example(input=[4, 3], output=21),
+    Example(input=[1, 2], output=6),
+    Example(input=[2, -1], output=-1),
+]
+
+
+def current_rss():
+    '''Resident set size of this process in MiB'''
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize() / (1024 * 1024)
+    except OSError:
+        # Not on Linux: fall back to the peak RSS, which is in KiB on Linux and in bytes on macOS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_session(spec_str, sparse, close):
+    spec = S.parse(spec_str)
+    synthesizer = Synthesizer(
+        enumerator=SmtEnumerator(spec, depth=3, loc=2, sparse=sparse),
+        decider=ExampleConstraintDecider(
+            spec=spec,
+            interpreter=ToyInterpreter(),
+            examples=toy_examples
+        )
+    )
+    if close:
+        with synthesizer:
+            return synthesizer.synthesize()
+    return synthesizer.synthesize()
+
+
+def soak(sparse, num_sessions, report_every, close):
+    with open('example/toy.tyrell', 'r') as f:
+        spec_str = f.read()
+    samples = []
+    start = time.perf_counter()
+    for i in range(1, num_sessions + 1):
+        prog = run_session(spec_str, sparse, close)
+        if prog is None:
+            raise RuntimeError('Session {} failed to synthesize'.format(i))
+        if i % report_every == 0:
+            gc.collect()
+            samples.append((i, time.perf_counter() - start, current_rss()))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run many SmtEnumerator synthesis sessions in one process and report its memory usage')
+    parser.add_argument('-n', '--sessions', type=int, default=1000,
+                        help='Number of sequential sessions per encoding')
+    parser.add_argument('-r', '--report-every', type=int, default=100,
+                        help='Number of sessions between two RSS samples')
+    parser.add_argument('--no-close', action='store_true',
+                        help='Do not close the sessions, and rely on the garbage collector instead')
+    args = parser.parse_args()
+
+    header = '{:<8} {:>8} {:>9} {:>9}'
+    row = '{:<8} {:>8} {:>9.1f} {:>9.1f}'
+    print(header.format('encoding', 'sessions', 'time(s)', 'rss(MiB)'))
+    # Each soak runs in a fresh process so that they do not inflate each other's RSS
+    ctx = multiprocessing.get_context('spawn')
+    with ctx.Pool(1, maxtasksperchild=1) as pool:
+        for sparse in [False, True]:
+            encoding = 'sparse' if sparse else 'full'
+            samples = pool.apply(
+                soak, (sparse, args.sessions, args.report_every, not args.no_close))
+            for i, elapsed, rss in samples:
+                print(row.format(encoding, i, elapsed, rss))
+            growth = samples[-1][2] - samples[0][2] if len(samples) > 0 else 0
+            print('{}: RSS grew by {:.1f} MiB after the first sample'.format(
+                encoding, growth))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+import argparse
+import multiprocessing
+import time
+import tyrell.spec as S
+from tyrell.enumerator import SmtEnumerator
+from tyrell.decider import Example
+from tyrell.decider.example_solver import ExampleSolver
+from tyrell.decider import example_constraint, example_constraint_pruning
+from tyrell.dsl import NodeIndexer
+from bench_pipelined import ToyInterpreter, default_tasks, spec_file
+
+# Encoders of the abstract semantics, and the value of a property that the interpreter cannot compute
+encoders = {
+    'constraint': (example_constraint.Z3Encoder, None),
+    'pruning': (example_constraint_pruning.Z3Encoder, -1),
+}
+# 'fresh' builds a new solver per (program, example) pair, as the encoders used to, 'persistent' reuses the solver of each example
+default_modes = ['fresh', 'persistent']
+
+
+def enumerate_programs(task, num_programs):
+    depth, loc, _ = default_tasks[task]
+    enumerator = SmtEnumerator(S.parse_file(spec_file), depth=depth, loc=loc)
+    progs = []
+    prog = enumerator.next()
+    while prog is not None and len(progs) < num_programs:
+        progs.append(prog)
+        enumerator.update()
+        prog = enumerator.next()
+    return progs
+
+
+def check(encoder_name, prog, example, solver):
+    encoder_class, _ = encoders[encoder_name]
+    encoder = encoder_class(ToyInterpreter(), NodeIndexer(prog), example, solver)
+    encoder.encode_output_alignment(prog)
+    encoder.visit(prog)
+    if encoder_name == 'constraint':
+        encoder.get_blame_nodes()
+    else:
+        with encoder.scope():
+            if encoder.is_unsat():
+                encoder.get_blame_nodes()
+
+
+def measure(task, encoder_name, mode, num_programs):
+    _, _, examples = default_tasks[task]
+    examples = [Example(input=x, output=y) for x, y in examples]
+    progs = enumerate_programs(task, num_programs)
+    _, unknown = encoders[encoder_name]
+    solvers = [ExampleSolver(ToyInterpreter(), x, unknown=unknown) for x in examples]
+    start = time.perf_counter()
+    for prog in progs:
+        for example, solver in zip(examples, solvers):
+            check(encoder_name, prog, example,
+                  solver if mode == 'persistent' else None)
+    elapsed = time.perf_counter() - start
+    return elapsed, len(progs) * len(examples)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare the throughput of the abstract-semantics checks with fresh and persistent per-example solvers')
+    parser.add_argument('-n', '--num-programs', type=int, default=500,
+                        help='Number of enumerated programs to check on every example')
+    parser.add_argument('-t', '--tasks', nargs='+', default=['toy-4-3-none'],
+                        choices=sorted(default_tasks), help='Tasks whose programs and examples are used')
+    parser.add_argument('-e', '--encoders', nargs='+', default=sorted(encoders),
+                        choices=sorted(encoders), help='Encoders to measure')
+    args = parser.parse_args()
+
+    header = '{:<14} {:<11} {:<11} {:>8} {:>7} {:>11}'
+    row = '{:<14} {:<11} {:<11} {:>8.3f} {:>7} {:>11.1f}'
+    print(header.format('task', 'encoder', 'mode', 'time(s)', 'checks', 'checks/sec'))
+    # Each measurement runs in a fresh process, so that they do not share the z3 context
+    ctx = multiprocessing.get_context('spawn')
+    for task in args.tasks:
+        for encoder_name in args.encoders:
+            for mode in default_modes:
+                with ctx.Pool(1) as pool:
+                    elapsed, num_checks = pool.apply(
+                        measure, (task, encoder_name, mode, args.num_programs))
+                print(row.format(task, encoder_name, mode, elapsed, num_checks,
+                                 num_checks / elapsed if elapsed > 0 else 0.0))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,12 @@
 #!/usr/bin/env python
 
 import argparse
+import functools
 import tyrell.spec as S
 from tyrell.interpreter import PostOrderInterpreter, GeneralError
-from tyrell.enumerator import BidirectEnumerator
+from tyrell.enumerator import BidirectEnumerator, SketchScheduler
 from tyrell.decider import Example, ExampleConstraintPruningDecider
-from tyrell.synthesizer import Synthesizer
+from tyrell.synthesizer import Synthesizer, SketchParallelSynthesizer
 from tyrell.logger import get_logger
 import rpy2.robjects as robjects
 
@@ -319,6 +320,33 @@ def init_tbl(df_name, csv_loc):
     robjects.r(cmd)
     return None
 
+def make_synthesizer(input0, output, depth_val, loc_val, sketches=None, scheduler=None):
+    # The sketch workers call this as well, since each of them needs its own tables in R
+    init_tbl('input0', input0)
+    #FIXME: ignore the second input table for now.
+    init_tbl('output', output)
+
+    logger.info('Parsing Spec...')
+    spec = S.parse_file('example/morpheus.tyrell')
+    logger.info('Parsing succeeded')
+
+    # Every statement is a round trip to R, so the tables of the statements shared by consecutive programs are reused
+    interpreter = MorpheusInterpreter()
+    interpreter.enable_cache()
+    return Synthesizer(
+        #loc: # of function productions
+        enumerator=BidirectEnumerator(spec, depth=depth_val, loc=loc_val, sk_queue=sketches, scheduler=scheduler),
+        decider=ExampleConstraintPruningDecider(
+            spec=spec,
+            interpreter=interpreter,
+            examples=[
+                # Example(input=[DataFrame2(benchmark1_input)], output=benchmark1_output),
+                Example(input=['input0'], output='output'),
+            ],
+            equal_output=eq_r
+        )
+    )
+
 def main():
 
     parser = argparse.ArgumentParser()
@@ -326,6 +354,10 @@ def main():
     parser.add_argument('-i1', '--input1', type=str)
     parser.add_argument('-o', '--output', type=str)
     parser.add_argument('-l', '--length', type=int)
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Number of processes that explore the sketches in parallel')
+    parser.add_argument('-s', '--schedule', action='store_true',
+                        help='Interleave the sketches by likelihood and feedback instead of exhausting them in order')
     args = parser.parse_args()
     loc_val = args.length
     # Input and Output must be in CSV format.
@@ -335,31 +367,21 @@ def main():
     # This is required by Ruben.
     depth_val = loc_val + 1
     print(input0, input1, output, loc_val)
-    init_tbl('input0', input0)
-    #FIXME: ignore the second input table for now.
-    init_tbl('output', output)
-
-    logger.info('Parsing Spec...')
-    spec = S.parse_file('example/morpheus.tyrell')
-    logger.info('Parsing succeeded')
 
     # Reading the n-gram model.
     sketches = [line.strip() for line in open("./ngram.txt", 'r')]
 
     logger.info('Building synthesizer...')
-    synthesizer = Synthesizer(
-        #loc: # of function productions
-        enumerator=BidirectEnumerator(spec, depth=depth_val, loc=loc_val, sk_queue=sketches),
-        decider=ExampleConstraintPruningDecider(
-            spec=spec,
-            interpreter=MorpheusInterpreter(),
-            examples=[
-                # Example(input=[DataFrame2(benchmark1_input)], output=benchmark1_output),
-                Example(input=['input0'], output='output'),
-            ],
-            equal_output=eq_r
-        )
-    )
+    if args.jobs > 1:
+        # Each worker builds its own synthesizer and takes sketches from a shared queue
+        synthesizer = SketchParallelSynthesizer(
+            functools.partial(make_synthesizer, input0, output, depth_val, loc_val),
+            sketches, num_workers=args.jobs)
+    elif args.schedule:
+        synthesizer = make_synthesizer(input0, output, depth_val, loc_val,
+                                       scheduler=SketchScheduler(sketches))
+    else:
+        synthesizer = make_synthesizer(input0, output, depth_val, loc_val, sketches)
     logger.info('Synthesizing programs...')
 
     prog = synthesizer.synthesize()
@@ -6,3 +6,6 @@ from . import interpreter
 from . import enumerator
 from . import decider
 from . import synthesizer
+from . import budget
+from . import metrics
+from . import storage
@@ -0,0 +1,131 @@
+import os
+import time
+from typing import Callable, Optional
+from z3 import unknown
+from .metrics import get_metrics
+
+# Value of the z3 `timeout` parameter that disables the timeout
+Z3_NO_TIMEOUT = 4294967295
+
+
+def current_memory() -> Optional[int]:
+    '''The resident set size of the current process in bytes, or `None` if it cannot be measured'''
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Peak rather than current usage, in kilobytes on Linux and in bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if os.uname().sysname == 'Darwin' else rss * 1024
+
+
+class BudgetExhausted(Exception):
+    '''
+    Raised when a run goes over its `Budget`.
+    `reason` is one of 'time', 'attempts', 'solver' and 'memory'.
+    '''
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+class Budget:
+    '''
+    The resources that a synthesis run may use: wall-clock time, number of candidates, time per solver check and memory.
+    A budget is shared by the synthesizer, the enumerator and the interpreter, which check it cooperatively and raise `BudgetExhausted` when it runs out.
+    Every limit is optional, and a budget without any limit never runs out.
+    '''
+
+    def __init__(self, time_limit: Optional[float] = None, max_attempts: Optional[int] = None,
+                 solver_timeout: Optional[float] = None, max_memory: Optional[int] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        '''
+        `time_limit` and `solver_timeout` are in seconds, and `max_memory` is the resident set size in bytes.
+        The wall-clock deadline is set when the run starts, see `start()`.
+        '''
+        for name, value in [('Time limit', time_limit), ('Maximum number of attempts', max_attempts),
+                            ('Solver timeout', solver_timeout), ('Maximum memory', max_memory)]:
+            if value is not None and value <= 0:
+                raise ValueError('{} must be positive: {}'.format(name, value))
+        self._time_limit = time_limit
+        self._max_attempts = max_attempts
+        self._solver_timeout = solver_timeout
+        self._max_memory = max_memory
+        self._clock = clock
+        self._deadline = None
+        self.num_attempts = 0
+
+    def start(self) -> None:
+        '''Start the clock and reset the number of attempts'''
+        self.num_attempts = 0
+        self._deadline = None
+        if self._time_limit is not None:
+            self._deadline = self._clock() + self._time_limit
+
+    def remaining_time(self) -> Optional[float]:
+        '''Seconds left before the deadline, or `None` if there is no deadline'''
+        if self._deadline is None:
+            return None
+        return self._deadline - self._clock()
+
+    def check(self) -> None:
+        '''Raise `BudgetExhausted` if the deadline has passed'''
+        remaining = self.remaining_time()
+        if remaining is not None and remaining <= 0:
+            raise BudgetExhausted(
+                'time', 'Time limit of {}s exceeded'.format(self._time_limit))
+
+    def attempt(self) -> None:
+        '''Count a candidate program, and raise `BudgetExhausted` if it goes over any limit'''
+        self.check()
+        if self._max_attempts is not None and self.num_attempts >= self._max_attempts:
+            raise BudgetExhausted('attempts', 'Maximum number of attempts {} reached'.format(
+                self._max_attempts))
+        if self._max_memory is not None:
+            memory = current_memory()
+            if memory is not None and memory > self._max_memory:
+                raise BudgetExhausted('memory', 'Memory usage of {} bytes exceeds {}'.format(
+                    memory, self._max_memory))
+        self.num_attempts += 1
+
+    def solver_timeout_ms(self) -> Optional[int]:
+        '''The z3 timeout for the next check: the solver timeout, cut to the remaining time. `None` if there is no limit.'''
+        timeouts = [x for x in [self._solver_timeout, self.remaining_time()]
+                    if x is not None]
+        if len(timeouts) == 0:
+            return None
+        return max(1, int(min(timeouts) * 1000))
+
+    def configure(self, solver) -> None:
+        '''
+        Set the timeout of a z3 solver for its next check.
+        The timeout is cut to the time left at this point, so it must be set again before each check for the deadline to hold, see `check_sat()`.
+        '''
+        self.check()
+        timeout = self.solver_timeout_ms()
+        solver.set('timeout', Z3_NO_TIMEOUT if timeout is None else timeout)
+
+
+def check_sat(solver, *assumptions, budget: Optional[Budget] = None):
+    '''
+    `solver.check(*assumptions)`, where a check that gives up because of its timeout or resource limit raises `BudgetExhausted`.
+    Any other unknown result raises `RuntimeError`, since it cannot be told apart from sat or unsat.
+    If a `budget` is given, the timeout of the solver is set from it right before the check.
+    '''
+    if budget is not None:
+        budget.configure(solver)
+    get_metrics().incr('solver_checks')
+    res = solver.check(*assumptions)
+    if res == unknown:
+        reason = solver.reason_unknown()
+        if reason in ['timeout', 'canceled'] or 'resource limit' in reason:
+            raise BudgetExhausted(
+                'solver', 'Solver check gave up: {}'.format(reason))
+        raise RuntimeError('Solver returned unknown: {}'.format(reason))
+    return res
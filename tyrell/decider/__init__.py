@@ -4,3 +4,6 @@ from .decider import Decider
 from .example_base import Example, ExampleDecider
 from .example_constraint import ExampleConstraintDecider
 from .example_constraint_pruning import ExampleConstraintPruningDecider
+from .example_scheduler import ExampleScheduler
+from .imply_map import ImplyMapCache, build_imply_map
+from .property_cache import PropertyCache
@@ -33,7 +33,9 @@ class AssertionViolationHandler:
         blames = list()
         arg_node = error.arg
         blame_base = self._compute_blame_base(error)
-        for alt_prod in self._spec.get_productions_with_lhs(prod.lhs):
+        g = self._spec.grammar
+        for alt_id in g.get_productions_with_lhs(prod.lhs):
+            alt_prod = g.productions[alt_id]
             alt_node = AtomNode(alt_prod)
             # Inputs doesn't matter here as we don't have any ParamNode
             value = self._interp.eval(alt_node, [])
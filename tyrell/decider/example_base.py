@@ -1,7 +1,9 @@
 from typing import Callable, NamedTuple, List, Any
 from .decider import Decider
+from .example_scheduler import ExampleScheduler
 from ..interpreter import Interpreter
 from .result import ok, bad
+from ..metrics import get_metrics
 
 Example = NamedTuple('Example', [
     ('input', List[Any]),
@@ -12,6 +14,7 @@ class ExampleDecider(Decider):
     _interpreter: Interpreter
     _examples: List[Example]
     _equal_output: Callable[[Any, Any], bool]
+    _scheduler: ExampleScheduler
 
     def __init__(self,
                  interpreter: Interpreter,
@@ -23,6 +26,7 @@ class ExampleDecider(Decider):
                 'ExampleDecider cannot take an empty list of examples')
         self._examples = examples
         self._equal_output = equal_output
+        self._scheduler = ExampleScheduler(len(examples))
 
     @property
     def interpreter(self):
@@ -36,32 +40,33 @@ class ExampleDecider(Decider):
     def equal_output(self):
         return self._equal_output
 
-    def get_failed_examples(self, prog):
+    @property
+    def scheduler(self):
+        return self._scheduler
+
+    def get_failed_examples(self, prog, fail_fast: bool = False):
         '''
-        Test the program on all examples provided.
-        Return a list of failed examples.
+        Test the program on all examples provided, the ones that rejected the most candidates first.
+        Return a list of failed examples, which only holds the first one found if `fail_fast`.
         '''
-        return list(filter(
-            lambda x: not self._equal_output(
-                self.interpreter.eval(prog, x.input), x.output),
-            self._examples
-        ))
+        indices = self._scheduler.run(
+            lambda i: self._equal_output(
+                self.interpreter.eval(prog, self._examples[i].input), self._examples[i].output),
+            fail_fast)
+        return [self._examples[i] for i in sorted(indices)]
 
     def has_failed_examples(self, prog):
         '''
         Test whether the given program would fail on any of the examples provided.
         '''
-        return any(
-            not self._equal_output(
-                self.interpreter.eval(prog, x.input), x.output)
-            for x in self._examples
-        )
+        return len(self.get_failed_examples(prog, fail_fast=True)) > 0
 
     def analyze(self, prog):
         '''
         This basic version of analyze() merely interpret the AST and see if it conforms to our examples
         '''
         if self.has_failed_examples(prog):
+            get_metrics().incr('rejected_concrete')
             return bad()
         else:
             return ok()
@@ -5,31 +5,29 @@ from typing import (
     List,
     Set,
     FrozenSet,
-    Mapping,
-    MutableMapping,
     Any,
     Callable,
     Iterator
 )
 from collections import defaultdict
-from itertools import permutations
 import z3
 from ..interpreter import Interpreter, InterpreterError
 from ..dsl import Node, AtomNode, ParamNode, ApplyNode, NodeIndexer
 from ..spec import Production, ValueType, TyrellSpec
 from ..spec.expr import *
 from ..logger import get_logger
+from ..metrics import get_metrics
 from ..visitor import GenericVisitor
 from .example_base import Example, ExampleDecider
 from .blame import Blame
 from .assert_violation_handler import AssertionViolationHandler
 from .eval_expr import eval_expr
 from .constraint_encoder import ConstraintEncoder
+from .example_solver import ExampleSolver, ExampleSolverDecider
+from .imply_map import ImplyMap, ImplyMapCache, build_imply_map, imply_key
 from .result import ok, bad
 
 logger = get_logger('tyrell.synthesizer.constraint')
-ImplyMap = Mapping[Tuple[Production, Expr], List[Production]]
-MutableImplyMap = MutableMapping[Tuple[Production, Expr], List[Production]]
 
 
 class Z3Encoder(GenericVisitor):
@@ -37,53 +35,39 @@ class Z3Encoder(GenericVisitor):
     _indexer: NodeIndexer
     _example: Example
     _unsat_map: Dict[str, Tuple[Node, int]]
-    _solver: z3.Solver
+    _solver: ExampleSolver
 
-    def __init__(self, interp: Interpreter, indexer: NodeIndexer, example: Example):
+    def __init__(self, interp: Interpreter, indexer: NodeIndexer, example: Example,
+                 solver: Optional[ExampleSolver] = None):
+        '''`solver` is the long-lived solver of `example`, and a fresh one is used if it is not given'''
         self._interp = interp
         self._indexer = indexer
         self._example = example
         self._unsat_map = dict()
         self._alignment_map = dict()
-        self._alignment_counter = 0
-        self._solver = z3.Solver()
+        self._assumptions = []
+        self._clauses = []
+        self._solver = solver if solver is not None else ExampleSolver(interp, example)
 
     def get_z3_var(self, node: Node, pname: str, ptype: ExprType):
-        node_id = self._indexer.get_id(node)
-        var_name = '{}_n{}'.format(pname, node_id)
-        if ptype is ExprType.INT:
-            return z3.Int(var_name)
-        elif ptype is ExprType.BOOL:
-            return z3.Bool(var_name)
-        else:
-            raise RuntimeError('Unrecognized ExprType: {}'.format(ptype))
+        return self._solver.get_z3_var(self._indexer.get_id(node), pname, ptype)
 
     def _get_constraint_var(self, node: Node, index: int):
         node_id = self._indexer.get_id(node)
         var_name = '@n{}_c{}'.format(node_id, index)
         return var_name
 
-    def _get_alignment_var(self, node: Node, index: int):
-        node_id = self._indexer.get_id(node)
-        # var_name = '@n{}_a{}'.format(node_id, index)
-        var_name = '@n{}_a{}'.format(node_id, self._alignment_counter)
-        self._alignment_counter += 1
-        return var_name
-
     def encode_param_alignment(self, node: Node, ty: ValueType, index: int):
         if not isinstance(ty, ValueType):
             raise RuntimeError(
                 'Unexpected program output type: {}'.format(ty))
+        node_id = self._indexer.get_id(node)
         for pname, pty in ty.properties:
-            actual = self.get_z3_var(node, pname, pty)
-            expected_expr = PropertyExpr(pname, pty, ParamExpr(index))
-            expected = eval_expr(
-                self._interp, self._example.input, self._example.output, expected_expr)
-            # self._solver.add(actual == expected)
-            qname = self._get_alignment_var(node, index)
+            literal, fact = self._solver.alignment(node_id, index, pname, pty)
+            qname = str(literal)
             self._unsat_map[qname] = (node, index)
-            self._alignment_map[qname] = (actual==expected)
-            self._solver.assert_and_track(actual==expected, qname)
+            self._alignment_map[qname] = fact
+            self._assumptions.append(literal)
 
     def encode_output_alignment(self, prog: Node):
         out_ty = cast(ValueType, prog.type)
@@ -112,15 +96,18 @@ class Z3Encoder(GenericVisitor):
             cname = self._get_constraint_var(apply_node, index)
             z3_clause = constraint_visitor.visit(constraint)
             self._unsat_map[cname] = (apply_node, index)
-            self._solver.assert_and_track(z3_clause, cname)
+            self._clauses.append((z3_clause, cname))
         for arg in apply_node.args:
             self.visit(arg)
 
     def get_blame_nodes(self):
-        if self._solver.check() != z3.unsat:
-            # Abstract semantics is satisfiable or unknown. Cannot learn anything.
-            return None
-        unsat_core = self._solver.unsat_core()
+        with self._solver.scope():
+            for z3_clause, cname in self._clauses:
+                self._solver.assert_and_track(z3_clause, cname)
+            if self._solver.check(self._assumptions) != z3.unsat:
+                # Abstract semantics is satisfiable or unknown. Cannot learn anything.
+                return None
+            unsat_core = self._solver.unsat_core()
         if len(unsat_core) == 0:
             return None
 
@@ -157,9 +144,9 @@ class BlameFinder:
                 [Blame(node=n, production=(prod if n is node else n.production))
                  for n in base_nodes]
             )
-        other_prods = set(self._imply_map.get((node.production, exprs[0]), []))
+        other_prods = set(self._imply_map.get(imply_key(node.production, exprs[0]), []))
         for expr in exprs[1:]:
-            p = self._imply_map.get((node.production, expr), [])
+            p = self._imply_map.get(imply_key(node.production, expr), [])
             other_prods = other_prods.intersection(p)
         for p in other_prods:
             yield gen_blame(p)
@@ -167,26 +154,30 @@ class BlameFinder:
     def get_blames(self) -> List[List[Blame]]:
         return [list(x) for x in self._blames_collection]
 
-    def process_examples(self, examples: List[Example]):
-        for example in examples:
-            self.process_example(example)
-
-    def process_example(self, example: Example):
-        z3_encoder = Z3Encoder(self._interp, self._indexer, example)
-        z3_encoder.encode_output_alignment(self._prog)
-        z3_encoder.visit(self._prog)
-        blame_nodes = z3_encoder.get_blame_nodes()
+    def process_examples(self, examples: List[Example], solvers: Optional[List[ExampleSolver]] = None):
+        for i, example in enumerate(examples):
+            self.process_example(example, solvers[i] if solvers is not None else None)
+
+    def process_example(self, example: Example, solver: Optional[ExampleSolver] = None):
+        metrics = get_metrics()
+        with metrics.timer('abstract'):
+            z3_encoder = Z3Encoder(
+                self._interp, self._indexer, example, solver)
+            z3_encoder.encode_output_alignment(self._prog)
+            z3_encoder.visit(self._prog)
+            blame_nodes = z3_encoder.get_blame_nodes()
         if blame_nodes is not None:
             base_nodes = list(blame_nodes.keys())
-            for node, exprs in blame_nodes.items():
-                for blame in self._expand_blame(base_nodes, node, exprs):
-                    self._blames_collection.add(blame)
+            with metrics.timer('blame'):
+                for node, exprs in blame_nodes.items():
+                    for blame in self._expand_blame(base_nodes, node, exprs):
+                        self._blames_collection.add(blame)
             self._blames_collection.add(
                 frozenset([(n, n.production) for n in base_nodes])
             )
 
 
-class ExampleConstraintDecider(ExampleDecider):
+class ExampleConstraintDecider(ExampleSolverDecider):
     _imply_map: ImplyMap
     _assert_handler: AssertionViolationHandler
 
@@ -194,55 +185,41 @@ class ExampleConstraintDecider(ExampleDecider):
                  spec: TyrellSpec,
                  interpreter: Interpreter,
                  examples: List[Example],
-                 equal_output: Callable[[Any, Any], bool]=lambda x, y: x == y):
+                 equal_output: Callable[[Any, Any], bool]=lambda x, y: x == y,
+                 imply_cache: Optional[ImplyMapCache]=None,
+                 num_workers: int=1,
+                 blame_all_failed: bool=True):
+        '''
+        The implication map between the constraints of `spec` is loaded from `imply_cache` if it is given and holds one.
+        Otherwise it is built with `num_workers` processes, and stored in `imply_cache`.
+        If `blame_all_failed`, every example that a candidate fails on is blamed, which prunes much more than blaming the first one found.
+        Otherwise the candidate is rejected by the first example it fails on.
+        '''
         super().__init__(interpreter, examples, equal_output)
-        self._imply_map = self._build_imply_map(spec)
+        self._blame_all_failed = blame_all_failed
+        self._imply_map = self._build_imply_map(spec, imply_cache, num_workers)
         self._assert_handler = AssertionViolationHandler(spec, interpreter)
 
-    def _check_implies(self, pre, post) -> bool:
-        def encode_property(prop_expr: PropertyExpr):
-            param_expr = cast(ParamExpr, prop_expr.operand)
-            var_name = '{}_p{}'.format(prop_expr.name, param_expr.index)
-            ptype = prop_expr.type
-            if ptype is ExprType.INT:
-                return z3.Int(var_name)
-            elif ptype is ExprType.BOOL:
-                return z3.Bool(var_name)
-            else:
-                raise RuntimeError('Unrecognized ExprType: {}'.format(ptype))
-        constraint_visitor = ConstraintEncoder(encode_property)
-
-        z3_solver = z3.Solver()
-        z3_pre = constraint_visitor.visit(pre)
-        z3_post = constraint_visitor.visit(post)
-        z3_solver.add(z3.Not(z3.Implies(z3_pre, z3_post)))
-        return z3_solver.check() == z3.unsat
-
-    def _build_imply_map(self, spec: TyrellSpec) -> ImplyMap:
-        ret: MutableImplyMap = defaultdict(list)
-        constrained_prods = filter(
-            lambda prod: prod.is_function() and len(prod.constraints) > 0,
-            spec.productions())
-        for prod0, prod1 in permutations(constrained_prods, r=2):
-            if len(prod0.rhs) != len(prod1.rhs):
-                continue
-            for c0 in prod0.constraints:
-                for c1 in prod1.constraints:
-                    if self._check_implies(c1, c0):
-                        ret[(prod0, c0)].append(prod1)
-                        break
-        return ret
+    def _build_imply_map(self, spec: TyrellSpec, imply_cache: Optional[ImplyMapCache]=None,
+                         num_workers: int=1) -> ImplyMap:
+        if imply_cache is not None:
+            return imply_cache.get_or_build(spec, num_workers)
+        return build_imply_map(spec, num_workers)
 
     def analyze(self, prog):
         '''
         This version of analyze() tries to analyze the reason why a synthesized program fails, if it does not pass all the tests.
         '''
-        failed_examples = self.get_failed_examples(prog)
+        failed_examples = self.get_failed_examples(
+            prog, fail_fast=not self._blame_all_failed)
         if len(failed_examples) == 0:
             return ok()
         else:
+            # The abstract semantics only explain the failure
+            get_metrics().incr('rejected_concrete')
             blame_finder = BlameFinder(self.interpreter, self._imply_map, prog)
-            blame_finder.process_examples(failed_examples)
+            blame_finder.process_examples(
+                failed_examples, [self.get_solver(x) for x in failed_examples])
             blames = blame_finder.get_blames()
             if len(blames) == 0:
                 return bad()
@@ -1,17 +1,21 @@
 from collections import defaultdict
-from typing import cast, Any, Callable, Dict, List, Tuple, Set, FrozenSet
+from contextlib import contextmanager, ExitStack
+from typing import cast, Any, Callable, Dict, List, Optional, Tuple, Set, FrozenSet
 import z3
 
 from .assert_violation_handler import AssertionViolationHandler
 from .blame import Blame
 from .constraint_encoder import ConstraintEncoder
 from .example_base import Example, ExampleDecider
+from .example_scheduler import ExampleScheduler
+from .example_solver import ExampleSolver, ExampleSolverDecider
 from .eval_expr import eval_expr
 from .result import ok, bad
 from ..spec import TyrellSpec, ValueType
 from ..dsl import Node, AtomNode, ParamNode, ApplyNode, NodeIndexer, dfs
 from ..interpreter import Interpreter, InterpreterError
 from ..logger import get_logger
+from ..metrics import get_metrics
 from ..spec.expr import *
 from ..visitor import GenericVisitor
 
@@ -23,24 +27,26 @@ class Z3Encoder(GenericVisitor):
     _indexer: NodeIndexer
     _example: Example
     _unsat_map: Dict[str, Tuple[Node, int]]
-    _solver: z3.Solver
+    _solver: ExampleSolver
 
-    def __init__(self, interp: Interpreter, indexer: NodeIndexer, example: Example):
+    def __init__(self, interp: Interpreter, indexer: NodeIndexer, example: Example,
+                 solver: Optional[ExampleSolver] = None):
+        '''`solver` is the long-lived solver of `example`, and a fresh one is used if it is not given'''
         self._interp = interp
         self._indexer = indexer
         self._example = example
         self._unsat_map = dict()
-        self._solver = z3.Solver()
+        self._assumptions = []
+        self._clauses = []
+        self._solver = solver if solver is not None else ExampleSolver(
+            interp, example, unknown=-1)
+
+    @property
+    def solver(self):
+        return self._solver
 
     def get_z3_var(self, node: Node, pname: str, ptype: ExprType):
-        node_id = self._indexer.get_id(node)
-        var_name = '{}_n{}'.format(pname, node_id)
-        if ptype is ExprType.INT:
-            return z3.Int(var_name)
-        elif ptype is ExprType.BOOL:
-            return z3.Bool(var_name)
-        else:
-            raise RuntimeError('Unrecognized ExprType: {}'.format(ptype))
+        return self._solver.get_z3_var(self._indexer.get_id(node), pname, ptype)
 
     def _get_constraint_var(self, node: Node, index: int):
         node_id = self._indexer.get_id(node)
@@ -51,14 +57,10 @@ class Z3Encoder(GenericVisitor):
         if not isinstance(ty, ValueType):
             raise RuntimeError(
                 'Unexpected program output type: {}'.format(ty))
+        node_id = self._indexer.get_id(node)
         for pname, pty in ty.properties:
-            actual = self.get_z3_var(node, pname, pty)
-            expected_expr = PropertyExpr(pname, pty, ParamExpr(index))
-            expected = eval_expr(
-                self._interp, self._example.input, self._example.output, expected_expr)
-            if expected == -1:
-                expected = self.get_z3_var(node, pname + '_sym', pty)
-            self._solver.add(actual == expected)
+            literal, _ = self._solver.alignment(node_id, index, pname, pty)
+            self._assumptions.append(literal)
 
     def encode_output_alignment(self, prog: Node):
         out_ty = cast(ValueType, prog.type)
@@ -87,18 +89,31 @@ class Z3Encoder(GenericVisitor):
             cname = self._get_constraint_var(apply_node, index)
             z3_clause = constraint_visitor.visit(constraint)
             self._unsat_map[cname] = (apply_node, index)
-            self._solver.assert_and_track(z3_clause, cname)
+            self._clauses.append((z3_clause, cname))
         for arg in apply_node.args:
             self.visit(arg)
 
+    @contextmanager
+    def scope(self):
+        '''
+        A scope in which the constraints of the program are asserted. The alignments and the whole program must have been encoded before,
+        and `add()` and `is_unsat()` may only be called inside of it.
+        '''
+        with self._solver.scope():
+            for z3_clause, cname in self._clauses:
+                self._solver.assert_and_track(z3_clause, cname)
+            yield self
+
     def add(self, z3_expr: z3.ExprRef):
         self._solver.add(z3_expr)
 
     def is_unsat(self) -> bool:
-        return self._solver.check() == z3.unsat
+        return self._solver.check(self._assumptions) == z3.unsat
 
     def get_blame_nodes(self):
-        unsat_core = self._solver.unsat_core()
+        # The alignments are hard facts of the example, only the constraints are to blame
+        unsat_core = [x for x in self._solver.unsat_core()
+                      if str(x) in self._unsat_map]
         if len(unsat_core) == 0:
             return None
 
@@ -170,7 +185,8 @@ class ConstraintInterpreter(GenericVisitor):
         if method is None:
             raise NotImplementedError(
                 'Cannot find the required eval method: {}'.format(method_name))
-        method_output = method(apply_node, in_values)
+        method_output = self._interp.apply_eval(
+            method, apply_node, in_values, self._inputs)
 
         # Now that we get more info on the method output, we can use it to refine the constraints
         def encode_property(prop_expr):
@@ -185,12 +201,12 @@ class ConstraintInterpreter(GenericVisitor):
             pty = prop_expr.type
             z3_var = self._z3_encoder.get_z3_var(node, pname, pty)
 
-            method_name = self._apply_method_name(prop_expr.name)
-            method = getattr(self._interp, method_name, None)
-            if method is None:
-                raise ValueError(
-                    'Cannot find the required apply method: {}'.format(method_name))
-            property_value = method(value)
+            solver = self._z3_encoder.solver
+            if node.is_param():
+                # The same input of the same example every time
+                property_value = solver.expected(node.index + 1, pname)
+            else:
+                property_value = solver.properties.apply(pname, value)
             self._z3_encoder.add(z3_var == property_value)
         property_finder = PropertyFinder(encode_property)
         for constraint in apply_node.production.constraints:
@@ -208,10 +224,6 @@ class ConstraintInterpreter(GenericVisitor):
     def _eval_method_name(name):
         return 'eval_' + name
 
-    @staticmethod
-    def _apply_method_name(name):
-        return 'apply_' + name
-
 
 class BlameFinder:
     _interp: Interpreter
@@ -224,6 +236,8 @@ class BlameFinder:
         self._prog = prog
         self._indexer = NodeIndexer(prog)
         self._blames_collection = set()
+        # whether an example is ruled out by the abstract semantics before it is interpreted
+        self._rejected_abstract = False
 
     def _get_raw_blames(self) -> List[List[Blame]]:
         return [list(x) for x in self._blames_collection]
@@ -231,18 +245,31 @@ class BlameFinder:
     def _get_blames(self) -> List[List[Blame]]:
         return [list(x) for x in self._blames_collection]
 
-    def process_examples(self, examples: List[Example], equal_output: Callable[[Any, Any], bool]):
+    def process_examples(self, examples: List[Example], equal_output: Callable[[Any, Any], bool],
+                         solvers: Optional[List[ExampleSolver]] = None,
+                         scheduler: Optional[ExampleScheduler] = None, fail_fast: bool = False):
+        '''
+        Check the program on `examples`, in the order of `scheduler` if it is given.
+        If `fail_fast`, only the first example that the program fails on is blamed.
+        '''
+        if scheduler is None:
+            scheduler = ExampleScheduler(len(examples))
         try:
-            all_ok = all([self.process_example(example, equal_output) for example in examples])
-            if all_ok:
+            failed = scheduler.run(
+                lambda i: self.process_example(examples[i], equal_output, solvers[i] if solvers is not None else None),
+                fail_fast)
+            if len(failed) == 0:
                 return ok()
             else:
+                get_metrics().incr(
+                    'rejected_abstract' if self._rejected_abstract else 'rejected_concrete')
                 blames = self._get_blames()
                 if len(blames) == 0:
                     return bad()
                 else:
                     return bad(why=blames)
         except PruningException as e:
+            get_metrics().incr('rejected_abstract')
             node = e.node
             # Blame should include all children of node
             blame_nodes = {child for child in dfs(node)}
@@ -254,36 +281,52 @@ class BlameFinder:
                     blame_nodes.add(node)
             return bad([[Blame(node, node.production) for node in blame_nodes]])
 
-    def process_example(self, example: Example, equal_output: Callable[[Any, Any], bool]):
-        z3_encoder = Z3Encoder(self._interp, self._indexer, example)
-        z3_encoder.encode_output_alignment(self._prog)
-        z3_encoder.visit(self._prog)
-
-        if z3_encoder.is_unsat():
-            # If abstract semantics cannot be satisfiable, perform blame analysis
-            blame_nodes = z3_encoder.get_blame_nodes()
-            if blame_nodes is not None:
-                base_nodes = list(blame_nodes.keys())
-                self._blames_collection.add(
-                    frozenset([(n, n.production) for n in base_nodes])
-                )
-            return False
-        else:
-            # If abstract semantics is satisfiable, start interpretation
-            constraint_interpreter = ConstraintInterpreter(self._interp, example.input, z3_encoder)
-            interpreter_output = constraint_interpreter.visit(self._prog)
-            return equal_output(interpreter_output, example.output)
-
-
-class ExampleConstraintPruningDecider(ExampleDecider):
+    def process_example(self, example: Example, equal_output: Callable[[Any, Any], bool],
+                        solver: Optional[ExampleSolver] = None):
+        metrics = get_metrics()
+        with ExitStack() as stack:
+            with metrics.timer('abstract'):
+                z3_encoder = Z3Encoder(
+                    self._interp, self._indexer, example, solver)
+                z3_encoder.encode_output_alignment(self._prog)
+                z3_encoder.visit(self._prog)
+                # The constraints of the program hold until the example is done
+                stack.enter_context(z3_encoder.scope())
+                is_unsat = z3_encoder.is_unsat()
+
+            if is_unsat:
+                # If abstract semantics cannot be satisfiable, perform blame analysis
+                self._rejected_abstract = True
+                with metrics.timer('blame'):
+                    blame_nodes = z3_encoder.get_blame_nodes()
+                if blame_nodes is not None:
+                    base_nodes = list(blame_nodes.keys())
+                    self._blames_collection.add(
+                        frozenset([(n, n.production) for n in base_nodes])
+                    )
+                return False
+            else:
+                # If abstract semantics is satisfiable, start interpretation
+                constraint_interpreter = ConstraintInterpreter(self._interp, example.input, z3_encoder)
+                # The abstract semantics are refined along the way, and their checks count as interpretation
+                with metrics.timer('interpret'):
+                    interpreter_output = constraint_interpreter.visit(self._prog)
+                return equal_output(interpreter_output, example.output)
+
+
+class ExampleConstraintPruningDecider(ExampleSolverDecider):
     assert_handler: AssertionViolationHandler
 
     def __init__(self,
                  spec: TyrellSpec,
                  interpreter: Interpreter,
                  examples: List[Example],
-                 equal_output: Callable[[Any, Any], bool]=lambda x, y: x == y):
-        super().__init__(interpreter, examples, equal_output)
+                 equal_output: Callable[[Any, Any], bool]=lambda x, y: x == y,
+                 blame_all_failed: bool=False):
+        '''A candidate is rejected by the first example it fails on, and only that example is blamed, unless `blame_all_failed`.'''
+        # The interpreter reports a property that it cannot compute as -1
+        super().__init__(interpreter, examples, equal_output, unknown=-1)
+        self._blame_all_failed = blame_all_failed
         self._assert_handler = AssertionViolationHandler(spec, interpreter)
 
     def analyze_interpreter_error(self, error: InterpreterError):
@@ -291,4 +334,6 @@ class ExampleConstraintPruningDecider(ExampleDecider):
 
     def analyze(self, prog):
         blame_finder = BlameFinder(self.interpreter, prog)
-        return blame_finder.process_examples(self.examples, self.equal_output)
+        return blame_finder.process_examples(
+            self.examples, self.equal_output, [self.get_solver(x) for x in self.examples],
+            self.scheduler, fail_fast=not self._blame_all_failed)
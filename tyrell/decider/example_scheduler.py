@@ -0,0 +1,64 @@
+from typing import Callable, List
+from ..metrics import get_metrics
+
+
+class ExampleScheduler:
+    '''
+    The order in which a decider checks its examples: the ones that rejected the most candidates come first, and ties keep the order of the examples.
+    A bad candidate is then usually rejected by the first example it is checked on.
+    '''
+
+    _num_rejections: List[int]
+    _order: List[int]
+
+    def __init__(self, num_examples: int):
+        if num_examples <= 0:
+            raise ValueError(
+                'Number of examples must be positive: {}'.format(num_examples))
+        self._num_rejections = [0] * num_examples
+        self._order = list(range(num_examples))
+        # Checks of an example, and checks skipped since an earlier example already failed
+        self.num_evals = 0
+        self.num_saved = 0
+
+    @property
+    def order(self) -> List[int]:
+        '''The indices of the examples, in the order in which they are checked'''
+        return list(self._order)
+
+    def num_rejections(self, index: int) -> int:
+        return self._num_rejections[index]
+
+    def record(self, index: int, failed: bool) -> None:
+        '''Record whether the `index`-th example rejected a candidate'''
+        if failed:
+            self._num_rejections[index] += 1
+            self._order.sort(key=lambda x: (-self._num_rejections[x], x))
+
+    def run(self, check: Callable[[int], bool], fail_fast: bool = True) -> List[int]:
+        '''
+        Call `check` on the index of every example in order, and return the indices of the examples that it fails on.
+        If `fail_fast`, stop at the first one. An error raised by `check` counts as a failure of its example, and is raised again.
+        '''
+        metrics = get_metrics()
+        failed = []
+        order = self.order
+        num_evals = 0
+        try:
+            for index in order:
+                num_evals += 1
+                ok = False
+                try:
+                    ok = check(index)
+                finally:
+                    self.record(index, not ok)
+                if not ok:
+                    failed.append(index)
+                    if fail_fast:
+                        break
+        finally:
+            self.num_evals += num_evals
+            self.num_saved += len(order) - num_evals
+            metrics.incr('example_evals', num_evals)
+            metrics.incr('example_evals_saved', len(order) - num_evals)
+        return failed
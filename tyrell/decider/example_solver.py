@@ -0,0 +1,158 @@
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import z3
+from ..interpreter import Interpreter
+from ..spec.expr import ExprType
+from .example_base import Example, ExampleDecider
+from .property_cache import PropertyCache
+
+
+class ExampleSolver:
+    '''
+    A long-lived z3 solver for the abstract semantics of the candidates on one example.
+    The variable of a property of the k-th node of a candidate is the same z3 constant for every candidate.
+    Each alignment fact, i.e. that the k-th node has the properties of the output or of an input of the example, is asserted once,
+    guarded by an assumption literal, so that a candidate only enables the facts of its own nodes and `unsat_core()` still reports them.
+    The constraints of a candidate are asserted inside of `scope()` and dropped afterwards.
+    If `unknown` is given, a property of the example with that value is left unconstrained.
+    The properties of the example are taken from `properties` as the `index`-th example, so that they can be shared by all the solvers of a decider.
+    '''
+
+    _interp: Interpreter
+    _example: Example
+    _solver: z3.Solver
+    _vars: Dict[Tuple[str, int], z3.ExprRef]
+    _properties: PropertyCache
+    _alignment: Dict[Tuple[int, int, str], Tuple[z3.BoolRef, z3.BoolRef]]
+
+    def __init__(self, interp: Interpreter, example: Example, unknown: Any = None,
+                 properties: Optional[PropertyCache] = None, index: int = 0):
+        self._interp = interp
+        self._example = example
+        self._unknown = unknown
+        self._properties = properties if properties is not None else PropertyCache(
+            interp)
+        self._index = index
+        self._solver = z3.Solver()
+        self._vars = dict()
+        self._alignment = dict()
+        self._depth = 0
+
+    @property
+    def example(self):
+        return self._example
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def properties(self):
+        return self._properties
+
+    def get_z3_var(self, node_id: int, pname: str, ptype: ExprType):
+        '''The z3 constant of property `pname` of the node with id `node_id`'''
+        key = (pname, node_id)
+        var = self._vars.get(key)
+        if var is None:
+            var_name = '{}_n{}'.format(pname, node_id)
+            if ptype is ExprType.INT:
+                var = z3.Int(var_name)
+            elif ptype is ExprType.BOOL:
+                var = z3.Bool(var_name)
+            else:
+                raise RuntimeError('Unrecognized ExprType: {}'.format(ptype))
+            self._vars[key] = var
+        return var
+
+    def expected(self, index: int, pname: str) -> Any:
+        '''Property `pname` of the output (`index` 0) or of the input `index - 1` of the example'''
+        value = self._example.output if index == 0 else self._example.input[index - 1]
+        return self._properties.example_property(self._index, index, pname, value)
+
+    def alignment(self, node_id: int, index: int, pname: str, ptype: ExprType) -> Tuple[z3.BoolRef, z3.BoolRef]:
+        '''
+        The assumption literal that aligns property `pname` of node `node_id` with that of the output (`index` 0) or the input `index - 1`,
+        and the fact that it enables.
+        '''
+        key = (node_id, index, pname)
+        ret = self._alignment.get(key)
+        if ret is None:
+            actual = self.get_z3_var(node_id, pname, ptype)
+            expected = self.expected(index, pname)
+            if self._unknown is not None and expected == self._unknown:
+                expected = self.get_z3_var(node_id, pname + '_sym', ptype)
+            fact = actual == expected
+            literal = z3.Bool('@n{}_a{}_{}'.format(node_id, index, pname))
+            # Asserted at the base level, so that it outlives the scope of the candidate
+            if self._depth > 0:
+                raise RuntimeError(
+                    'Alignment facts cannot be created inside of a scope')
+            self._solver.add(z3.Implies(literal, fact))
+            ret = (literal, fact)
+            self._alignment[key] = ret
+        return ret
+
+    @contextmanager
+    def scope(self):
+        '''A scope for the constraints of one candidate'''
+        self._solver.push()
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            self._solver.pop()
+
+    def add(self, z3_expr: z3.ExprRef) -> None:
+        self._solver.add(z3_expr)
+
+    def assert_and_track(self, z3_expr: z3.ExprRef, name: str) -> None:
+        self._solver.assert_and_track(z3_expr, name)
+
+    def check(self, assumptions: List[z3.BoolRef]):
+        return self._solver.check(*assumptions)
+
+    def unsat_core(self):
+        return self._solver.unsat_core()
+
+
+class ExampleSolverDecider(ExampleDecider):
+    '''
+    An `ExampleDecider` that checks the abstract semantics of the candidates on a long-lived `ExampleSolver` per example.
+    The properties of the examples and of the values seen while checking candidates are shared by all the solvers.
+    If `unknown` is given, it is the value of a property that the interpreter cannot compute.
+    '''
+
+    _properties: PropertyCache
+    _solvers: Dict[int, ExampleSolver]
+
+    def __init__(self,
+                 interpreter: Interpreter,
+                 examples: List[Example],
+                 equal_output: Callable[[Any, Any], bool] = lambda x, y: x == y,
+                 unknown: Any = None):
+        super().__init__(interpreter, examples, equal_output)
+        self._unknown = unknown
+        self._properties = PropertyCache(interpreter)
+        # By the id of the example
+        self._solvers = dict()
+
+    @property
+    def properties(self) -> PropertyCache:
+        return self._properties
+
+    def get_solver(self, example: Example) -> ExampleSolver:
+        '''The long-lived solver of `example`, which must be one of the examples of the decider'''
+        solver = self._solvers.get(id(example))
+        if solver is None:
+            solver = ExampleSolver(self.interpreter, example, unknown=self._unknown,
+                                   properties=self._properties, index=self._example_index(example))
+            self._solvers[id(example)] = solver
+        return solver
+
+    def _example_index(self, example: Example) -> int:
+        for i, x in enumerate(self.examples):
+            if x is example:
+                return i
+        raise ValueError('Not an example of the decider: {}'.format(example))
@@ -0,0 +1,170 @@
+import os
+import json
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import permutations
+from typing import cast, List, Mapping, MutableMapping, Optional, Tuple
+import z3
+from ..spec import Production, TyrellSpec
+from ..spec.expr import Expr, ExprType, ParamExpr, PropertyExpr
+from ..logger import get_logger
+from ..storage import write_json
+from .constraint_encoder import ConstraintEncoder
+
+logger = get_logger('tyrell.decider.imply_map')
+
+# Bump whenever the meaning of the cached entries changes
+_FORMAT_VERSION = 1
+
+# Constraints are identified by their structure rather than by object identity
+ImplyKey = Tuple[int, str]
+# (production, constraint) -> productions with a constraint that implies it, i.e. the productions that would fail the same way
+ImplyMap = Mapping[ImplyKey, List[Production]]
+MutableImplyMap = MutableMapping[ImplyKey, List[Production]]
+
+
+def imply_key(prod: Production, constraint) -> ImplyKey:
+    '''The key of `constraint` of `prod` in an `ImplyMap`'''
+    return prod.id, repr(constraint)
+
+
+def check_implies(pre: Expr, post: Expr) -> bool:
+    '''Whether `pre` implies `post` for every value of the properties'''
+    def encode_property(prop_expr: PropertyExpr):
+        param_expr = cast(ParamExpr, prop_expr.operand)
+        var_name = '{}_p{}'.format(prop_expr.name, param_expr.index)
+        ptype = prop_expr.type
+        if ptype is ExprType.INT:
+            return z3.Int(var_name)
+        elif ptype is ExprType.BOOL:
+            return z3.Bool(var_name)
+        else:
+            raise RuntimeError('Unrecognized ExprType: {}'.format(ptype))
+    constraint_visitor = ConstraintEncoder(encode_property)
+
+    z3_solver = z3.Solver()
+    z3_pre = constraint_visitor.visit(pre)
+    z3_post = constraint_visitor.visit(post)
+    z3_solver.add(z3.Not(z3.Implies(z3_pre, z3_post)))
+    return z3_solver.check() == z3.unsat
+
+
+def _implied_constraints(task: Tuple[List[Expr], List[Expr]]) -> List[int]:
+    '''Indices of the constraints in `posts` that are implied by one of `pres`'''
+    posts, pres = task
+    return [i for i, post in enumerate(posts)
+            if any(check_implies(pre, post) for pre in pres)]
+
+
+def _constrained_productions(spec: TyrellSpec) -> List[Production]:
+    g = spec.grammar
+    return [g.productions[p] for p in range(0, g.num_productions())
+            if g.is_function[p] and len(g.productions[p].constraints) > 0]
+
+
+def imply_map_key(spec: TyrellSpec) -> str:
+    '''A digest of the constrained productions of `spec`, which is all that the implication map depends on'''
+    lines = [str(_FORMAT_VERSION)]
+    for prod in _constrained_productions(spec):
+        lines.append('{} {}'.format(prod.id, len(prod.rhs)))
+        lines.extend(repr(x) for x in prod.constraints)
+    return hashlib.sha256('\n'.join(lines).encode('utf-8')).hexdigest()
+
+
+def build_imply_map(spec: TyrellSpec, num_workers: int = 1) -> ImplyMap:
+    '''
+    Find, for every constraint of every production, the other productions of the same arity with a constraint that implies it.
+    The solver checks are spread over `num_workers` spawned processes if it is more than 1.
+    '''
+    if num_workers <= 0:
+        raise ValueError(
+            'Number of workers must be positive: {}'.format(num_workers))
+    pairs = [(prod0, prod1) for prod0, prod1 in permutations(_constrained_productions(spec), r=2)
+             if len(prod0.rhs) == len(prod1.rhs)]
+    tasks = [(prod0.constraints, prod1.constraints) for prod0, prod1 in pairs]
+    if num_workers == 1 or len(tasks) <= 1:
+        results = [_implied_constraints(x) for x in tasks]
+    else:
+        # z3 is not thread-safe, and forked children would share its state
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(num_workers, mp_context=context) as executor:
+            chunksize = max(1, len(tasks) // (4 * num_workers))
+            results = list(executor.map(
+                _implied_constraints, tasks, chunksize=chunksize))
+    ret: MutableImplyMap = dict()
+    for (prod0, prod1), indices in zip(pairs, results):
+        for i in indices:
+            prods = ret.setdefault(imply_key(prod0, prod0.constraints[i]), [])
+            # Structurally equal constraints share their entry
+            if prod1 not in prods:
+                prods.append(prod1)
+    return ret
+
+
+class ImplyMapCache:
+    '''
+    An on-disk store of implication maps, keyed by the constraints of the spec, so that deciders for the same spec are built without any solver check.
+    Each map is stored in its own JSON file, and the `max_entries` least recently used ones are kept.
+    '''
+
+    _directory: str
+    _max_entries: int
+
+    def __init__(self, directory: str, max_entries: int = 64):
+        if max_entries <= 0:
+            raise ValueError(
+                'Maximum number of entries must be positive: {}'.format(max_entries))
+        self._directory = directory
+        self._max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, key + '.json')
+
+    def load(self, spec: TyrellSpec) -> Optional[ImplyMap]:
+        '''Return the map stored for `spec`, or `None` if there is none'''
+        path = self._path(imply_map_key(spec))
+        try:
+            with open(path, 'r') as f:
+                entries = json.load(f)
+            ret: MutableImplyMap = dict()
+            for prod_id, constraint, prod_ids in entries:
+                ret[(prod_id, constraint)] = [spec.get_production_or_raise(x) for x in prod_ids]
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError, KeyError) as e:
+            logger.warning('Ignoring a malformed implication map in {}: {}'.format(path, e))
+            return None
+        os.utime(path)
+        logger.debug('Loaded the implication map from {}'.format(path))
+        return ret
+
+    def save(self, spec: TyrellSpec, imply_map: ImplyMap) -> None:
+        path = self._path(imply_map_key(spec))
+        entries = [[prod_id, constraint, [x.id for x in prods]]
+                   for (prod_id, constraint), prods in sorted(imply_map.items())]
+        write_json(path, entries)
+        self._evict()
+
+    def get_or_build(self, spec: TyrellSpec, num_workers: int = 1) -> ImplyMap:
+        '''The map stored for `spec`, which is built and stored if there is none'''
+        ret = self.load(spec)
+        if ret is None:
+            ret = build_imply_map(spec, num_workers)
+            self.save(spec, ret)
+        return ret
+
+    def _evict(self) -> None:
+        '''Remove the least recently used maps until at most `max_entries` are left'''
+        paths = [os.path.join(self._directory, x) for x in os.listdir(self._directory)
+                 if x.endswith('.json')]
+        if len(paths) <= self._max_entries:
+            return
+        paths.sort(key=os.path.getmtime)
+        for path in paths[:len(paths) - self._max_entries]:
+            logger.debug('Evicting the implication map in {}'.format(path))
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,74 @@
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+from ..interpreter import Interpreter
+
+
+class PropertyCache:
+    '''
+    The values of the properties computed by the `apply_*` methods of an interpreter, which may be expensive, e.g. round trips to R.
+    The properties of the inputs and the output of the examples are kept for the life of the cache, by (example index, param index, property name).
+    The properties of other values are kept by value, for the `max_values` most recently used values that are hashable.
+    The `apply_*` methods are assumed to be deterministic, and two values that are equal and of the same type are assumed to have the same properties.
+    '''
+
+    _interp: Interpreter
+    _max_values: int
+    _examples: Dict[Tuple[int, int, str], Any]
+    _values: OrderedDict
+
+    def __init__(self, interp: Interpreter, max_values: int = 4096):
+        if max_values < 0:
+            raise ValueError(
+                'Maximum number of values cannot be negative: {}'.format(max_values))
+        self._interp = interp
+        self._max_values = max_values
+        self._examples = dict()
+        self._values = OrderedDict()
+        self.num_hits = 0
+        self.num_misses = 0
+
+    def example_property(self, example_index: int, index: int, pname: str, value: Any) -> Any:
+        '''
+        Property `pname` of the output (`index` 0) or of the input `index - 1` of the `example_index`-th example,
+        whose `value` is only used if the property is not known yet.
+        '''
+        key = (example_index, index, pname)
+        if key in self._examples:
+            self.num_hits += 1
+            return self._examples[key]
+        self.num_misses += 1
+        ret = self._apply(pname, value)
+        self._examples[key] = ret
+        return ret
+
+    def apply(self, pname: str, value: Any) -> Any:
+        '''Property `pname` of `value`'''
+        key = (pname, type(value), value)
+        try:
+            ret = self._values.get(key, self)
+        except TypeError:
+            # Unhashable, so it cannot be cached
+            return self._apply(pname, value)
+        if ret is not self:
+            self.num_hits += 1
+            self._values.move_to_end(key)
+            return ret
+        self.num_misses += 1
+        ret = self._apply(pname, value)
+        if self._max_values > 0:
+            self._values[key] = ret
+            if len(self._values) > self._max_values:
+                self._values.popitem(last=False)
+        return ret
+
+    def _apply(self, pname: str, value: Any) -> Any:
+        method_name = 'apply_' + pname
+        method = getattr(self._interp, method_name, None)
+        if method is None:
+            raise ValueError(
+                'Cannot find the required apply method: {}'.format(method_name))
+        return method(value)
+
+    def clear(self) -> None:
+        self._examples.clear()
+        self._values.clear()
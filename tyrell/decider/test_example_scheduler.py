@@ -0,0 +1,96 @@
+import unittest
+from ..metrics import Metrics, set_metrics
+from .example_base import Example, ExampleDecider
+from .example_constraint import ExampleConstraintDecider
+from .example_constraint_pruning import ExampleConstraintPruningDecider
+from .example_scheduler import ExampleScheduler
+from . import test_example, test_example_constraint
+
+
+class TestExampleScheduler(unittest.TestCase):
+
+    def test_order(self):
+        scheduler = ExampleScheduler(3)
+        self.assertEqual(scheduler.order, [0, 1, 2])
+        scheduler.record(2, True)
+        scheduler.record(1, True)
+        scheduler.record(0, False)
+        # Ties keep the order of the examples
+        self.assertEqual(scheduler.order, [1, 2, 0])
+        scheduler.record(2, True)
+        self.assertEqual(scheduler.order, [2, 1, 0])
+        self.assertEqual(scheduler.num_rejections(2), 2)
+
+        with self.assertRaises(ValueError):
+            ExampleScheduler(0)
+
+    def test_run(self):
+        scheduler = ExampleScheduler(3)
+        checked = []
+
+        def check(index):
+            checked.append(index)
+            return index == 0
+
+        metrics = Metrics()
+        previous_metrics = set_metrics(metrics)
+        try:
+            self.assertEqual(scheduler.run(check), [1])
+            # The example that failed is now checked first
+            self.assertEqual(scheduler.run(check, fail_fast=False), [1, 2])
+        finally:
+            set_metrics(previous_metrics)
+        self.assertEqual(checked, [0, 1, 1, 0, 2])
+        self.assertEqual((scheduler.num_evals, scheduler.num_saved), (5, 1))
+        self.assertEqual(metrics.counter('example_evals'), 5)
+        self.assertEqual(metrics.counter('example_evals_saved'), 1)
+
+    def test_error(self):
+        scheduler = ExampleScheduler(2)
+
+        def check(index):
+            if index == 1:
+                raise RuntimeError('error')
+            return True
+
+        with self.assertRaises(RuntimeError):
+            scheduler.run(check)
+        # An error rejects the candidate
+        self.assertEqual(scheduler.order, [1, 0])
+        self.assertEqual((scheduler.num_evals, scheduler.num_saved), (2, 0))
+
+    def test_example_decider(self):
+        examples = [
+            Example(input=[2, 2], output=4),
+            Example(input=[2, 3], output=5),
+        ]
+        decider = ExampleDecider(
+            interpreter=test_example.FooInterpreter(), examples=examples)
+        mult_prog = test_example.builder.from_sexp_string('(mult (@param 0) (@param 1))')
+        self.assertTrue(decider.has_failed_examples(mult_prog))
+        self.assertEqual(decider.scheduler.num_saved, 0)
+        self.assertTrue(decider.has_failed_examples(mult_prog))
+        self.assertEqual(decider.scheduler.num_saved, 1)
+        self.assertListEqual(decider.get_failed_examples(mult_prog), [examples[1]])
+        self.assertEqual(decider.scheduler.num_rejections(1), 3)
+
+    def test_constraint_deciders(self):
+        builder = test_example_constraint.builder
+        prog = builder.from_sexp_string('(mult (@param 0) (@param 1))')
+        for decider_class in [ExampleConstraintDecider, ExampleConstraintPruningDecider]:
+            for blame_all_failed in [False, True]:
+                examples = [
+                    Example(input=[1, 1], output=2),
+                    Example(input=[2, 2], output=5),
+                ]
+                decider = decider_class(
+                    spec=test_example_constraint.spec, interpreter=test_example_constraint.FooInterpreter(),
+                    examples=examples, blame_all_failed=blame_all_failed)
+                res = decider.analyze(prog)
+                self.assertTrue(res.is_bad())
+                self.assertEqual(decider.scheduler.num_evals, 2 if blame_all_failed else 1)
+                self.assertEqual(decider.scheduler.num_rejections(0), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import z3
+from ..spec.expr import ExprType
+from .example_base import Example
+from .example_constraint import ExampleConstraintDecider
+from .example_solver import ExampleSolver
+from .test_example_constraint import FooInterpreter, builder, spec
+
+
+class TestExampleSolver(unittest.TestCase):
+
+    def test_alignment(self):
+        solver = ExampleSolver(FooInterpreter(), Example(input=[1, -1], output=-2))
+        literal, fact = solver.alignment(0, 0, 'neg', ExprType.BOOL)
+        self.assertIs(solver.alignment(0, 0, 'neg', ExprType.BOOL)[0], literal)
+        self.assertIs(solver.get_z3_var(0, 'neg', ExprType.BOOL),
+                      solver.get_z3_var(0, 'neg', ExprType.BOOL))
+        neg = solver.get_z3_var(0, 'neg', ExprType.BOOL)
+        with solver.scope():
+            solver.assert_and_track(z3.Not(neg), 'c0')
+            self.assertEqual(solver.check([literal]), z3.unsat)
+            self.assertEqual(sorted(str(x) for x in solver.unsat_core()),
+                             sorted(['c0', str(literal)]))
+            # The fact only holds when it is assumed
+            self.assertEqual(solver.check([]), z3.sat)
+            with self.assertRaises(RuntimeError):
+                solver.alignment(1, 0, 'neg', ExprType.BOOL)
+        # The constraints of the candidate are gone
+        self.assertEqual(solver.check([literal]), z3.sat)
+
+    def test_unknown(self):
+        example = Example(input=[1, -1], output=-1)
+        solver = ExampleSolver(FooInterpreter(), example, unknown=True)
+        literal, _ = solver.alignment(0, 0, 'neg', ExprType.BOOL)
+        neg = solver.get_z3_var(0, 'neg', ExprType.BOOL)
+        with solver.scope():
+            solver.add(z3.Not(neg))
+            self.assertEqual(solver.check([literal]), z3.sat)
+
+    def test_decider(self):
+        examples = [Example(input=[1, -1], output=2), Example(input=[-1, 1], output=2)]
+        decider = ExampleConstraintDecider(
+            spec=spec, interpreter=FooInterpreter(), examples=examples)
+        prog = builder.from_sexp_string('(mult (@param 0) (@param 1))')
+        first = decider.analyze(prog)
+        self.assertIs(decider.get_solver(examples[0]), decider.get_solver(examples[0]))
+        # Checking another candidate in between leaves no trace
+        decider.analyze(builder.from_sexp_string('(div (@param 1) (@param 0))'))
+        second = decider.analyze(prog)
+        self.assertTrue(first.is_bad())
+        self.assertCountEqual([sorted(str(x[0]) for x in blame) for blame in first.why()],
+                              [sorted(str(x[0]) for x in blame) for blame in second.why()])
+
+
+if __name__ == '__main__':
+    unittest.main()
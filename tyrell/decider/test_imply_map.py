@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+from ..spec import parse
+from .example_base import Example
+from .example_constraint import ExampleConstraintDecider
+from .imply_map import ImplyMapCache, build_imply_map, imply_key, imply_map_key
+from .test_example_constraint import FooInterpreter, spec, spec_str
+
+
+def as_ids(imply_map):
+    return {k: sorted(x.id for x in v) for k, v in imply_map.items()}
+
+
+class TestImplyMap(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.directory = self._dir.name
+        self.mult = spec.get_function_production_or_raise('mult')
+        self.div = spec.get_function_production_or_raise('div')
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_build(self):
+        imply_map = build_imply_map(spec)
+        self.assertEqual(as_ids(imply_map), {
+            imply_key(self.mult, self.mult.constraints[0]): [self.div.id],
+            imply_key(self.div, self.div.constraints[0]): [self.mult.id],
+        })
+        # Constraints are matched by structure, not by identity
+        other = parse(spec_str).get_function_production_or_raise('mult')
+        self.assertIn(imply_key(other, other.constraints[0]), imply_map)
+        self.assertEqual(as_ids(build_imply_map(spec, num_workers=2)),
+                         as_ids(imply_map))
+        with self.assertRaises(ValueError):
+            build_imply_map(spec, num_workers=0)
+
+    def test_key(self):
+        key = imply_map_key(spec)
+        self.assertEqual(key, imply_map_key(parse(spec_str)))
+        self.assertNotEqual(key, imply_map_key(parse(spec_str.replace(
+            'pos(b) && neg(a)', 'pos(b) && pos(a)'))))
+
+    def test_cache(self):
+        cache = ImplyMapCache(self.directory)
+        self.assertIsNone(cache.load(spec))
+        imply_map = cache.get_or_build(spec)
+        # A fresh spec finds the map on disk, with its own productions
+        other = parse(spec_str)
+        loaded = ImplyMapCache(self.directory).load(other)
+        self.assertEqual(as_ids(loaded), as_ids(imply_map))
+        for prods in loaded.values():
+            for prod in prods:
+                self.assertIs(prod, other.get_production_or_raise(prod.id))
+        decider = ExampleConstraintDecider(
+            spec=other, interpreter=FooInterpreter(),
+            examples=[Example(input=[1, -1], output=-2)], imply_cache=cache)
+        self.assertEqual(as_ids(decider._imply_map), as_ids(imply_map))
+
+    def test_malformed(self):
+        cache = ImplyMapCache(self.directory)
+        with open(os.path.join(self.directory, imply_map_key(spec) + '.json'), 'w') as f:
+            f.write('[[1, ')
+        self.assertIsNone(cache.load(spec))
+        # The map is rebuilt and the file replaced
+        cache.get_or_build(spec)
+        self.assertIsNotNone(cache.load(spec))
+
+    def test_evict(self):
+        cache = ImplyMapCache(self.directory, max_entries=1)
+        cache.get_or_build(spec)
+        other = parse(spec_str.replace('pos(b) && neg(a)', 'pos(b) && pos(a)'))
+        cache.get_or_build(other)
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+        self.assertIsNotNone(cache.load(other))
+        with self.assertRaises(ValueError):
+            ImplyMapCache(self.directory, max_entries=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from .example_base import Example
+from .example_constraint import ExampleConstraintDecider
+from .property_cache import PropertyCache
+from .test_example_constraint import FooInterpreter, builder, spec
+
+
+class CountingInterpreter(FooInterpreter):
+    def __init__(self):
+        self.num_calls = 0
+
+    def apply_pos(self, arg):
+        self.num_calls += 1
+        return super().apply_pos(arg)
+
+    def apply_size(self, arg):
+        self.num_calls += 1
+        return len(arg)
+
+
+class TestPropertyCache(unittest.TestCase):
+
+    def test_apply(self):
+        interp = CountingInterpreter()
+        cache = PropertyCache(interp, max_values=2)
+        self.assertTrue(cache.apply('pos', 1))
+        self.assertTrue(cache.apply('pos', 1))
+        self.assertEqual(interp.num_calls, 1)
+        # Equal values of different types are kept apart
+        cache.apply('pos', 1.0)
+        self.assertEqual(interp.num_calls, 2)
+        # 1 is the least recently used, and is dropped
+        cache.apply('pos', -1)
+        cache.apply('pos', 1)
+        self.assertEqual(interp.num_calls, 4)
+        self.assertEqual((cache.num_hits, cache.num_misses), (1, 4))
+        with self.assertRaises(ValueError):
+            cache.apply('zero', 0)
+
+    def test_unhashable(self):
+        interp = CountingInterpreter()
+        cache = PropertyCache(interp)
+        self.assertEqual(cache.apply('size', [1]), 1)
+        cache.apply('size', [1])
+        self.assertEqual(interp.num_calls, 2)
+
+    def test_example_property(self):
+        interp = CountingInterpreter()
+        cache = PropertyCache(interp, max_values=0)
+        self.assertFalse(cache.example_property(0, 1, 'pos', -1))
+        # The value is not looked at once the property is known
+        self.assertFalse(cache.example_property(0, 1, 'pos', None))
+        self.assertTrue(cache.example_property(1, 1, 'pos', 1))
+        self.assertEqual(interp.num_calls, 2)
+        cache.clear()
+        cache.example_property(0, 1, 'pos', -1)
+        self.assertEqual(interp.num_calls, 3)
+
+    def test_decider(self):
+        interp = CountingInterpreter()
+        examples = [Example(input=[1, -1], output=2), Example(input=[-1, 1], output=2)]
+        decider = ExampleConstraintDecider(
+            spec=spec, interpreter=interp, examples=examples)
+        decider.analyze(builder.from_sexp_string('(mult (@param 0) (@param 1))'))
+        num_calls = interp.num_calls
+        self.assertGreater(num_calls, 0)
+        decider.analyze(builder.from_sexp_string('(div (@param 1) (@param 0))'))
+        # Only the concrete evaluation calls the interpreter
+        self.assertEqual(interp.num_calls, num_calls)
+        self.assertIs(decider.get_solver(examples[1]).properties, decider.properties)
+        self.assertEqual(decider.get_solver(examples[1]).index, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,3 +4,5 @@ from .random import RandomEnumerator
 from .exhaustive import ExhaustiveEnumerator
 from .bidirection_smt import BidirectEnumerator
 from .from_iterator import FromIteratorEnumerator, make_empty_enumerator, make_singleton_enumerator, make_list_enumerator
+from .lemma_cache import LemmaCache
+from .sketch_scheduler import SketchScheduler
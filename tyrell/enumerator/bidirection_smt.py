@@ -1,8 +1,11 @@
 from z3 import *
-from collections import deque
+from collections import deque, OrderedDict
 from .enumerator import Enumerator
 from functools import reduce
 from .. import dsl as D
+from ..spec import FunctionProperty
+from ..budget import Z3_NO_TIMEOUT, check_sat
+from ..metrics import get_metrics
 from ..logger import get_logger
 
 logger = get_logger('tyrell.enumerator.bidirection_smt')
@@ -21,21 +24,19 @@ class Stmt:
 
 
 class BidirectEnumerator(Enumerator):
-    # z3 solver
-    z3_solver = Solver()
+    # maximum number of enumerated programs that can still be rejected with update()
+    max_pending = 1024
 
-    # z3 variables for each production node
-    variables = []
+    # maximum number of AST nodes that are kept to be reused by later models
+    max_stmt_nodes = 4096
 
-    # map from internal k-tree to nodes of program
-    program2tree = {}
-
-    sk_queue = []
-
-    _functions = []
+    # maximum number of pruned candidates that are counted per sketch
+    max_counted_pruned = 1000
 
     def createStmtConstraints(self):
-        self._functions = list(filter(lambda x: x.is_function() and x.id > 0, self.spec.productions()))
+        g = self.spec.grammar
+        self._functions = [g.productions[p] for p in range(0, g.num_productions())
+                           if g.is_function[p] and not g.is_empty[p]]
         
         for i_loc in range(0, self.loc):
             st = self.lines[i_loc]
@@ -52,17 +53,24 @@ class BidirectEnumerator(Enumerator):
                 # print('line: ', opcode, ' arg: ', i)
                 arg = st.args[i]
                 for p in self._functions:
-                    if i < len(p.rhs):
-                        child_type = str(p.rhs[i])
-                        child_prods = self.spec.get_productions_with_lhs(child_type)
-                        child_prods=list(o.id for o in filter(lambda x: (not x.is_function()), child_prods))
-                        if child_type == st.type:
+                    if i < g.arity[p.id]:
+                        child_type = g.rhs[p.id][i]
+                        child_prods = [o for o in g.get_productions_with_lhs(child_type) if g.is_leaf[o]]
+                        if g.type_names[child_type] == st.type:
                             child_prods = child_prods + def_vars
                         ctr_arg = reduce(lambda a,b: Or(a, b == arg), child_prods, False)
                         self.z3_solver.add(Implies(opcode == p.id, ctr_arg))
                     else:
                         self.z3_solver.add(Implies(opcode == p.id, arg == -1))
 
+            # Break the symmetries of the declared function properties
+            # FIXME: associativity is not broken since it relates two different statements
+            for p in self._functions:
+                if p.has_property(FunctionProperty.COMMUTATIVE):
+                    self.z3_solver.add(Implies(opcode == p.id, st.args[0] <= st.args[1]))
+                if p.has_property(FunctionProperty.IDEMPOTENT):
+                    self.z3_solver.add(Implies(opcode == p.id, st.args[0] != st.args[1]))
+
     def createDefuseConstraints(self):
         '''All input and intermediate vars will appear at least once in the program'''
         all_args = reduce(lambda a,b: a + b.args, self.lines, [])
@@ -79,11 +87,7 @@ class BidirectEnumerator(Enumerator):
 
     def maxChildren(self) -> int:
         '''Finds the maximum number of children in the productions'''
-        max = 0
-        for p in self.spec.productions():
-            if len(p.rhs) > max:
-                max = len(p.rhs)
-        return max
+        return max(self.spec.grammar.arity, default=0)
 
     def buildKLines(self, children, loc, solver):
         lines = []
@@ -107,10 +111,29 @@ class BidirectEnumerator(Enumerator):
 
         return lines, None
 
-    def __init__(self, spec, depth=None, loc=None, sk_queue=None):
+    def __init__(self, spec, depth=None, loc=None, sk_queue=None, lemma_cache=None, count_pruned=False, scheduler=None):
+        '''
+        The sketches in `sk_queue` are explored one after the other. Without any, nothing is enumerated until `set_sketch()` is called.
+        If a `scheduler` is given instead, it decides which sketch is explored and for how long, based on the feedback of the enumerator.
+        Sketches are enforced through assumption literals, so the lemmas learned under one sketch keep pruning the following ones.
+        If a `lemma_cache` is given, the lemmas it holds for the task are blocked upfront, and new lemmas are added to it.
+        If `count_pruned` is set, every lemma is guarded by its own assumption literal, and whenever a sketch is exhausted,
+        the candidates of the sketch that only the lemmas learned under other sketches rule out are counted in `num_pruned`.
+        This is meant for measurements, since it slows down the enumeration.
+        '''
+        # All the solver state is per instance, so that enumerators do not leak into each other
+        # z3 solver
         self.z3_solver = Solver()
+        # z3 variables for each production node
         self.variables = []
+        # map from internal k-tree to nodes of program
         self.program2tree = {}
+        # AST nodes of the previous models, by place in the program, variable, production and children, the least recently used first
+        self.stmt_nodes = OrderedDict()
+        # non-empty function productions, which are the possible opcodes
+        self._functions = []
+        # models of the recently enumerated programs that may still be rejected
+        self.pending = OrderedDict()
         self.spec = spec
         if depth <= 0:
             raise ValueError(
@@ -126,76 +149,316 @@ class BidirectEnumerator(Enumerator):
         self.model = None
         self.createStmtConstraints()
         self.createDefuseConstraints()
-        self.sk_queue = deque(sk_queue)
-        self.enforceSketch(self.sk_queue.popleft())
+        self.lemma_cache = lemma_cache
+        if self.lemma_cache is not None:
+            self.lemma_key = lemma_cache.key(spec, ('bidirect', self.loc))
+            self.preloadLemmas()
+        # the sketch that is currently enforced and its assumptions
+        self.sketch = None
+        self.sketch_assumptions = []
+        # assumption literal of each function at each line, and the other way around
+        self.opcode_literals = {}
+        self.opcode_positions = {}
+        self.scheduler = scheduler
+        # whether the candidates pruned in the current sketch have been counted
+        self._counted = False
+        self.count_pruned = count_pruned
+        # assumption literal of each lemma and the sketch it was learned under, if `count_pruned` is set
+        self.lemma_literals = []
+        # number of lemmas learned from blames, and number of candidates pruned by the lemmas of other sketches
+        self.num_lemmas = 0
+        self.num_pruned = 0
+        if scheduler is not None and sk_queue is not None:
+            raise ValueError('Cannot have both a sketch queue and a scheduler')
+        self.sk_queue = deque(sk_queue if sk_queue is not None else [])
+        if self.sk_queue:
+            self.enforceSketch(self.sk_queue.popleft())
 
-    def blockModel(self):
-        assert(self.model is not None)
-        # m = self.z3_solver.model()
+    def blockModel(self, model=None):
+        if model is None:
+            model = self.model
+        assert(model is not None)
         block = []
         # block the model using only the variables that correspond to productions
         for x in self.variables:
-            block.append(x != self.model[x])
+            block.append(x != model[x])
         ctr = Or(block)
         self.z3_solver.add(ctr)
 
-    def update(self, info=None):
+    def _remember(self, prog):
+        '''Keep the model of `prog` around so that it can still be rejected after other programs are enumerated'''
+        self.pending[prog] = (self.model, self.program2tree, self.sketch)
+        while len(self.pending) > self.max_pending:
+            self.pending.popitem(last=False)
+
+    def update(self, info=None, prog=None):
+        self._check_open()
+        model, program2tree, sketch = self.model, self.program2tree, self.sketch
+        if prog is not None:
+            if prog not in self.pending:
+                raise KeyError(
+                    'Program is not pending in the enumerator: {}'.format(prog))
+            model, program2tree, sketch = self.pending.pop(prog)
         # TODO: block more than one model
         if info is not None and not isinstance(info, str):
+            if self.scheduler is not None and sketch is not None:
+                self.scheduler.blamed(sketch)
             for core in info:
-                ctr = reduce(lambda a,b: Or(a, self.program2tree[b[0]] != b[1].id), core, False)
+                ctr = reduce(lambda a,b: Or(a, program2tree[b[0]] != b[1].id), core, False)
                 # print('blocking=============', ctr)
-                self.z3_solver.add(ctr)
+                self._addLemma(ctr)
+                if self.lemma_cache is not None:
+                    lemma = [(str(program2tree[b[0]]), b[1].id) for b in core]
+                    self.lemma_cache.append(self.lemma_key, lemma)
         else:
-            self.blockModel()
+            self.blockModel(model)
+
+    def _addLemma(self, ctr):
+        '''Block `ctr` for the rest of the task, whatever the sketch'''
+        self.num_lemmas += 1
+        get_metrics().incr('lemma_clauses')
+        if self.count_pruned:
+            lit = Bool('lemma' + str(len(self.lemma_literals)))
+            self.z3_solver.add(Implies(lit, ctr))
+            self.lemma_literals.append((lit, self.sketch))
+        else:
+            self.z3_solver.add(ctr)
+
+    def _assumptions(self):
+        return self.sketch_assumptions + [lit for lit, _ in self.lemma_literals]
+
+    def _sketchCore(self):
+        '''After an unsat check, the (line, function) pairs of the current sketch that are infeasible together'''
+        core = []
+        for lit in self.z3_solver.unsat_core():
+            pos = self.opcode_positions.get(str(lit))
+            if pos is not None:
+                core.append(pos)
+        return core
+
+    def _exhausted(self):
+        '''Handle the end of the current sketch, right after an unsat check that did not block any pending program'''
+        if self.scheduler is not None:
+            self.scheduler.exhausted(self.sketch, self._sketchCore())
+        self._countPruned()
+        if self.scheduler is not None:
+            self.sketch = None
+            self.sketch_assumptions = []
+
+    def _schedule(self):
+        '''Switch to the sketch picked by the scheduler, if any'''
+        sk = self.scheduler.next_sketch()
+        if sk is None:
+            self.sketch = None
+            self.sketch_assumptions = []
+        elif sk != self.sketch:
+            self.enforceSketch(sk)
+
+    def _countPruned(self):
+        '''Count the remaining candidates of the exhausted sketch when only its own lemmas are assumed'''
+        if not self.count_pruned or self._counted:
+            return
+        self._counted = True
+        own = [lit for lit, sk in self.lemma_literals if sk == self.sketch]
+        num_pruned = 0
+        self.z3_solver.push()
+        try:
+            while num_pruned < self.max_counted_pruned and \
+                    check_sat(self.z3_solver, *self.sketch_assumptions, *own, budget=self.budget) == sat:
+                num_pruned += 1
+                model = self.z3_solver.model()
+                self.z3_solver.add(Or([x != model[x] for x in self.variables]))
+        finally:
+            self.z3_solver.pop()
+        logger.debug('Lemmas of other sketches pruned {} candidates of sketch "{}"'.format(
+            num_pruned, self.sketch))
+        self.num_pruned += num_pruned
+
+    def preloadLemmas(self):
+        # Lemmas are added before any sketch is enforced, so they hold for all sketches
+        variables = {str(x): x for x in self.variables}
+        for lemma in self.lemma_cache.load(self.lemma_key):
+            if all(x in variables for x, _ in lemma):
+                ctr = reduce(lambda a,b: Or(a, variables[b[0]] != b[1]), lemma, False)
+                self.z3_solver.add(ctr)
+            else:
+                logger.warning(
+                    'Skipping a cached lemma that does not fit the lines: {}'.format(lemma))
 
     def buildProgram(self):
-        self.program2tree.clear()
-        return self.stmtToAST(self.lines[-1])
+        self.program2tree = {}
+        prog = self.stmtToAST(self.lines[-1])
+        self._remember(prog)
+        return prog
 
-    def stmtToAST(self, stmt):
+    def _makeNode(self, var, prod_id, path, children=[]):
+        '''
+        Build the node of `var` at `path`, the indices of the children from the root, reusing the one of a previous model if it has the same subtree at the same place.
+        A line that is used twice is at two places, so nodes are never shared between two places of a program, as in a program built from scratch.
+        '''
+        key = (path, var.get_id(), prod_id, tuple(children))
+        node = self.stmt_nodes.get(key)
+        if node is None:
+            node = self.builder.make_node(prod_id, children)
+            self.stmt_nodes[key] = node
+            if len(self.stmt_nodes) > self.max_stmt_nodes:
+                self.stmt_nodes.popitem(last=False)
+        else:
+            self.stmt_nodes.move_to_end(key)
+        self.program2tree[node] = var
+        return node
+
+    def stmtToAST(self, stmt, path=()):
         opcode = stmt.opcode
         opcode_val = self.model[opcode].as_long()
         args = stmt.args
         children = []
-        for arg in args:
+        for i, arg in enumerate(args):
             arg_val = self.model[arg].as_long()
             if arg_val == -1:
                 break
             if arg_val > 999:
-                children.append(self.stmtToAST(self.lines[arg_val - 1000]))
+                children.append(self.stmtToAST(self.lines[arg_val - 1000], path + (i,)))
             else:
-                child_node = self.builder.make_node(arg_val)
-                self.program2tree[child_node] = arg
-                children.append(child_node)
-                
-        cur = self.builder.make_node(opcode_val, children)
-        self.program2tree[cur] = opcode
-        return cur
+                children.append(self._makeNode(arg, arg_val, path + (i,)))
+
+        return self._makeNode(opcode, opcode_val, path, children)
 
     def enforceSketch(self, sk):
-        op_ids = list(map(lambda x: list(filter(lambda e: e.name==x, 
-                                    self._functions))[0].id, sk.split()))
-        self.z3_solver.push()
-        ctr_opcode = reduce(lambda a,b: And(a, self.lines[b].opcode == op_ids[b]), 
-                            range(0, self.loc), True)
-        self.z3_solver.add(ctr_opcode)
+        op_ids = []
+        for name in sk.split():
+            matches = [p.id for p in self._functions if p.name == name]
+            if len(matches) == 0:
+                raise ValueError(
+                    'Unknown function in sketch "{}": {}'.format(sk, name))
+            op_ids.append(matches[0])
+        if len(op_ids) < self.loc:
+            raise ValueError(
+                'Sketch "{}" has fewer than {} functions'.format(sk, self.loc))
+        # The literals are added outside of any scope, so that they can be assumed again later
+        assert self.z3_solver.num_scopes() == 0
+        assumptions = []
+        for line in range(0, self.loc):
+            key = (line, op_ids[line])
+            lit = self.opcode_literals.get(key)
+            if lit is None:
+                lit = Bool('opcode{}_{}'.format(line, op_ids[line]))
+                self.z3_solver.add(Implies(lit, self.lines[line].opcode == op_ids[line]))
+                self.opcode_literals[key] = lit
+                self.opcode_positions[str(lit)] = (line, sk.split()[line])
+            assumptions.append(lit)
+        self.sketch = sk
+        self.sketch_assumptions = assumptions
+        self._counted = False
+
+    def _check_open(self):
+        if self.z3_solver is None:
+            raise RuntimeError('Enumerator has been closed')
+
+    def close(self):
+        '''Drop the solver, the lines and the decoded programs, so that they can be freed right away'''
+        if self.z3_solver is None:
+            return
+        self.z3_solver = None
+        self.variables = []
+        self.lines = []
+        self.nodes = []
+        self.model = None
+        self.program2tree = {}
+        self.stmt_nodes = OrderedDict()
+        self.pending = OrderedDict()
+        self.sketch = None
+        self.sketch_assumptions = []
+        self.opcode_literals = {}
+        self.opcode_positions = {}
+        self.lemma_literals = []
+        self.sk_queue = deque()
+
+    def set_sketch(self, sk):
+        '''
+        Replace the sketch that is currently enforced by `sk`, regardless of the sketches that are left in the queue.
+        Lemmas learned under the previous sketches keep holding.
+        '''
+        self._check_open()
+        self.enforceSketch(sk)
+
+    def set_budget(self, budget):
+        self._check_open()
+        super().set_budget(budget)
+        if budget is None:
+            self.z3_solver.set('timeout', Z3_NO_TIMEOUT)
 
     def next(self):
+        self._check_open()
         while True:
+            if self.scheduler is not None:
+                self._schedule()
+            if self.sketch is None:
+                return None
             self.model = None
-            res = self.z3_solver.check()
-            if res == sat:
-                self.model = self.z3_solver.model()
+            with get_metrics().timer('solve'):
+                res = check_sat(self.z3_solver, self._assumptions(), budget=self.budget)
+                if res == sat:
+                    self.model = self.z3_solver.model()
 
             if self.model is not None:
-                return self.buildProgram()
+                if self.scheduler is not None:
+                    self.scheduler.candidate(self.sketch)
+                with get_metrics().timer('decode'):
+                    return self.buildProgram()
             else:
+                self._exhausted()
+                if self.scheduler is not None:
+                    continue
                 if self.sk_queue:
-                    self.z3_solver.pop()
+                    # The next sketch may be infeasible as well
                     self.enforceSketch(self.sk_queue.popleft())
-                    self.z3_solver.check()
-                    self.model = self.z3_solver.model()
-                    return self.buildProgram()
                 else:
-                    return None
\ No newline at end of file
+                    return None
+
+    def next_batch(self, k):
+        '''
+        Enumerate up to `k` distinct programs of the current sketch with a single pass over the solver.
+        The programs are only blocked inside of a temporary scope, so the ones that are not rejected with `update()` may be enumerated again.
+        A batch stops at the end of a sketch, and the next sketch is only enforced once the current one has no program left.
+        '''
+        self._check_open()
+        if k <= 0:
+            raise ValueError('Batch size must be positive: {}'.format(k))
+        if k > self.max_pending:
+            raise ValueError(
+                'Batch size cannot exceed {}: {}'.format(self.max_pending, k))
+        metrics = get_metrics()
+        progs = []
+        while True:
+            if self.scheduler is not None:
+                self._schedule()
+            if self.sketch is None:
+                break
+            self.z3_solver.push()
+            try:
+                while len(progs) < k:
+                    with metrics.timer('solve'):
+                        if check_sat(self.z3_solver, self._assumptions(), budget=self.budget) != sat:
+                            break
+                        self.model = self.z3_solver.model()
+                    if self.scheduler is not None:
+                        self.scheduler.candidate(self.sketch)
+                    with metrics.timer('decode'):
+                        progs.append(self.buildProgram())
+                    self.blockModel()
+            finally:
+                self.z3_solver.pop()
+            # Only a sketch without any program in the batch is exhausted, since the programs of the batch may not be rejected
+            if len(progs) > 0:
+                break
+            self._exhausted()
+            if self.scheduler is None:
+                if not self.sk_queue:
+                    break
+                self.enforceSketch(self.sk_queue.popleft())
+        if len(progs) > 0:
+            self.model, self.program2tree, _ = self.pending[progs[-1]]
+        else:
+            self.model = None
+        return progs
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Any
+from typing import Optional, Any, List
 from ..dsl import Node
 
 
@@ -17,9 +17,50 @@ class Enumerator(ABC):
         '''
         raise NotImplementedError
 
-    def update(self, info: Any=None) -> None:
+    def next_batch(self, k: int) -> List[Node]:
+        '''
+        Enumerate up to `k` distinct ASTs at once. Fewer than `k` ASTs are returned only if the enumerator is exhausted.
+        By default, it calls `next()` repeatedly, which is only correct for enumerators that do not rely on `update()` to move forward.
+        '''
+        if k <= 0:
+            raise ValueError('Batch size must be positive: {}'.format(k))
+        progs = []
+        while len(progs) < k:
+            prog = self.next()
+            if prog is None:
+                break
+            progs.append(prog)
+        return progs
+
+    def update(self, info: Any=None, prog: Optional[Node]=None) -> None:
         '''
         Update the internal state of the enumerator. This can be useful when trying to prune the search space.
+        `prog` is the rejected AST, which defaults to the last AST that has been enumerated.
+        By default, it does nothing.
+        '''
+        pass
+
+    @property
+    def budget(self):
+        '''The `Budget` that limits the enumerator, or `None` if it is not limited'''
+        return getattr(self, '_budget', None)
+
+    def set_budget(self, budget) -> None:
+        '''
+        Limit the enumerator by a `Budget`, or lift the limit with `None`.
+        Enumerators that may block for a long time, e.g. in a solver, check it and raise `BudgetExhausted`. By default, it is only stored.
+        '''
+        self._budget = budget
+
+    def close(self) -> None:
+        '''
+        Release the resources held by the enumerator, after which it cannot be used anymore.
         By default, it does nothing.
         '''
         pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
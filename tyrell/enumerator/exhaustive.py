@@ -1,6 +1,6 @@
 from typing import Iterator
 from itertools import product
-from ..spec import TyrellSpec, Type
+from ..spec import TyrellSpec, GrammarTable, Type
 from ..dsl import Node, Builder
 from .enumerator import Enumerator
 from .from_iterator import FromIteratorEnumerator
@@ -9,25 +9,27 @@ from .from_iterator import FromIteratorEnumerator
 class ExhaustiveIterator:
     _builder: Builder
     _max_depth: int
+    _grammar: GrammarTable
 
     def __init__(self, spec: TyrellSpec, max_depth: int):
         self._builder = Builder(spec)
+        self._grammar = spec.grammar
         if max_depth <= 0:
             raise ValueError(
                 'Max depth cannot be non-positive: {}'.format(max_depth))
         self._max_depth = max_depth
 
     def _do_iter(self, ty: Type, curr_depth: int) -> Iterator[Node]:
-        prods = self._builder.get_productions_with_lhs(ty)
+        g = self._grammar
         enum_prods, param_prods, func_prods = [], [], []
         force_leaf = curr_depth >= self._max_depth - 1
-        for prod in prods:
-            if prod.is_enum():
-                enum_prods.append(prod)
-            elif prod.is_param():
-                param_prods.append(prod)
-            elif not force_leaf and prod.is_function():
-                func_prods.append(prod)
+        for prod in g.get_productions_with_lhs(ty):
+            if g.is_enum[prod]:
+                enum_prods.append(g.productions[prod])
+            elif g.is_param[prod]:
+                param_prods.append(g.productions[prod])
+            elif not force_leaf and g.is_function[prod]:
+                func_prods.append(g.productions[prod])
 
         for prod in enum_prods:
             yield self._builder.make_node(prod)
@@ -0,0 +1,124 @@
+import os
+import json
+import hashlib
+from typing import Any, Dict, List, Set, Tuple, Union
+from ..spec import TyrellSpec
+from ..logger import get_logger
+
+logger = get_logger('tyrell.enumerator.lemma_cache')
+
+# A lemma is a list of (position, production id) pairs, of which at least one must not hold.
+# Positions are k-tree node ids for SmtEnumerator and variable names for BidirectEnumerator.
+Position = Union[int, str]
+Lemma = List[Tuple[Position, int]]
+
+
+def spec_fingerprint(spec: TyrellSpec) -> str:
+    '''A digest of everything in the spec that affects the encoding of the enumerators'''
+    lines = []
+    for ty in spec.types():
+        lines.append(repr(ty))
+    lines.append('program {}({}) -> {}'.format(
+        spec.name, ', '.join(str(x) for x in spec.input), spec.output))
+    for prod in spec.grammar.productions:
+        lines.append(repr(prod))
+        if prod.is_function():
+            lines.extend(str(x) for x in prod.constraints)
+            lines.extend(sorted(x.value for x in prod.properties))
+    for pred in spec.predicates():
+        lines.append(str(pred))
+    return hashlib.sha256('\n'.join(lines).encode('utf-8')).hexdigest()
+
+
+class LemmaCache:
+    '''
+    An on-disk store of the blame lemmas learned by the SMT enumerators, so that runs of the same task can start from them.
+    A task is identified by the spec, the shape of the enumerator and the examples, and each task is stored in its own file.
+    The `max_tasks` least recently used tasks are kept, and at most `max_lemmas` lemmas are stored per task.
+    The examples only take part in the key through `repr()`, which should therefore be deterministic.
+    '''
+
+    _directory: str
+    _examples: Any
+    _max_tasks: int
+    _max_lemmas: int
+    _known: Dict[str, Set[Tuple[Tuple[Position, int], ...]]]
+
+    def __init__(self, directory: str, examples: Any, max_tasks: int = 64, max_lemmas: int = 100000):
+        if max_tasks <= 0:
+            raise ValueError(
+                'Maximum number of tasks must be positive: {}'.format(max_tasks))
+        if max_lemmas <= 0:
+            raise ValueError(
+                'Maximum number of lemmas must be positive: {}'.format(max_lemmas))
+        self._directory = directory
+        self._examples = examples
+        self._max_tasks = max_tasks
+        self._max_lemmas = max_lemmas
+        self._known = dict()
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, spec: TyrellSpec, shape: Any) -> str:
+        '''The key of the task solved by an enumerator of the given `shape`, e.g. `('smt', depth, loc)`'''
+        digest = hashlib.sha256()
+        digest.update(spec_fingerprint(spec).encode('utf-8'))
+        digest.update(repr(shape).encode('utf-8'))
+        digest.update(repr(self._examples).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, key + '.jsonl')
+
+    def load(self, key: str) -> List[Lemma]:
+        '''Return all lemmas stored for `key`, and mark it as the most recently used task'''
+        known = self._known.setdefault(key, set())
+        path = self._path(key)
+        if not os.path.exists(path):
+            return []
+        ret = []
+        with open(path, 'r') as f:
+            for line in f:
+                try:
+                    lemma = tuple((pos, int(prod))
+                                  for pos, prod in json.loads(line))
+                except (ValueError, TypeError):
+                    # Most likely a write that got interrupted
+                    logger.warning(
+                        'Skipping a malformed lemma in {}'.format(path))
+                    continue
+                if lemma not in known:
+                    known.add(lemma)
+                    ret.append(list(lemma))
+        os.utime(path)
+        logger.debug('Loaded {} lemmas from {}'.format(len(ret), path))
+        return ret
+
+    def append(self, key: str, lemma: Lemma) -> None:
+        '''Store `lemma` for `key`, unless it is already stored or the task is full'''
+        if key not in self._known:
+            self.load(key)
+        known = self._known[key]
+        entry = tuple((pos, prod) for pos, prod in lemma)
+        if entry in known or len(known) >= self._max_lemmas:
+            return
+        known.add(entry)
+        path = self._path(key)
+        is_new = not os.path.exists(path)
+        with open(path, 'a') as f:
+            f.write(json.dumps([[pos, prod] for pos, prod in entry]) + '\n')
+        if is_new:
+            self._evict()
+
+    def _evict(self) -> None:
+        '''Remove the least recently used tasks until at most `max_tasks` are left'''
+        paths = [os.path.join(self._directory, x) for x in os.listdir(self._directory)
+                 if x.endswith('.jsonl')]
+        if len(paths) <= self._max_tasks:
+            return
+        paths.sort(key=os.path.getmtime)
+        for path in paths[:len(paths) - self._max_tasks]:
+            logger.debug('Evicting lemmas in {}'.format(path))
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -1,23 +1,30 @@
 from z3 import *
 from .. import dsl as D
+from ..budget import check_sat
 
 
 class Optimizer:
 
-    # additional variables to track if a production occurs or not in a program
-    var_occurs = []
-
-    # relaxation variables
-    relax_vars = []
-
-    # keeps track of the current assumptions
-    assumptions = []
-
-    # keeps track of the cost of each relaxation variable
-    cost_relax_vars = {}
-
-    def __init__(self, solver, spec, variables, nodes):
+    def __init__(self, solver, spec, variables, nodes, engine='core'):
+        '''`engine` is one of 'lsu', 'core' and 'z3', or an object with the same interface as these engines'''
+        if isinstance(engine, str):
+            if engine not in ENGINES:
+                raise ValueError(
+                    'Unknown optimization engine: {}'.format(engine))
+            engine = ENGINES[engine]()
+        self.engine = engine
+        # the budget of the current run, which bounds every solver check
+        self.budget = None
+        # additional variables to track if a production occurs or not in a program
+        self.var_occurs = []
+        # relaxation variables
+        self.relax_vars = []
+        # keeps track of the cost of each relaxation variable
+        self.cost_relax_vars = {}
+        # a lower bound on the cost of the next model
         self.bound = 0
+        # bitset of the costs that some set of relaxation variables adds up to
+        self.achievable = 1
         self.ub = 0
         self.solver = solver
         self.spec = spec
@@ -56,19 +63,10 @@ class Optimizer:
                 child_pos.append(x)
 
         for n in self.nodes:
-            # not a leaf node
-            if n.children != None:
+            # not a leaf node, and wide enough to hold the parent
+            if n.children != None and len(n.children) >= len(child_pos):
                 if weight != 100:
-                    # FIXME: reduce duplication of code
-                    name = 'relax' + str(self.id)
-                    v = Int(name)
-                    self.cost_relax_vars[v] = weight
-                    self.relax_vars.append(v)
-                    self.objective.append(Product(weight, v))
-                    self.weights.append(weight)
-                    self.ub += weight
-                    # domain of the relaxation variable
-                    self.solver.add(Or(v == 0, v == 1))
+                    v = self.mk_relax_var(weight)
                     # constraint for the is_parent constraint
                     ctr_children = []
                     for p in range(0, len(child_pos)):
@@ -82,7 +80,6 @@ class Optimizer:
                         self.variables[n.id - 1] == parent.id, Not(Or(ctr_children)))))
                     self.solver.add(
                         Implies(And(self.variables[n.id - 1] != parent.id, Or(ctr_children)), v == 0))
-                    self.id = self.id + 1
                 else:
                     ctr_children = []
                     for p in range(0, len(child_pos)):
@@ -103,19 +100,10 @@ class Optimizer:
                 child_pos.append(x)
 
         for n in self.nodes:
-            # not a leaf node
-            if n.children != None:
+            # not a leaf node, and wide enough to hold the parent
+            if n.children != None and len(n.children) >= len(child_pos):
                 if weight != 100:
-                    # FIXME: reduce duplication of code
-                    name = 'relax' + str(self.id)
-                    v = Int(name)
-                    self.cost_relax_vars[v] = weight
-                    self.relax_vars.append(v)
-                    self.objective.append(Product(weight, v))
-                    self.weights.append(weight)
-                    self.ub += weight
-                    # domain of the relaxation variable
-                    self.solver.add(Or(v == 0, v == 1))
+                    v = self.mk_relax_var(weight)
                     # constraint for the is_parent constraint
                     ctr_children = []
                     for p in range(0, len(child_pos)):
@@ -129,7 +117,6 @@ class Optimizer:
                         self.variables[n.id - 1] != parent.id, Not(Or(ctr_children)))))
                     self.solver.add(
                         Implies(And(self.variables[n.id - 1] == parent.id, Or(ctr_children)), v == 0))
-                    self.id = self.id + 1
                 else:
                     ctr_children = []
                     for p in range(0, len(child_pos)):
@@ -145,15 +132,7 @@ class Optimizer:
             self.createVariablesOccurrence()
 
         if weight != 100:
-            name = 'relax' + str(self.id)
-            v = Int(name)
-            self.cost_relax_vars[v] = weight
-            self.relax_vars.append(v)
-            self.objective.append(Product(weight, v))
-            self.weights.append(weight)
-            self.ub += weight
-            # domain of the relaxation variable
-            self.solver.add(Or(v == 0, v == 1))
+            v = self.mk_relax_var(weight)
             # constraint for at least once
             self.solver.add(Or(self.var_occurs[production.id] == 0, v == 1))
             # relation between relaxation variables and constraint
@@ -161,7 +140,6 @@ class Optimizer:
                 Implies(v == 1, self.var_occurs[production.id] != 0))
             self.solver.add(
                 Implies(self.var_occurs[production.id] == 0, v == 0))
-            self.id = self.id + 1
         else:
             self.solver.add(self.var_occurs[production.id] == 0)
 
@@ -172,15 +150,7 @@ class Optimizer:
             self.createVariablesOccurrence()
 
         if weight != 100:
-            name = 'relax' + str(self.id)
-            v = Int(name)
-            self.cost_relax_vars[v] = weight
-            self.relax_vars.append(v)
-            self.objective.append(Product(weight, v))
-            self.weights.append(weight)
-            self.ub += weight
-            # domain of the relaxation variable
-            self.solver.add(Or(v == 0, v == 1))
+            v = self.mk_relax_var(weight)
             # constraint for at least once
             self.solver.add(Or(self.var_occurs[production.id] == 1, v == 1))
             # relation between relaxation variables and constraint
@@ -188,82 +158,179 @@ class Optimizer:
                 Implies(v == 1, self.var_occurs[production.id] != 1))
             self.solver.add(
                 Implies(self.var_occurs[production.id] == 1, v == 0))
-            self.id = self.id + 1
         else:
             self.solver.add(self.var_occurs[production.id] == 1)
 
-    def isSubsetSum(self, set, n, sum):
-        subset = ([[False for i in range(sum + 1)]
-                   for i in range(n + 1)])
+    def mk_relax_var(self, weight):
+        '''Create a 0/1 relaxation variable that costs `weight` when it is set'''
+        name = 'relax' + str(self.id)
+        v = Int(name)
+        self.cost_relax_vars[v] = weight
+        self.relax_vars.append(v)
+        self.objective.append(Product(weight, v))
+        self.weights.append(weight)
+        self.ub += weight
+        # every achievable cost may either pay for the new variable or not
+        self.achievable |= self.achievable << weight
+        # domain of the relaxation variable
+        self.solver.add(Or(v == 0, v == 1))
+        self.id = self.id + 1
+        return v
+
+    def next_achievable(self, bound):
+        '''The smallest cost above `bound` that some set of relaxation variables adds up to, or None if there is none'''
+        higher = self.achievable >> (bound + 1)
+        if higher == 0:
+            return None
+        return bound + (higher & -higher).bit_length()
+
+    def optimize(self, solver, assumptions=[]):
+        '''Return a model of minimum cost under the `assumptions`, or None if there is no model'''
+        # the solver may be called inside of a scope of the caller
+        num_scopes = solver.num_scopes()
+        # no optimization is defined
+        if len(self.objective) == 0:
+            model = None
+            if check_sat(solver, *assumptions, budget=self.budget) == sat:
+                model = solver.model()
+        else:
+            try:
+                model = self.engine.optimize(self, solver, assumptions)
+            except BaseException:
+                # e.g. a check ran out of budget in the middle of a search
+                while solver.num_scopes() > num_scopes:
+                    solver.pop()
+                raise
+        assert(solver.num_scopes() == num_scopes)
+        if model is not None:
+            self.bound = self.computeCost(model)
+        return model
 
-        # If sum is 0, then answer is true
-        for i in range(n + 1):
-            subset[i][0] = True
+    def computeCost(self, model):
+        cost = 0
+        for v in self.relax_vars:
+            if model[v] == 1:
+                cost = cost + self.cost_relax_vars[v]
 
-            # If sum is not 0 and set is empty,
-            # then answer is false
-            for i in range(1, sum + 1):
-                subset[0][i] = False
+        return cost
 
-            # Fill the subset table in botton up manner
-            for i in range(1, n + 1):
-                for j in range(1, sum + 1):
-                    if j < set[i - 1]:
-                        subset[i][j] = subset[i - 1][j]
-                    if j >= set[i - 1]:
-                        subset[i][j] = (subset[i - 1][j]
-                                        or subset[i - 1][j - set[i - 1]])
 
-        return subset[n][sum]
+class LSUEngine:
+    '''
+    Linear search from below: the cost is bounded by the optimum of the previous call and relaxed to the next achievable cost until the solver finds a model.
+    This relies on the constraints only getting stronger between two calls.
+    '''
 
-    def optimize(self, solver):
+    def optimize(self, optimizer, solver, assumptions):
         model = None
-        cost = 0
         res = sat
-        nb_sat = 0
-        nb_unsat = 0
-        # no optimization is defined
-        if len(self.objective) == 0:
-            res = solver.check()
+        solver.set(unsat_core=True)
+        solver.push()
+        ctr = Sum(optimizer.objective) <= optimizer.bound
+        solver.assert_and_track(ctr, 'obj')
+
+        while model == None and res == sat:
+            res = check_sat(solver, *assumptions, budget=optimizer.budget)
             if res == sat:
                 model = solver.model()
-
-        # optimization using the LSU algorithm
-        else:
-            solver.set(unsat_core=True)
-            solver.push()
-            ctr = Sum(self.objective) <= self.bound
-            solver.assert_and_track(ctr, 'obj')
-
-            while model == None and res == sat:
-                res = solver.check()
-                if res == sat:
-                    nb_sat += 1
-                    model = solver.model()
-                    cost = self.computeCost(model)
-                    assert (cost == self.bound)
-                    solver.pop()
-                else:
-                    nb_unsat += 1
-                    solver.pop()
-                    core = solver.unsat_core()
-                    if len(core) != 0:
-                        self.bound += 1
-                        while(not self.isSubsetSum(self.weights, len(self.weights), self.bound) and self.bound <= self.ub):
-                            self.bound += 1
+                cost = optimizer.computeCost(model)
+                assert (cost == optimizer.bound)
+                solver.pop()
+            else:
+                solver.pop()
+                core = solver.unsat_core()
+                # the bound is only worth relaxing if it takes part in the conflict
+                if Bool('obj') in core:
+                    bound = optimizer.next_achievable(optimizer.bound)
+                    if bound is not None:
+                        optimizer.bound = bound
                         solver.push()
-                        ctr = Sum(self.objective) <= self.bound
+                        ctr = Sum(optimizer.objective) <= optimizer.bound
                         solver.assert_and_track(ctr, 'obj')
                         res = sat
+        return model
 
-        assert(solver.num_scopes() == 0)
-        self.bound = cost
+
+class CoreGuidedEngine:
+    '''
+    Weighted core-guided search (Fu-Malik/WPM1): every relaxation variable is assumed to be unset, and each unsat core
+    of these assumptions is relaxed by its minimum weight with fresh blocking variables, at most one of which may be set.
+    A relaxed core stays valid while constraints are only added, so the relaxations are kept across calls at the base level
+    of the solver, as long as the assumptions do not change. Inside of a scope of the caller, they are discarded after each call.
+    '''
+
+    def __init__(self):
+        # soft constraints as [assumption literal, clause, weight]
+        self.softs = None
+        self.key = None
+        self.num_lits = 0
+
+    def _mk_soft(self, solver, softs, clause, weight):
+        lit = Bool('__soft' + str(self.num_lits))
+        self.num_lits += 1
+        solver.add(Implies(lit, clause))
+        softs.append([lit, clause, weight])
+
+    def _init_softs(self, optimizer, solver):
+        softs = []
+        for v in optimizer.relax_vars:
+            self._mk_soft(solver, softs, v == 0, optimizer.cost_relax_vars[v])
+        return softs
+
+    def optimize(self, optimizer, solver, assumptions):
+        key = (tuple(str(x) for x in assumptions), len(optimizer.relax_vars))
+        persistent = solver.num_scopes() == 0
+        if not persistent:
+            solver.push()
+            softs = self._init_softs(optimizer, solver)
+        else:
+            if self.softs is None or self.key != key:
+                self.softs = self._init_softs(optimizer, solver)
+                self.key = key
+            softs = self.softs
+
+        model = None
+        while True:
+            soft_lits = [s[0] for s in softs if s[2] > 0]
+            res = check_sat(solver, *(list(assumptions) + soft_lits), budget=optimizer.budget)
+            if res == sat:
+                model = solver.model()
+                break
+            core = set(str(x) for x in solver.unsat_core())
+            in_core = [s for s in softs if s[2] > 0 and str(s[0]) in core]
+            if res != unsat or len(in_core) == 0:
+                # the hard constraints alone are unsatisfiable
+                break
+            min_weight = min(s[2] for s in in_core)
+            blocking = []
+            for s in in_core:
+                b = Bool('__block' + str(self.num_lits))
+                self.num_lits += 1
+                blocking.append(b)
+                self._mk_soft(solver, softs, Or(s[1], b), min_weight)
+                # the part of the weight that is not covered by this core stays on the original clause
+                s[2] -= min_weight
+            solver.add(AtMost(*blocking, 1))
+
+        if not persistent:
+            solver.pop()
         return model
 
-    def computeCost(self, model):
-        cost = 0
-        for v in self.relax_vars:
-            if model[v] == 1:
-                cost = cost + self.cost_relax_vars[v]
 
-        return cost
+class Z3OptimizeEngine:
+    '''Delegate to the MaxSMT engine of z3 on a copy of the current constraints'''
+
+    def optimize(self, optimizer, solver, assumptions):
+        opt = Optimize()
+        opt.add(solver.assertions())
+        opt.minimize(Sum(optimizer.objective))
+        if check_sat(opt, *assumptions, budget=optimizer.budget) == sat:
+            return opt.model()
+        return None
+
+
+ENGINES = {
+    'lsu': LSUEngine,
+    'core': CoreGuidedEngine,
+    'z3': Z3OptimizeEngine,
+}
@@ -9,10 +9,12 @@ class RandomEnumerator(Enumerator):
     _rand: Random
     _max_depth: int
     _builder: D.Builder
+    _grammar: S.GrammarTable
 
     def __init__(self, spec: S.TyrellSpec, max_depth: int, seed: Optional[int]=None):
         self._rand = Random(seed)
         self._builder = D.Builder(spec)
+        self._grammar = spec.grammar
         if max_depth <= 0:
             raise ValueError(
                 'Max depth cannot be non-positive: {}'.format(max_depth))
@@ -20,16 +22,16 @@ class RandomEnumerator(Enumerator):
 
     def _do_generate(self, curr_type: S.Type, curr_depth: int, force_leaf: bool):
         # First, get all the relevant production rules for current type
-        productions = self._builder.get_productions_with_lhs(curr_type)
+        g = self._grammar
+        productions = g.get_productions_with_lhs(curr_type)
         if force_leaf:
-            productions = list(
-                filter(lambda x: not x.is_function(), productions))
+            productions = [x for x in productions if g.is_leaf[x]]
         if len(productions) == 0:
             raise RuntimeError('RandomASTGenerator ran out of productions to try for type {} at depth {}'.format(
                 curr_type, curr_depth))
 
         # Pick a production rule uniformly at random
-        prod = self._rand.choice(productions)
+        prod = g.productions[self._rand.choice(productions)]
         if not prod.is_function():
             # make_node() will produce a leaf node
             return self._builder.make_node(prod)
@@ -0,0 +1,145 @@
+import math
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from ..logger import get_logger
+
+logger = get_logger('tyrell.enumerator.sketch_scheduler')
+
+# A position of a sketch: the index of a line and the name of the function on that line
+Position = Tuple[int, str]
+
+
+class SketchScheduler:
+    '''
+    Decides which sketch a `BidirectEnumerator` explores, and for how long.
+    A sketch is scored by the log of its prior likelihood, minus a penalty for the rate at which its candidates are blamed and for the time already spent on it.
+    The best sketch runs for a time slice, after which all sketches are ranked again,
+    so that a sketch that keeps producing failing candidates does not hold the solver until it is exhausted.
+    When a sketch is exhausted, every other sketch that contains the functions of its unsat core at the same lines is dropped as well.
+    '''
+
+    _sketches: List[str]
+    _prior: Dict[str, float]
+    _time: Dict[str, float]
+    _candidates: Dict[str, int]
+    _blamed: Dict[str, int]
+    _live: List[str]
+
+    def __init__(self, sketches: Iterable[str], priors: Optional[Sequence[float]] = None,
+                 time_slice: float = 0.2, blame_weight: float = 2.0, time_weight: float = 1.0,
+                 clock: Callable[[], float] = time.perf_counter):
+        '''
+        `priors` are positive weights aligned with `sketches`. By default, the sketches are assumed to be sorted from the most to the least likely,
+        as in an n-gram file, and the prior of the i-th one follows Zipf's law, i.e. it is proportional to 1/(i+1).
+        `time_slice` is in seconds, and `time_weight` is the penalty per second spent on a sketch.
+        '''
+        sketches = list(sketches)
+        if priors is None:
+            priors = [1.0 / (i + 1) for i in range(len(sketches))]
+        else:
+            priors = list(priors)
+            if len(priors) != len(sketches):
+                raise ValueError('Expected {} priors, got {}'.format(
+                    len(sketches), len(priors)))
+            for p in priors:
+                if p <= 0:
+                    raise ValueError('Priors must be positive: {}'.format(p))
+        if time_slice <= 0:
+            raise ValueError(
+                'Time slice must be positive: {}'.format(time_slice))
+        total = sum(priors)
+        self._sketches = []
+        self._prior = dict()
+        for sk, p in zip(sketches, priors):
+            # Duplicated sketches keep their first prior
+            if sk not in self._prior:
+                self._sketches.append(sk)
+                self._prior[sk] = math.log(p / total)
+        self._time = {sk: 0.0 for sk in self._sketches}
+        self._candidates = {sk: 0 for sk in self._sketches}
+        self._blamed = {sk: 0 for sk in self._sketches}
+        self._live = list(self._sketches)
+        self._time_slice = time_slice
+        self._blame_weight = blame_weight
+        self._time_weight = time_weight
+        self._clock = clock
+        self._current = None
+        self._slice_start = None
+        self._last = None
+        # number of times the current sketch changed, and number of sketches dropped because of the unsat core of another one
+        self.num_switches = 0
+        self.num_skipped = 0
+
+    @property
+    def sketches(self) -> List[str]:
+        return self._sketches
+
+    def is_live(self, sketch: str) -> bool:
+        '''Whether `sketch` may still have candidates'''
+        return sketch in self._live
+
+    def score(self, sketch: str) -> float:
+        # Laplace smoothing, so that a sketch is not judged by its first candidates
+        blame_rate = (self._blamed[sketch] + 1) / (self._candidates[sketch] + 2)
+        return self._prior[sketch] - self._blame_weight * blame_rate - self._time_weight * self._time[sketch]
+
+    def _charge(self) -> float:
+        now = self._clock()
+        if self._current is not None and self._last is not None:
+            self._time[self._current] += now - self._last
+        self._last = now
+        return now
+
+    def next_sketch(self) -> Optional[str]:
+        '''
+        The sketch to explore now, which is the current one until its time slice runs out.
+        Returns `None` if all sketches are exhausted.
+        '''
+        now = self._charge()
+        if self._current is not None and self._current in self._live and \
+                now - self._slice_start < self._time_slice:
+            return self._current
+        if len(self._live) == 0:
+            self._current = None
+            return None
+        # Ties go to the sketch that comes first
+        best = max(self._live, key=self.score)
+        if best != self._current:
+            logger.debug('Switching to sketch "{}" with score {:.3f}'.format(
+                best, self.score(best)))
+            self.num_switches += 1
+        self._current = best
+        self._slice_start = now
+        return best
+
+    def candidate(self, sketch: str) -> None:
+        '''Record that `sketch` produced a candidate'''
+        self._candidates[sketch] += 1
+
+    def blamed(self, sketch: str) -> None:
+        '''Record that a candidate of `sketch` was rejected with a blame'''
+        self._blamed[sketch] += 1
+
+    def exhausted(self, sketch: str, core: Optional[List[Position]] = None) -> None:
+        '''
+        Record that `sketch` has no candidate left.
+        If `core` is given, no sketch with these functions at these lines has any candidate left either.
+        '''
+        self._charge()
+        if sketch in self._live:
+            self._live.remove(sketch)
+        if sketch == self._current:
+            self._current = None
+        if core is None:
+            return
+
+        def covers(sk):
+            names = sk.split()
+            return all(line < len(names) and names[line] == name for line, name in core)
+
+        dead = [sk for sk in self._live if covers(sk)]
+        if len(dead) > 0:
+            logger.debug('Unsat core {} of sketch "{}" rules out {} other sketches'.format(
+                core, sketch, len(dead)))
+            self.num_skipped += len(dead)
+            self._live = [sk for sk in self._live if not covers(sk)]
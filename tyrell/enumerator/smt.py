@@ -1,9 +1,13 @@
 from z3 import *
-from collections import deque
+from collections import deque, OrderedDict
 from .enumerator import Enumerator
 from .optimizer import Optimizer
 
 from .. import dsl as D
+from ..spec import FunctionProperty
+from ..spec.grammar_table import EMPTY_TYPE_NAME
+from ..budget import Z3_NO_TIMEOUT
+from ..metrics import get_metrics
 from ..logger import get_logger
 
 logger = get_logger('tyrell.enumerator.smt')
@@ -19,30 +23,22 @@ class ASTNode:
         self.id = nb
         self.depth = depth
         self.children = children
+        self.parent = None
         self.production = None
+        # ids of the productions that may occur at this node, or None if any production may occur
+        self.domain = None
 
 
 # FIXME: Currently this enumerator requires an "Empty" production to function properly
 class SmtEnumerator(Enumerator):
-    # z3 solver
-    z3_solver = Solver()
-
-    # productions that are leaf
-    leaf_productions = []
-
-    # z3 variables for each production node
-    variables = []
-
-    # z3 variables to denote if a node is a function or not
-    variables_fun = []
-
-    # map from internal k-tree to nodes of program
-    program2tree = {}
+    # maximum number of enumerated programs that can still be rejected with update()
+    max_pending = 1024
 
     def initLeafProductions(self):
-        for p in self.spec.productions():
+        g = self.spec.grammar
+        for p in range(0, g.num_productions()):
             # FIXME: improve empty integration
-            if not p.is_function() or str(p).find('Empty') != -1:
+            if not g.is_function[p] or g.is_empty[p]:
                 self.leaf_productions.append(p)
 
     def createVariables(self, solver):
@@ -51,7 +47,11 @@ class SmtEnumerator(Enumerator):
             v = Int(name)
             self.variables.append(v)
             # variable range constraints
-            solver.add(And(v >= 0, v < self.spec.num_productions()))
+            domain = self.nodes[x].domain
+            if domain is None:
+                solver.add(And(v >= 0, v < self.spec.num_productions()))
+            else:
+                solver.add(Or([v == p for p in domain]))
             hname = 'h' + str(x + 1)
             h = Int(hname)
             self.variables_fun.append(h)
@@ -61,86 +61,217 @@ class SmtEnumerator(Enumerator):
     def createOutputConstraints(self, solver):
         '''The output production matches the output type'''
         ctr = None
-        for p in self.spec.get_productions_with_lhs(self.spec.output):
+        for p in self.spec.grammar.get_productions_with_lhs(self.spec.output):
             if ctr is None:
                 # variables[0] is the root of the tree
-                ctr = self.variables[0] == p.id
+                ctr = self.variables[0] == p
             else:
-                ctr = Or(ctr, self.variables[0] == p.id)
+                ctr = Or(ctr, self.variables[0] == p)
         solver.add(ctr)
 
     def createLocConstraints(self, solver):
         '''Exactly k functions are used in the program'''
+        if self.incremental:
+            # The bound is guarded by an assumption literal instead
+            self._createBoundLiterals()
+            return
         ctr = self.variables_fun[0]
         for x in range(1, len(self.variables_fun)):
             ctr += self.variables_fun[x]
         ctr_fun = ctr == self.loc
         solver.add(ctr_fun)
 
+    def _createBoundLiterals(self):
+        '''
+        Create the assumption literals of the current bounds.
+        Their guards are permanent, so they are only added when no temporary scope is open.
+        '''
+        assert self.z3_solver.num_scopes() == 0
+        self._get_loc_literal(self.loc)
+        self._get_depth_literal(self.depth)
+
+    def _get_loc_literal(self, loc):
+        '''Return the assumption literal that enforces exactly `loc` functions'''
+        lit = self.loc_literals.get(loc)
+        if lit is None:
+            assert self.z3_solver.num_scopes() == 0
+            lit = Bool('loc' + str(loc))
+            ctr = self.variables_fun[0]
+            for x in range(1, len(self.variables_fun)):
+                ctr += self.variables_fun[x]
+            self.z3_solver.add(Implies(lit, ctr == loc))
+            self.loc_literals[loc] = lit
+        return lit
+
+    def _get_depth_literal(self, depth):
+        '''
+        Return the assumption literal that cuts the k-tree at `depth`, or None if `depth` is the depth of the k-tree.
+        Nodes at the given depth are forced to be leaves, which in turn forces everything below them to be empty.
+        The root of the k-tree is always expanded, so depth 1 is the same as depth 2.
+        '''
+        depth = max(depth, 2)
+        if depth >= self.max_depth:
+            return None
+        lit = self.depth_literals.get(depth)
+        if lit is None:
+            assert self.z3_solver.num_scopes() == 0
+            lit = Bool('depth' + str(depth))
+            for x in range(0, len(self.nodes)):
+                if self.nodes[x].depth == depth:
+                    self.z3_solver.add(Implies(lit, self._leafConstraint(x)))
+            self.depth_literals[depth] = lit
+        return lit
+
+    def _assumptions(self):
+        if not self.incremental:
+            return []
+        lits = [self._get_loc_literal(self.loc)]
+        depth_lit = self._get_depth_literal(self.depth)
+        if depth_lit is not None:
+            lits.append(depth_lit)
+        return lits
+
+    def set_bounds(self, loc=None, depth=None):
+        '''
+        Move an incremental enumerator to a new LOC and/or depth bound.
+        The solver, the k-tree and all the clauses learned so far are kept.
+        '''
+        if not self.incremental:
+            raise RuntimeError(
+                'Bounds can only be changed on an incremental SmtEnumerator')
+        if loc is not None:
+            if loc <= 0:
+                raise ValueError(
+                    'LOC cannot be non-positive: {}'.format(loc))
+            self.loc = loc
+        if depth is not None:
+            if depth <= 0 or depth > self.max_depth:
+                raise ValueError(
+                    'Depth must be between 1 and {}: {}'.format(self.max_depth, depth))
+            self.depth = depth
+        self._createBoundLiterals()
+        # Costs are only monotone under a fixed bound
+        self.optimizer.bound = 0
+        self.model = None
+
+    def _nodeProductions(self, x):
+        '''Ids of the productions that may occur at the `x`-th node of the k-tree'''
+        domain = self.nodes[x].domain
+        return range(0, self.spec.grammar.num_productions()) if domain is None else domain
+
     def createInputConstraints(self, solver):
         '''Each input will appear at least once in the program'''
-        input_productions = self.spec.get_param_productions()
+        g = self.spec.grammar
+        input_productions = [p for p in range(
+            0, g.num_productions()) if g.is_param[p]]
         for x in range(0, len(input_productions)):
             ctr = None
             for y in range(0, len(self.nodes)):
+                if input_productions[x] not in self._nodeProductions(y):
+                    continue
                 if ctr is None:
-                    ctr = self.variables[y] == input_productions[x].id
+                    ctr = self.variables[y] == input_productions[x]
                 else:
-                    ctr = Or(self.variables[y] == input_productions[x].id, ctr)
-            solver.add(ctr)
+                    ctr = Or(self.variables[y] == input_productions[x], ctr)
+            # An input that no node can hold cannot be used, so there is no program at all
+            solver.add(ctr if ctr is not None else BoolVal(False))
 
     def createFunctionConstraints(self, solver):
         '''If a function occurs then set the function variable to 1 and 0 otherwise'''
         assert len(self.nodes) == len(self.variables_fun)
+        g = self.spec.grammar
         for x in range(0, len(self.nodes)):
-            for p in self.spec.productions():
+            for p in self._nodeProductions(x):
                 # FIXME: improve empty integration
-                if p.is_function() and str(p).find('Empty') == -1:
+                if g.is_function[p] and not g.is_empty[p]:
                     ctr = Implies(
-                        self.variables[x] == p.id, self.variables_fun[x] == 1)
+                        self.variables[x] == p, self.variables_fun[x] == 1)
                     solver.add(ctr)
                 else:
                     ctr = Implies(
-                        self.variables[x] == p.id, self.variables_fun[x] == 0)
+                        self.variables[x] == p, self.variables_fun[x] == 0)
                     solver.add(ctr)
 
+    def _leafConstraint(self, x):
+        ctr = self.variables[x] == self.leaf_productions[0]
+        for y in range(1, len(self.leaf_productions)):
+            ctr = Or(self.variables[x] ==
+                     self.leaf_productions[y], ctr)
+        return ctr
+
     def createLeafConstraints(self, solver):
         for x in range(0, len(self.nodes)):
             n = self.nodes[x]
             if n.children is None:
-                ctr = self.variables[x] == self.leaf_productions[0].id
-                for y in range(1, len(self.leaf_productions)):
-                    ctr = Or(self.variables[x] ==
-                             self.leaf_productions[y].id, ctr)
-                solver.add(ctr)
+                solver.add(self._leafConstraint(x))
 
     def createChildrenConstraints(self, solver):
+        g = self.spec.grammar
         for x in range(0, len(self.nodes)):
             n = self.nodes[x]
             if n.children is not None:
-                for p in self.spec.productions():
-                    assert len(n.children) > 0
+                assert len(n.children) > 0
+                for p in self._nodeProductions(x):
                     for y in range(0, len(n.children)):
-                        ctr = None
-                        child_type = 'Empty'
-                        if p.is_function() and y < len(p.rhs):
-                            child_type = str(p.rhs[y])
-                        for t in self.spec.get_productions_with_lhs(child_type):
-                            if ctr is None:
-                                ctr = self.variables[n.children[y].id - 1] == t.id
-                            else:
-                                ctr = Or(
-                                    ctr, self.variables[n.children[y].id - 1] == t.id)
-                            ctr = Implies(self.variables[x] == p.id, ctr)
-                        solver.add(ctr)
+                        child_type = EMPTY_TYPE_NAME
+                        if y < g.arity[p]:
+                            child_type = g.rhs[p][y]
+                        child_var = self.variables[n.children[y].id - 1]
+                        ctr = Or([child_var == t for t in g.get_productions_with_lhs(child_type)])
+                        solver.add(Implies(self.variables[x] == p, ctr))
+
+    def _subtreeEqual(self, a, b):
+        '''The subtrees rooted at k-tree nodes `a` and `b` hold the same program'''
+        ctr = [self.variables[a.id - 1] == self.variables[b.id - 1]]
+        if a.children is not None and b.children is not None:
+            for ca, cb in zip(a.children, b.children):
+                ctr.append(self._subtreeEqual(ca, cb))
+        return And(ctr)
+
+    def _subtreeLess(self, a, b):
+        '''The program at `a` is smaller than the program at `b` in pre-order lexicographic order of production ids'''
+        var_a = self.variables[a.id - 1]
+        var_b = self.variables[b.id - 1]
+        if a.children is None or b.children is None:
+            return var_a < var_b
+        # Equal productions have equal arities, so the unpaired children are all Empty
+        ctr = BoolVal(False)
+        for ca, cb in reversed(list(zip(a.children, b.children))):
+            ctr = Or(self._subtreeLess(ca, cb),
+                     And(self._subtreeEqual(ca, cb), ctr))
+        return Or(var_a < var_b, And(var_a == var_b, ctr))
+
+    def createSymmetryConstraints(self, solver):
+        '''
+        Only keep one program of each class of programs that are equivalent under the declared function properties.
+        The kept program is never larger or deeper than the ones that are blocked.
+        '''
+        for x in range(0, len(self.nodes)):
+            n = self.nodes[x]
+            if n.children is None or len(n.children) < 2:
+                continue
+            c0, c1 = n.children[0], n.children[1]
+            for p in self._nodeProductions(x):
+                p = self.spec.grammar.productions[p]
+                if not p.is_function() or not p.properties:
+                    continue
+                is_p = self.variables[x] == p.id
+                if p.has_property(FunctionProperty.COMMUTATIVE):
+                    # f(a, b) is kept only if a <= b
+                    ctr = Or(self._subtreeLess(c0, c1),
+                             self._subtreeEqual(c0, c1))
+                    solver.add(Implies(is_p, ctr))
+                if p.has_property(FunctionProperty.IDEMPOTENT):
+                    # f(a, a) is the same as the smaller program a
+                    solver.add(Not(And(is_p, self._subtreeEqual(c0, c1))))
+                if p.has_property(FunctionProperty.ASSOCIATIVE) and c1.children is not None:
+                    # f(l, f(a, b)) with a leaf l is the same as f(f(l, a), b), which is never deeper
+                    solver.add(Not(And(is_p, self.variables[c1.id - 1] == p.id,
+                                       self._leafConstraint(c0.id - 1))))
 
     def maxChildren(self) -> int:
         '''Finds the maximum number of children in the productions'''
-        max = 0
-        for p in self.spec.productions():
-            if len(p.rhs) > max:
-                max = len(p.rhs)
-        return max
+        return max(self.spec.grammar.arity, default=0)
 
     def buildKTree(self, children, depth):
         '''Builds a K-tree that will contain the program'''
@@ -158,12 +289,59 @@ class SmtEnumerator(Enumerator):
             for x in range(0, children):
                 nb += 1
                 c = ASTNode(nb, current.depth + 1)
+                c.parent = current
                 nodes.append(c)
                 current.children.append(c)
                 if c.depth < depth:
                     d.append(c)
         return tree, nodes
 
+    def buildSparseKTree(self, depth):
+        '''
+        Builds a K-tree whose shape follows the grammar.
+        Each node only holds the productions whose LHS type may occur there, and only gets as many children as the widest function among them.
+        As in the complete k-tree, the root is always expanded, so depth 1 is the same as depth 2.
+        '''
+        depth = max(depth, 2)
+        g = self.spec.grammar
+        empty_productions = g.get_productions_with_lhs(EMPTY_TYPE_NAME)
+        nodes = []
+        tree = AST()
+        root = ASTNode(1, 1)
+        tree.head = root
+        nodes.append(root)
+        d = deque()
+        d.append((root, [g.get_type_id(self.spec.output)]))
+        while len(d) != 0:
+            current, types = d.popleft()
+            domain = []
+            for ty in types:
+                for p in g.get_productions_with_lhs(ty):
+                    if g.is_function[p] and current.depth >= depth:
+                        continue
+                    if p not in domain:
+                        domain.append(p)
+            if current.depth > 1:
+                domain += [p for p in empty_productions if p not in domain]
+            current.domain = domain
+            # FIXME: improve empty integration
+            functions = [p for p in domain if g.is_function[p] and not g.is_empty[p]]
+            arity = max([g.arity[p] for p in functions], default=0)
+            if arity == 0:
+                continue
+            current.children = []
+            for y in range(0, arity):
+                child_types = []
+                for p in functions:
+                    if y < g.arity[p] and g.rhs[p][y] not in child_types:
+                        child_types.append(g.rhs[p][y])
+                c = ASTNode(len(nodes) + 1, current.depth + 1)
+                c.parent = current
+                nodes.append(c)
+                current.children.append(c)
+                d.append((c, child_types))
+        return tree, nodes
+
     @staticmethod
     def _check_arg_types(pred, python_tys):
         if pred.num_args() < len(python_tys):
@@ -219,24 +397,57 @@ class SmtEnumerator(Enumerator):
             msg = 'Failed to resolve predicates. {}'.format(e)
             raise RuntimeError(msg) from None
 
-    def __init__(self, spec, depth=None, loc=None):
+    def __init__(self, spec, depth=None, loc=None, incremental=False, sparse=True, lift_lemmas=False, lemma_cache=None, optimizer='core'):
+        '''
+        If `incremental` is set, `depth` is the depth of the k-tree and the LOC/depth bounds are enforced through assumption literals,
+        so that `set_bounds()` can sweep them on the same solver.
+        If `sparse` is set, the shape of the k-tree and the domain of each node are derived from the types in the grammar.
+        Otherwise a complete k-tree with the maximum arity is used.
+        If `lift_lemmas` is set, a blame that covers a connected subtree below the root is blocked at every position of the k-tree where it fits.
+        If a `lemma_cache` is given, the lemmas it holds for the task are blocked upfront, and new lemmas are added to it.
+        `optimizer` is the engine that minimizes the cost of the soft predicates: 'core' (core-guided), 'lsu' (linear search) or 'z3' (z3's Optimize).
+        '''
+        # All the solver state is per instance, so that enumerators do not leak into each other
+        # z3 solver
         self.z3_solver = Solver()
+        # productions that are leaf
         self.leaf_productions = []
+        # z3 variables for each production node
         self.variables = []
+        # z3 variables to denote if a node is a function or not
         self.variables_fun = []
+        # map from internal k-tree to nodes of program
         self.program2tree = {}
+        # models of the recently enumerated programs that may still be rejected
+        self.pending = OrderedDict()
+        self.loc_literals = {}
+        self.depth_literals = {}
+        self.incremental = incremental
+        self.lift_lemmas = lift_lemmas
+        # number of blames that have been lifted and the number of clauses they added
+        self.num_lifted = 0
+        self.num_lifted_clauses = 0
         self.spec = spec
         if depth <= 0:
             raise ValueError(
                 'Depth cannot be non-positive: {}'.format(depth))
         self.depth = depth
+        self.max_depth = depth
         if loc <= 0:
             raise ValueError(
                 'LOC cannot be non-positive: {}'.format(loc))
         self.loc = loc
+        self.sparse = sparse
         self.max_children = self.maxChildren()
-        self.tree, self.nodes = self.buildKTree(self.max_children, self.depth)
+        if self.sparse:
+            self.tree, self.nodes = self.buildSparseKTree(self.depth)
+        else:
+            self.tree, self.nodes = self.buildKTree(
+                self.max_children, self.depth)
         self.model = None
+        self.builder = D.Builder(self.spec)
+        # production ids and AST nodes of each k-tree node in the last decoded model
+        self.last_decoded = (None, None)
         self.initLeafProductions()
         self.createVariables(self.z3_solver)
         self.createOutputConstraints(self.z3_solver)
@@ -245,74 +456,239 @@ class SmtEnumerator(Enumerator):
         self.createFunctionConstraints(self.z3_solver)
         self.createLeafConstraints(self.z3_solver)
         self.createChildrenConstraints(self.z3_solver)
+        self.createSymmetryConstraints(self.z3_solver)
         self.optimizer = Optimizer(
-            self.z3_solver, spec, self.variables, self.nodes)
+            self.z3_solver, spec, self.variables, self.nodes, optimizer)
         self.resolve_predicates()
+        self.lemma_cache = lemma_cache
+        if self.lemma_cache is not None:
+            # The meaning of a position only depends on the shape of the k-tree, so the lemmas are shared across LOC bounds
+            self.lemma_key = lemma_cache.key(
+                spec, ('smt', self.max_depth, self.sparse))
+            self.preloadLemmas()
+
+    def preloadLemmas(self):
+        for lemma in self.lemma_cache.load(self.lemma_key):
+            if all(isinstance(x, int) and 0 < x <= len(self.nodes) and p in self._nodeProductions(x - 1)
+                   for x, p in lemma):
+                self._addLemma(lemma)
+            else:
+                logger.warning(
+                    'Skipping a cached lemma that does not fit the k-tree: {}'.format(lemma))
 
-    def blockModel(self):
-        assert(self.model is not None)
-        # m = self.z3_solver.model()
+    def blockModel(self, model=None):
+        if model is None:
+            model = self.model
+        assert(model is not None)
         block = []
         # block the model using only the variables that correspond to productions
         for x in self.variables:
-            block.append(x != self.model[x])
+            block.append(x != model[x])
         ctr = Or(block)
         self.z3_solver.add(ctr)
 
-    def update(self, info=None):
+    def _remember(self, prog):
+        '''Keep the model of `prog` around so that it can still be rejected after other programs are enumerated'''
+        self.pending[prog] = (self.model, self.program2tree)
+        while len(self.pending) > self.max_pending:
+            self.pending.popitem(last=False)
+
+    def update(self, info=None, prog=None):
+        self._check_open()
+        model, program2tree = self.model, self.program2tree
+        if prog is not None:
+            if prog not in self.pending:
+                raise KeyError(
+                    'Program is not pending in the enumerator: {}'.format(prog))
+            model, program2tree = self.pending.pop(prog)
         # TODO: block more than one model
         # self.blockModel() # do I need to block the model anyway?
         if info is not None and not isinstance(info, str):
             for core in info:
-                ctr = None
-                for constraint in core:
-                    if ctr is None:
-                        ctr = self.variables[self.program2tree[constraint[0]
-                                                               ].id - 1] != constraint[1].id
-                    else:
-                        ctr = Or(
-                            ctr, self.variables[self.program2tree[constraint[0]].id - 1] != constraint[1].id)
-                self.z3_solver.add(ctr)
+                lemma = [(program2tree[constraint[0]].id, constraint[1].id)
+                         for constraint in core]
+                self._addLemma(lemma)
+                if self.lemma_cache is not None:
+                    self.lemma_cache.append(self.lemma_key, lemma)
         else:
-            self.blockModel()
-
-    def buildProgram(self):
-        result = [0] * len(self.model)
-        for x in self.model:
-            c = x()
-            a = str(x)
-            if a[:1] == 'n':
-                result[int(a[1:]) - 1] = int(str(self.model[c]))
+            self.blockModel(model)
+
+    def _addLemma(self, lemma):
+        '''Block the productions in `lemma`, a list of (k-tree node id, production id) pairs, from occurring together'''
+        if self.lift_lemmas:
+            lemmas = self._liftLemma(lemma)
+            if lemmas is not None:
+                self.num_lifted += 1
+                self.num_lifted_clauses += len(lemmas)
+                get_metrics().incr('lemma_clauses', len(lemmas))
+                for ctr in lemmas:
+                    self.z3_solver.add(ctr)
+                return
+        ctr = None
+        for x, p in lemma:
+            if ctr is None:
+                ctr = self.variables[x - 1] != p
+            else:
+                ctr = Or(ctr, self.variables[x - 1] != p)
+        get_metrics().incr('lemma_clauses')
+        self.z3_solver.add(ctr)
 
-        self.program2tree.clear()
+    def _liftLemma(self, lemma):
+        '''
+        Block `lemma` at every position of the k-tree where it fits.
+        Return None if the blamed nodes do not form a connected subtree, or if they include the root, whose constraints depend on the output.
+        '''
+        positions = [self.nodes[x - 1] for x, _ in lemma]
+        ids = set(n.id for n in positions)
+        if self.nodes[0].id in ids:
+            return None
+        tops = set(n.id for n in positions if n.parent.id not in ids)
+        if len(tops) != 1:
+            return None
+        top = self.nodes[tops.pop() - 1]
+
+        # The child slots that lead from the top of the subtree to each blamed node
+        paths = []
+        for n in positions:
+            path = []
+            while n is not top:
+                path.append(n.parent.children.index(n))
+                n = n.parent
+            path.reverse()
+            paths.append(path)
+
+        lemmas = []
+        for root in self.nodes:
+            ctr = []
+            for path, (_, prod) in zip(paths, lemma):
+                n = root
+                for slot in path:
+                    if n.children is None or slot >= len(n.children):
+                        n = None
+                        break
+                    n = n.children[slot]
+                if n is None or prod not in self._nodeProductions(n.id - 1):
+                    # The lemma cannot occur at this position
+                    ctr = None
+                    break
+                ctr.append(self.variables[n.id - 1] != prod)
+            if ctr is not None:
+                lemmas.append(Or(ctr))
+        return lemmas
 
-        code = []
-        for n in self.nodes:
-            prod = self.spec.get_production_or_raise(result[n.id - 1])
-            code.append(prod)
+    def buildProgram(self):
+        '''Decode the current model into an AST, sharing the subtrees that are the same as in the previously decoded model'''
+        result = [self.model.eval(v, model_completion=True).as_long()
+                  for v in self.variables]
+        prev_result, prev_nodes = self.last_decoded
+        is_empty = self.spec.grammar.is_empty
 
-        builder = D.Builder(self.spec)
+        self.program2tree = {}
         builder_nodes = [None] * len(self.nodes)
-        for x in range(0, len(self.nodes)):
-            y = len(self.nodes) - x - 1
-            if str(code[self.nodes[y].id - 1]).find('Empty') == -1:
+        changed = [True] * len(self.nodes)
+        for y in range(len(self.nodes) - 1, -1, -1):
+            n = self.nodes[y]
+            prod_id = result[y]
+            changed[y] = prev_result is None or prev_result[y] != prod_id
+            if n.children is not None:
+                for c in n.children:
+                    changed[y] = changed[y] or changed[c.id - 1]
+            if is_empty[prod_id]:
+                continue
+            if changed[y]:
                 children = []
-                if self.nodes[y].children is not None:
-                    for c in self.nodes[y].children:
-                        if str(code[c.id - 1]).find('Empty') == -1:
+                if n.children is not None:
+                    for c in n.children:
+                        if not is_empty[result[c.id - 1]]:
                             assert builder_nodes[c.id - 1] is not None
                             children.append(builder_nodes[c.id - 1])
-                n = code[self.nodes[y].id - 1].id
-                builder_nodes[y] = builder.make_node(n, children)
-                self.program2tree[builder_nodes[y]] = self.nodes[y]
+                builder_nodes[y] = self.builder.make_node(prod_id, children)
+            else:
+                builder_nodes[y] = prev_nodes[y]
+            self.program2tree[builder_nodes[y]] = n
 
         assert(builder_nodes[0] is not None)
+        self.last_decoded = (result, builder_nodes)
+        self._remember(builder_nodes[0])
         return builder_nodes[0]
 
+    def _check_open(self):
+        if self.z3_solver is None:
+            raise RuntimeError('Enumerator has been closed')
+
+    def close(self):
+        '''Drop the solver, the k-tree and the decoded programs, so that they can be freed right away'''
+        if self.z3_solver is None:
+            return
+        # ASTNodes point to their parents, so the k-tree would otherwise wait for the cycle collector
+        for n in self.nodes:
+            n.parent = None
+            n.children = None
+        self.z3_solver = None
+        self.optimizer = None
+        self.variables = []
+        self.variables_fun = []
+        self.loc_literals = {}
+        self.depth_literals = {}
+        self.tree = None
+        self.nodes = []
+        self.model = None
+        self.program2tree = {}
+        self.pending = OrderedDict()
+        self.last_decoded = (None, None)
+
+    def set_budget(self, budget):
+        self._check_open()
+        super().set_budget(budget)
+        self.optimizer.budget = budget
+        if budget is None:
+            self.z3_solver.set('timeout', Z3_NO_TIMEOUT)
+
     def next(self):
+        self._check_open()
         while True:
-            self.model = self.optimizer.optimize(self.z3_solver)
+            with get_metrics().timer('solve'):
+                self.model = self.optimizer.optimize(
+                    self.z3_solver, self._assumptions())
             if self.model is not None:
-                return self.buildProgram()
+                with get_metrics().timer('decode'):
+                    return self.buildProgram()
             else:
                 return None
+
+    def next_batch(self, k):
+        '''
+        Enumerate up to `k` distinct programs with a single pass over the solver.
+        The programs are only blocked inside of a temporary scope, so the ones that are not rejected with `update()` may be enumerated again.
+        '''
+        self._check_open()
+        if k <= 0:
+            raise ValueError('Batch size must be positive: {}'.format(k))
+        if k > self.max_pending:
+            raise ValueError(
+                'Batch size cannot exceed {}: {}'.format(self.max_pending, k))
+        metrics = get_metrics()
+        progs = []
+        bound = self.optimizer.bound
+        # The guards of the bound literals must not be scoped, or they would be gone after the pop
+        assumptions = self._assumptions()
+        self.z3_solver.push()
+        try:
+            while len(progs) < k:
+                with metrics.timer('solve'):
+                    self.model = self.optimizer.optimize(
+                        self.z3_solver, assumptions)
+                if self.model is None:
+                    break
+                if len(progs) == 0:
+                    bound = self.optimizer.bound
+                with metrics.timer('decode'):
+                    progs.append(self.buildProgram())
+                self.blockModel()
+        finally:
+            self.z3_solver.pop()
+        # The unrejected programs are allowed again, so the optimum goes back to the cost of the first one
+        self.optimizer.bound = bound
+        if len(progs) > 0:
+            self.model, self.program2tree = self.pending[progs[-1]]
+        return progs
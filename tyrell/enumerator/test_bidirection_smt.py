@@ -0,0 +1,99 @@
+import unittest
+from .. import spec as S
+from ..dsl import dfs
+from .bidirection_smt import BidirectEnumerator
+
+spec_str = r'''
+    value Table;
+
+    program Pipeline(Table) -> Table;
+    func inc: Table -> Table;
+    func dbl: Table -> Table;
+    func neg: Table -> Table;
+'''
+spec = S.parse(spec_str)
+
+
+def enumerate_all(enumerator):
+    progs = []
+    prog = enumerator.next()
+    while prog is not None:
+        progs.append(str(prog))
+        enumerator.update()
+        prog = enumerator.next()
+    return progs
+
+
+class TestBidirectEnumerator(unittest.TestCase):
+
+    def test_sketch_queue(self):
+        enumerator = BidirectEnumerator(
+            spec, depth=3, loc=2, sk_queue=['inc dbl', 'neg inc'])
+        self.assertEqual(enumerate_all(enumerator), [
+                         'dbl(inc(@param0))', 'inc(neg(@param0))'])
+
+    def test_set_sketch(self):
+        enumerator = BidirectEnumerator(spec, depth=3, loc=2)
+        self.assertIsNone(enumerator.next())
+        enumerator.set_sketch('dbl neg')
+        self.assertEqual(enumerate_all(enumerator), ['neg(dbl(@param0))'])
+        # Rejected programs stay rejected when their sketch comes back
+        enumerator.set_sketch('inc inc')
+        enumerator.set_sketch('dbl neg')
+        self.assertIsNone(enumerator.next())
+
+    def test_lemmas_across_sketches(self):
+        for count_pruned in [False, True]:
+            enumerator = BidirectEnumerator(
+                spec, depth=3, loc=2, sk_queue=['neg inc', 'neg dbl', 'inc neg'], count_pruned=count_pruned)
+            prog = enumerator.next()
+            self.assertEqual(str(prog), 'inc(neg(@param0))')
+            # Blame the neg on the first line, which rules out the next sketch as well
+            neg = prog.args[0]
+            enumerator.update([[(neg, neg.production)]])
+            self.assertEqual(enumerate_all(enumerator), ['neg(inc(@param0))'])
+            self.assertEqual(enumerator.num_lemmas, 1)
+            self.assertEqual(enumerator.num_pruned, 1 if count_pruned else 0)
+
+    def test_next_batch(self):
+        enumerator = BidirectEnumerator(
+            spec, depth=3, loc=2, sk_queue=['inc dbl', 'neg inc'])
+        self.assertEqual([str(x) for x in enumerator.next_batch(2)], ['dbl(inc(@param0))'])
+        # A program that is not rejected keeps its sketch alive
+        batch = enumerator.next_batch(2)
+        self.assertEqual([str(x) for x in batch], ['dbl(inc(@param0))'])
+        enumerator.update(prog=batch[0])
+        self.assertEqual([str(x) for x in enumerator.next_batch(2)], ['inc(neg(@param0))'])
+
+    def test_shared_line(self):
+        binary_spec = S.parse(r'''
+            value Table;
+
+            program Pipeline(Table) -> Table;
+            func inc: Table -> Table;
+            func plus: Table -> Table, Table;
+        ''')
+        enumerator = BidirectEnumerator(binary_spec, depth=3, loc=2, sk_queue=['inc plus'])
+        enumerator.max_stmt_nodes = 4
+        progs = []
+        prog = enumerator.next()
+        while prog is not None:
+            # A line that is used twice gives two distinct nodes
+            nodes = list(dfs(prog))
+            self.assertEqual(len({id(x) for x in nodes}), len(nodes))
+            self.assertLessEqual(len(enumerator.stmt_nodes), 4)
+            progs.append(str(prog))
+            enumerator.update()
+            prog = enumerator.next()
+        self.assertIn('plus(inc(@param0), inc(@param0))', progs)
+
+    def test_invalid_sketch(self):
+        enumerator = BidirectEnumerator(spec, depth=3, loc=2)
+        with self.assertRaises(ValueError):
+            enumerator.set_sketch('inc sqrt')
+        with self.assertRaises(ValueError):
+            enumerator.set_sketch('inc')
+
+
+if __name__ == '__main__':
+    unittest.main()
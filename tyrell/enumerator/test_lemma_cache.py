@@ -0,0 +1,84 @@
+import os
+import time
+import tempfile
+import unittest
+from .. import spec as S
+from .smt import SmtEnumerator
+from .lemma_cache import LemmaCache
+from .test_smt import spec, spec_str
+
+
+class TestLemmaCache(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.directory = self._dir.name
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_key(self):
+        cache = LemmaCache(self.directory, [(['a'], 'b')])
+        key = cache.key(spec, ('smt', 3))
+        self.assertEqual(key, cache.key(S.parse(spec_str), ('smt', 3)))
+        self.assertNotEqual(key, cache.key(spec, ('smt', 4)))
+        self.assertNotEqual(key, cache.key(S.parse(spec_str.replace(
+            'func plus', '@associative func plus')), ('smt', 3)))
+        other = LemmaCache(self.directory, [(['a'], 'c')])
+        self.assertNotEqual(key, other.key(spec, ('smt', 3)))
+
+    def test_load_append(self):
+        cache = LemmaCache(self.directory, None, max_lemmas=2)
+        self.assertListEqual(cache.load('task'), [])
+        cache.append('task', [(2, 1), (4, 5)])
+        cache.append('task', [(2, 1), (4, 5)])
+        cache.append('task', [('arg0@1', 3)])
+        cache.append('task', [(3, 1)])
+        # Simulate an interrupted write
+        with open(os.path.join(self.directory, 'task.jsonl'), 'a') as f:
+            f.write('[[1, ')
+        lemmas = LemmaCache(self.directory, None).load('task')
+        self.assertListEqual(lemmas, [[(2, 1), (4, 5)], [('arg0@1', 3)]])
+
+    def test_eviction(self):
+        cache = LemmaCache(self.directory, None, max_tasks=2)
+        cache.append('a', [(1, 1)])
+        cache.append('b', [(1, 1)])
+        # Make sure that the modification times differ
+        old = time.time() - 10
+        os.utime(os.path.join(self.directory, 'a.jsonl'), (old, old))
+        os.utime(os.path.join(self.directory, 'b.jsonl'), (old - 10, old - 10))
+        cache.load('a')
+        cache.append('c', [(1, 1)])
+        self.assertCountEqual(os.listdir(self.directory), ['a.jsonl', 'c.jsonl'])
+
+    def test_preload(self):
+        def count_matches(enumerator, lemma):
+            '''Number of enumerated programs that have all productions of `lemma` at its positions'''
+            ret = 0
+            prog = enumerator.next()
+            while prog is not None:
+                if all(enumerator.model[enumerator.variables[x - 1]].as_long() == p for x, p in lemma):
+                    ret += 1
+                enumerator.update()
+                prog = enumerator.next()
+            return ret
+
+        cache = LemmaCache(self.directory, None)
+        enumerator = SmtEnumerator(spec, depth=4, loc=2, lemma_cache=cache)
+        prog = enumerator.next()
+        blame = [(prog, prog.production)] + \
+            [(x, x.production) for x in prog.args]
+        enumerator.update([blame])
+        lemma = [(enumerator.program2tree[x].id, p.id) for x, p in blame]
+        self.assertGreater(count_matches(
+            SmtEnumerator(spec, depth=4, loc=3), lemma), 0)
+
+        # The lemma is shared across LOC bounds, but not across k-tree shapes
+        self.assertEqual(count_matches(SmtEnumerator(
+            spec, depth=4, loc=3, lemma_cache=LemmaCache(self.directory, None)), lemma), 0)
+        self.assertGreater(count_matches(SmtEnumerator(
+            spec, depth=4, loc=3, sparse=False, lemma_cache=LemmaCache(self.directory, None)), lemma), 0)
+
+if __name__ == '__main__':
+    unittest.main()
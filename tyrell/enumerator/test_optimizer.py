@@ -0,0 +1,72 @@
+import unittest
+from z3 import Solver
+from .. import spec as S
+from .smt import SmtEnumerator
+from .optimizer import Optimizer
+
+spec_str = r'''
+    enum SmallInt {
+      "0", "1"
+    }
+    value Int;
+    value Empty;
+
+    program Toy(Int, Int) -> Int;
+    func const: Int -> SmallInt;
+    func plus: Int -> Int, Int;
+    func minus: Int -> Int, Int;
+    func mult: Int -> Int, Int;
+    func empty: Empty -> Empty;
+
+    predicate occurs(mult, 70);
+    predicate not_occurs(const, 30);
+    predicate is_parent(plus, minus, 40);
+'''
+spec = S.parse(spec_str)
+
+
+class TestOptimizer(unittest.TestCase):
+
+    def test_next_achievable(self):
+        optimizer = Optimizer(Solver(), spec, [], [])
+        self.assertIsNone(optimizer.next_achievable(0))
+        for weight in [40, 70, 30]:
+            optimizer.mk_relax_var(weight)
+        bounds = []
+        bound = optimizer.next_achievable(0)
+        while bound is not None:
+            bounds.append(bound)
+            bound = optimizer.next_achievable(bound)
+        self.assertListEqual(bounds, [30, 40, 70, 100, 110, 140])
+        self.assertEqual(optimizer.ub, 140)
+
+    def test_invalid_engine(self):
+        with self.assertRaises(ValueError):
+            Optimizer(Solver(), spec, [], [], engine='foo')
+
+    def _enumerate(self, engine, depth, loc):
+        enumerator = SmtEnumerator(
+            spec, depth=depth, loc=loc, optimizer=engine)
+        progs = []
+        prog = enumerator.next()
+        while prog is not None:
+            cost = enumerator.optimizer.computeCost(enumerator.model)
+            progs.append((cost, str(prog)))
+            enumerator.update()
+            prog = enumerator.next()
+        # Programs are enumerated by increasing cost
+        costs = [x[0] for x in progs]
+        self.assertListEqual(costs, sorted(costs))
+        self.assertGreater(costs[-1], 0)
+        return sorted(progs)
+
+    def test_engines(self):
+        # z3's Optimize is only checked on a small space as it is much slower
+        for depth, loc, engines in [(2, 1, ['lsu', 'core', 'z3']), (3, 2, ['lsu', 'core'])]:
+            expected = self._enumerate(engines[0], depth, loc)
+            for engine in engines[1:]:
+                self.assertListEqual(
+                    self._enumerate(engine, depth, loc), expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+from .bidirection_smt import BidirectEnumerator
+from .sketch_scheduler import SketchScheduler
+from .test_bidirection_smt import spec, enumerate_all
+
+sketches = [x + ' ' + y for x in ['neg', 'inc', 'dbl']
+            for y in ['neg', 'inc', 'dbl']]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSketchScheduler(unittest.TestCase):
+
+    def test_time_slices(self):
+        clock = FakeClock()
+        scheduler = SketchScheduler(
+            ['a b', 'c d'], time_slice=1.0, time_weight=1.0, clock=clock)
+        self.assertEqual(scheduler.next_sketch(), 'a b')
+        clock.now = 0.5
+        self.assertEqual(scheduler.next_sketch(), 'a b')
+        # The prior of the first sketch is worth log(2) seconds
+        clock.now = 1.0
+        self.assertEqual(scheduler.next_sketch(), 'c d')
+        clock.now = 2.0
+        self.assertEqual(scheduler.next_sketch(), 'a b')
+        self.assertEqual(scheduler.num_switches, 3)
+
+    def test_blame_rate(self):
+        scheduler = SketchScheduler(['a b', 'c d'], clock=FakeClock())
+        self.assertEqual(scheduler.next_sketch(), 'a b')
+        for _ in range(10):
+            scheduler.candidate('a b')
+            scheduler.blamed('a b')
+        self.assertLess(scheduler.score('a b'), scheduler.score('c d'))
+
+    def test_exhausted(self):
+        scheduler = SketchScheduler(
+            ['a b', 'a c', 'b a', 'c c'], clock=FakeClock())
+        self.assertEqual(scheduler.next_sketch(), 'a b')
+        scheduler.exhausted('a b', [(0, 'a')])
+        self.assertFalse(scheduler.is_live('a c'))
+        self.assertEqual(scheduler.num_skipped, 1)
+        self.assertEqual(scheduler.next_sketch(), 'b a')
+        scheduler.exhausted('b a')
+        # An empty core rules out everything
+        self.assertEqual(scheduler.next_sketch(), 'c c')
+        scheduler.exhausted('c c', [])
+        self.assertIsNone(scheduler.next_sketch())
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            SketchScheduler(['a b'], priors=[1.0, 2.0])
+        with self.assertRaises(ValueError):
+            SketchScheduler(['a b'], priors=[0.0])
+        with self.assertRaises(ValueError):
+            SketchScheduler(['a b'], time_slice=0)
+
+    def test_enumerator(self):
+        expected = enumerate_all(BidirectEnumerator(
+            spec, depth=3, loc=2, sk_queue=list(sketches)))
+        # A tiny time slice switches sketches at almost every program
+        scheduler = SketchScheduler(sketches, time_slice=1e-9)
+        enumerator = BidirectEnumerator(
+            spec, depth=3, loc=2, scheduler=scheduler)
+        self.assertCountEqual(enumerate_all(enumerator), expected)
+        self.assertIsNone(scheduler.next_sketch())
+
+        scheduler = SketchScheduler(sketches)
+        enumerator = BidirectEnumerator(
+            spec, depth=3, loc=2, scheduler=scheduler)
+        prog = enumerator.next()
+        self.assertEqual(str(prog), 'neg(neg(@param0))')
+        # Blaming neg on the first line rules out the other sketches that start with neg
+        neg = prog.args[0]
+        enumerator.update([[(neg, neg.production)]])
+        self.assertEqual(len(enumerate_all(enumerator)), len(sketches) - 3)
+        self.assertEqual(scheduler.num_skipped, 2)
+
+        with self.assertRaises(ValueError):
+            BidirectEnumerator(spec, depth=3, loc=2,
+                               sk_queue=sketches, scheduler=scheduler)
+
+
+if __name__ == '__main__':
+    unittest.main()
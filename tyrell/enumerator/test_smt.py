@@ -0,0 +1,284 @@
+import unittest
+from .. import spec as S
+from .smt import SmtEnumerator
+
+spec_str = r'''
+    enum ConstStr {
+      "_apple_", "_banana_"
+    }
+    value Empty;
+    value Str;
+
+    program Toy(Str, Str) -> Str;
+    func const: Str -> ConstStr;
+    func plus: Str -> Str, Str;
+    func empty: Empty -> Empty;
+'''
+spec = S.parse(spec_str)
+
+
+def enumerate_programs(enumerator):
+    progs = []
+    prog = enumerator.next()
+    while prog is not None:
+        progs.append(prog)
+        enumerator.update()
+        prog = enumerator.next()
+    return progs
+
+
+def enumerate_all(enumerator):
+    return [str(prog) for prog in enumerate_programs(enumerator)]
+
+
+def flatten(prog, name):
+    '''Leaves of the maximal `name` subtree at `prog`, from left to right'''
+    if prog.is_apply() and prog.name == name:
+        return flatten(prog.args[0], name) + flatten(prog.args[1], name)
+    return [str(prog)]
+
+
+class TestSmtEnumerator(unittest.TestCase):
+
+    def test_exhaustive(self):
+        progs = enumerate_all(SmtEnumerator(spec, depth=2, loc=1))
+        self.assertCountEqual(
+            progs, ['plus(@param0, @param1)', 'plus(@param1, @param0)'])
+
+    def test_sparse_tree(self):
+        for depth, loc in [(2, 1), (3, 2), (4, 3)]:
+            full = SmtEnumerator(spec, depth=depth, loc=loc, sparse=False)
+            sparse = SmtEnumerator(spec, depth=depth, loc=loc)
+            self.assertLessEqual(len(sparse.nodes), len(full.nodes))
+            self.assertCountEqual(enumerate_all(sparse), enumerate_all(full))
+
+    def test_depth_one(self):
+        # The root is always expanded, so depth 1 is the same as depth 2
+        expected = enumerate_all(SmtEnumerator(spec, depth=2, loc=1))
+        for sparse in [True, False]:
+            self.assertCountEqual(
+                enumerate_all(SmtEnumerator(spec, depth=1, loc=1, sparse=sparse)), expected)
+        enumerator = SmtEnumerator(spec, depth=3, loc=1, incremental=True)
+        enumerator.set_bounds(depth=1)
+        self.assertCountEqual(enumerate_all(enumerator), expected)
+
+    def test_unusable_input(self):
+        unusable_spec = S.parse(r'''
+            value Str;
+            value Num;
+
+            program Toy(Str, Num) -> Str;
+            func plus: Str -> Str, Str;
+        ''')
+        for sparse in [True, False]:
+            self.assertIsNone(SmtEnumerator(unusable_spec, depth=2, loc=1, sparse=sparse).next())
+
+    def test_incremental_sweep(self):
+        enumerator = SmtEnumerator(spec, depth=3, loc=1, incremental=True)
+        for loc in range(1, 4):
+            seen = set()
+            for depth in range(2, 4):
+                enumerator.set_bounds(loc=loc, depth=depth)
+                expected = enumerate_all(
+                    SmtEnumerator(spec, depth=depth, loc=loc))
+                # Programs blocked under a smaller depth are not enumerated again
+                expected = [x for x in expected if x not in seen]
+                actual = enumerate_all(enumerator)
+                self.assertCountEqual(actual, expected)
+                seen.update(actual)
+
+    def test_incremental_keeps_lemmas(self):
+        enumerator = SmtEnumerator(spec, depth=3, loc=1, incremental=True)
+        blocked = enumerate_all(enumerator)
+        self.assertEqual(len(blocked), 2)
+        enumerator.set_bounds(loc=2)
+        enumerate_all(enumerator)
+        enumerator.set_bounds(loc=1)
+        self.assertIsNone(enumerator.next())
+
+    def test_invalid_bounds(self):
+        with self.assertRaises(RuntimeError):
+            SmtEnumerator(spec, depth=3, loc=1).set_bounds(loc=2)
+        enumerator = SmtEnumerator(spec, depth=3, loc=1, incremental=True)
+        with self.assertRaises(ValueError):
+            enumerator.set_bounds(depth=4)
+        with self.assertRaises(ValueError):
+            enumerator.set_bounds(loc=0)
+
+    def test_decode(self):
+        enumerator = SmtEnumerator(spec, depth=4, loc=3)
+        prev_nodes = set()
+        num_shared = 0
+        prog = enumerator.next()
+        while prog is not None:
+            nodes = []
+            stack = [prog]
+            while len(stack) > 0:
+                node = stack.pop()
+                nodes.append(node)
+                stack.extend(node.children)
+            # Every AST node matches the production of its k-tree node in the model
+            self.assertEqual(len(enumerator.program2tree), len(nodes))
+            for node in nodes:
+                var = enumerator.variables[enumerator.program2tree[node].id - 1]
+                self.assertEqual(
+                    enumerator.model[var].as_long(), node.production.id)
+            num_shared += len(prev_nodes.intersection(nodes))
+            prev_nodes = set(nodes)
+            enumerator.update()
+            prog = enumerator.next()
+        # Unchanged subtrees are reused from the previous program
+        self.assertGreater(num_shared, 0)
+
+    def _find_inner_plus(self, enumerator):
+        '''Enumerate until a program has a non-root plus whose first argument is @param0'''
+        prog = enumerator.next()
+        while prog is not None:
+            for node in prog.children:
+                if node.is_apply() and node.name == 'plus' and str(node.args[0]) == '@param0':
+                    return prog, node
+            enumerator.update()
+            prog = enumerator.next()
+        self.fail('No program matches the pattern')
+
+    def test_lift_lemmas(self):
+        def has_pattern(prog):
+            return 'plus(@param0, ' in prog
+
+        for lift in [False, True]:
+            enumerator = SmtEnumerator(
+                spec, depth=4, loc=3, lift_lemmas=lift)
+            prog, node = self._find_inner_plus(enumerator)
+            arg = node.args[0]
+            enumerator.update(
+                [[(node, node.production), (arg, arg.production)]])
+            progs = enumerate_all(enumerator)
+            if lift:
+                self.assertEqual(enumerator.num_lifted, 1)
+                self.assertGreater(enumerator.num_lifted_clauses, 1)
+                self.assertFalse(any(has_pattern(x) for x in progs))
+            else:
+                self.assertTrue(any(has_pattern(x) for x in progs))
+
+        # A blame on the root depends on the output, so it is never lifted
+        enumerator = SmtEnumerator(spec, depth=4, loc=3, lift_lemmas=True)
+        prog, node = self._find_inner_plus(enumerator)
+        enumerator.update([[(prog, prog.production), (node, node.production)]])
+        self.assertEqual(enumerator.num_lifted, 0)
+        # A blame that is not connected is not lifted either
+        prog, node = self._find_inner_plus(enumerator)
+        other = prog.args[1] if prog.args[0] is node else prog.args[0]
+        enumerator.update([[(node, node.production), (other, other.production)]])
+        self.assertEqual(enumerator.num_lifted, 0)
+
+    def test_next_batch(self):
+        expected = enumerate_all(SmtEnumerator(spec, depth=3, loc=2))
+        enumerator = SmtEnumerator(spec, depth=3, loc=2)
+        batch = enumerator.next_batch(4)
+        self.assertEqual(len(batch), 4)
+        self.assertEqual(len({str(x) for x in batch}), 4)
+        # Programs that are not rejected are enumerated again
+        self.assertCountEqual(
+            [str(x) for x in enumerator.next_batch(len(expected) + 1)], expected)
+
+        actual = []
+        batch = enumerator.next_batch(5)
+        while len(batch) > 0:
+            for prog in batch:
+                actual.append(str(prog))
+                enumerator.update(prog=prog)
+            batch = enumerator.next_batch(5)
+        self.assertCountEqual(actual, expected)
+
+        with self.assertRaises(KeyError):
+            enumerator.update(prog=prog)
+        with self.assertRaises(ValueError):
+            enumerator.next_batch(0)
+
+    def test_next_batch_bounds(self):
+        enumerator = SmtEnumerator(spec, depth=4, loc=1, incremental=True)
+        enumerator.set_bounds(loc=2)
+        actual = []
+        batch = enumerator.next_batch(3)
+        while len(batch) > 0:
+            for prog in batch:
+                actual.append(str(prog))
+                enumerator.update(prog=prog)
+            batch = enumerator.next_batch(3)
+        self.assertCountEqual(
+            actual, enumerate_all(SmtEnumerator(spec, depth=4, loc=2)))
+        # The bounds still hold after a batch
+        enumerator.set_bounds(loc=3, depth=2)
+        self.assertEqual(enumerator.next_batch(2), [])
+        self.assertIsNone(enumerator.next())
+
+    def test_isolated_instances(self):
+        first = SmtEnumerator(spec, depth=3, loc=2)
+        num_vars = len(first.variables)
+        num_occurs = len(first.optimizer.var_occurs)
+        second = SmtEnumerator(spec, depth=3, loc=2)
+        self.assertIsNot(first.z3_solver, second.z3_solver)
+        self.assertEqual(len(first.variables), num_vars)
+        self.assertEqual(len(first.optimizer.var_occurs), num_occurs)
+        self.assertCountEqual(enumerate_all(second), enumerate_all(first))
+
+    def test_close(self):
+        with SmtEnumerator(spec, depth=3, loc=2) as enumerator:
+            self.assertIsNotNone(enumerator.next())
+        self.assertIsNone(enumerator.z3_solver)
+        self.assertEqual(len(enumerator.pending), 0)
+        with self.assertRaises(RuntimeError):
+            enumerator.next()
+        with self.assertRaises(RuntimeError):
+            enumerator.update()
+        # Closing twice is harmless
+        enumerator.close()
+
+    def test_commutative(self):
+        comm_spec = S.parse(spec_str.replace(
+            'func plus', '@commutative func plus'))
+        progs = enumerate_all(SmtEnumerator(comm_spec, depth=2, loc=1))
+        self.assertEqual(len(progs), 1)
+        self.assertIn(progs[0], ['plus(@param0, @param1)', 'plus(@param1, @param0)'])
+
+    def test_symmetry_breaking_is_complete(self):
+        # Every class of equivalent programs keeps a representative
+        def assoc(prog):
+            return tuple(flatten(prog, 'plus'))
+
+        def comm_assoc(prog):
+            return tuple(sorted(flatten(prog, 'plus')))
+
+        for props, normalize in [('@associative', assoc), ('@commutative @associative', comm_assoc)]:
+            prop_spec = S.parse(spec_str.replace(
+                'func plus', props + ' func plus'))
+            for depth in [3, 4]:
+                pruned = set()
+                full = set()
+                num_pruned = 0
+                num_full = 0
+                for loc in range(2, 4):
+                    progs = enumerate_programs(
+                        SmtEnumerator(prop_spec, depth=depth, loc=loc))
+                    all_progs = enumerate_programs(
+                        SmtEnumerator(spec, depth=depth, loc=loc))
+                    num_pruned += len(progs)
+                    num_full += len(all_progs)
+                    self.assertTrue({str(x) for x in progs}.issubset(
+                        {str(x) for x in all_progs}))
+                    pruned.update(normalize(x) for x in progs)
+                    full.update(normalize(x) for x in all_progs)
+                self.assertLess(num_pruned, num_full)
+                self.assertSetEqual(pruned, full)
+
+    def test_idempotent(self):
+        idem_spec = S.parse(spec_str.replace(
+            'func plus', '@idempotent func plus'))
+        for loc in range(1, 4):
+            for prog in enumerate_all(SmtEnumerator(idem_spec, depth=3, loc=loc)):
+                self.assertNotIn('plus(@param0, @param0)', prog)
+                self.assertNotIn('plus(@param1, @param1)', prog)
+
+
+if __name__ == '__main__':
+    unittest.main()
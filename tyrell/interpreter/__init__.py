@@ -2,3 +2,4 @@ from .interpreter import Interpreter
 from .post_order import PostOrderInterpreter
 from .context import Context
 from .error import InterpreterError, GeneralError, AssertionViolation
+from .cache import EvalCache
@@ -0,0 +1,143 @@
+import sys
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+from ..dsl import Node
+from ..metrics import get_metrics
+
+
+class EvalCache:
+    '''
+    A bounded LRU cache of the values computed by the eval methods of an interpreter, keyed by the structure of the subtree and the input.
+    Programs that share a subtree, e.g. the first statements of two programs from the same sketch, then only evaluate what differs.
+    Only successful evaluations are cached, and the eval methods are assumed to be deterministic.
+
+    Inputs are identified by their values if they are hashable. Otherwise they are identified by the object, e.g. the input list of an example,
+    which must then not be modified; the `max_inputs` most recently used such objects are remembered.
+    At most `max_entries` values are kept and, if `max_bytes` is given, their total size as measured by `sizeof` is kept under it.
+    '''
+
+    _max_entries: int
+    _max_bytes: Optional[int]
+    _sizeof: Callable[[Any], int]
+    _values: OrderedDict
+    _keys: weakref.WeakKeyDictionary
+    _inputs: OrderedDict
+
+    def __init__(self, max_entries: int = 4096, max_bytes: Optional[int] = None,
+                 sizeof: Optional[Callable[[Any], int]] = None, max_inputs: int = 256):
+        if max_entries <= 0:
+            raise ValueError(
+                'Maximum number of entries must be positive: {}'.format(max_entries))
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError(
+                'Maximum number of bytes must be positive: {}'.format(max_bytes))
+        if max_inputs <= 0:
+            raise ValueError(
+                'Maximum number of inputs must be positive: {}'.format(max_inputs))
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof if sizeof is not None else sys.getsizeof
+        self._max_inputs = max_inputs
+        # key -> (value, size)
+        self._values = OrderedDict()
+        self._num_bytes = 0
+        # structural key of the nodes that have been seen, which are immutable
+        self._keys = weakref.WeakKeyDictionary()
+        # id of the unhashable inputs -> (inputs, number that identifies them in the keys)
+        self._inputs = OrderedDict()
+        self._num_inputs = 0
+        self.num_hits = 0
+        self.num_misses = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def num_bytes(self) -> int:
+        '''Total size of the cached values'''
+        return self._num_bytes
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.num_hits + self.num_misses
+        return self.num_hits / total if total > 0 else 0.0
+
+    def node_key(self, node: Node) -> Hashable:
+        '''A key that two nodes share if and only if their subtrees are the same, i.e. they are `deep_eq()`'''
+        key = self._keys.get(node)
+        if key is None:
+            key = (node.production.id,) + tuple(self.node_key(x) for x in node.children)
+            self._keys[node] = key
+        return key
+
+    def _inputs_key(self, inputs: List[Any]) -> Hashable:
+        try:
+            key = tuple(inputs)
+            hash(key)
+            return key
+        except TypeError:
+            pass
+        entry = self._inputs.get(id(inputs))
+        if entry is None or entry[0] is not inputs:
+            # Numbers are never reused, so the values of forgotten inputs cannot be mistaken for others
+            self._num_inputs += 1
+            # Holding the inputs keeps their id from being reused
+            entry = (inputs, self._num_inputs)
+            self._inputs[id(inputs)] = entry
+            if len(self._inputs) > self._max_inputs:
+                self._inputs.popitem(last=False)
+        self._inputs.move_to_end(id(inputs))
+        return (entry[1],)
+
+    def _key(self, node: Node, inputs: List[Any]) -> Hashable:
+        return self.node_key(node), self._inputs_key(inputs)
+
+    def lookup(self, node: Node, inputs: List[Any]) -> Tuple[bool, Any]:
+        '''
+        Return whether the value of `node` on `inputs` is cached, and the value if it is.
+        Hits are counted, but misses are not, since the value is expected to be computed with `call()`.
+        '''
+        key = self._key(node, inputs)
+        entry = self._values.get(key)
+        if entry is None:
+            return False, None
+        self._hit(key)
+        return True, entry[0]
+
+    def _hit(self, key: Hashable) -> None:
+        self.num_hits += 1
+        get_metrics().incr('eval_cache_hits')
+        self._values.move_to_end(key)
+
+    def call(self, method: Callable[[Node, List[Any]], Any], node: Node, args: List[Any], inputs: List[Any]) -> Any:
+        '''Return `method(node, args)`, which is only computed if the value of `node` on `inputs` is not cached'''
+        key = self._key(node, inputs)
+        entry = self._values.get(key)
+        if entry is not None:
+            self._hit(key)
+            return entry[0]
+        self.num_misses += 1
+        get_metrics().incr('eval_cache_misses')
+        value = method(node, args)
+        self._store(key, value)
+        return value
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        size = 0
+        if self._max_bytes is not None:
+            size = self._sizeof(value)
+            if size > self._max_bytes:
+                return
+        self._values[key] = (value, size)
+        self._num_bytes += size
+        while len(self._values) > self._max_entries or \
+                (self._max_bytes is not None and self._num_bytes > self._max_bytes):
+            _, (_, evicted) = self._values.popitem(last=False)
+            self._num_bytes -= evicted
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._num_bytes = 0
+        self._keys = weakref.WeakKeyDictionary()
+        self._inputs.clear()
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Callable, Iterable, List, Any
+from typing import Callable, Iterable, List, Any, Optional
 from ..dsl import Node
 from .error import AssertionViolation
+from .cache import EvalCache
 
 
 class Interpreter(ABC):
@@ -14,6 +15,42 @@ class Interpreter(ABC):
         '''
         raise NotImplementedError
 
+    @property
+    def cache(self) -> Optional[EvalCache]:
+        '''The cache of the values of the eval methods, or `None` if caching is not enabled'''
+        return getattr(self, '_cache', None)
+
+    def enable_cache(self, max_entries: int = 4096, max_bytes: Optional[int] = None,
+                     sizeof: Optional[Callable[[Any], int]] = None) -> EvalCache:
+        '''
+        Cache the values of the eval methods per subtree and input, keeping the `max_entries` most recently used ones.
+        If `max_bytes` is given, the total size of the values as measured by `sizeof` (`sys.getsizeof` by default) is also kept under it.
+        This is only correct if the eval methods are deterministic.
+        '''
+        self._cache = EvalCache(max_entries, max_bytes=max_bytes, sizeof=sizeof)
+        return self._cache
+
+    def disable_cache(self) -> None:
+        self._cache = None
+
+    @property
+    def budget(self):
+        '''The `Budget` whose deadline is checked before every eval method, or `None` if there is none'''
+        return getattr(self, '_budget', None)
+
+    def set_budget(self, budget) -> None:
+        self._budget = budget
+
+    def apply_eval(self, method: Callable[[Node, List[Any]], Any], node: Node, args: List[Any], inputs: List[Any]) -> Any:
+        '''Call the eval method of `node`, through the cache if it is enabled'''
+        budget = self.budget
+        if budget is not None:
+            budget.check()
+        cache = self.cache
+        if cache is None:
+            return method(node, args)
+        return cache.call(method, node, args, inputs)
+
     def assertArg(
             self,
             node: Node,
@@ -4,6 +4,7 @@ from ..visitor import GenericVisitor
 from .interpreter import Interpreter
 from .context import Context
 from .error import InterpreterError, GeneralError
+from ..metrics import get_metrics
 
 
 class PostOrderInterpreter(Interpreter):
@@ -40,13 +41,31 @@ class PostOrderInterpreter(Interpreter):
                 return inputs[param_index]
 
             def visit_apply_node(self, apply_node: ApplyNode):
+                cache = self._interp.cache
+                if cache is not None:
+                    # A cached subtree is not evaluated again, so a new program costs about one eval call per new node
+                    found, value = cache.lookup(apply_node, inputs)
+                    if found:
+                        for x in apply_node.args:
+                            self._replay_context(x)
+                        self._context.pop()
+                        return value
                 in_values = [self.visit_with_context(
                     x) for x in apply_node.args]
                 self._context.pop()
                 method_name = self._eval_method_name(apply_node.name)
                 method = getattr(self._interp, method_name,
                                  self._method_not_found)
-                return method(apply_node, in_values)
+                return self._interp.apply_eval(method, apply_node, in_values, inputs)
+
+            def _replay_context(self, node: Node):
+                '''Update the context as if the cached subtree of `node` was visited'''
+                self._context.observe(node)
+                for x in node.children:
+                    self._replay_context(x)
+                if not node.is_leaf():
+                    self._context.pop()
+                self._context.finish(node)
 
             def _method_not_found(self, apply_node: ApplyNode, arg_values: List[Any]):
                 msg = 'Cannot find required eval method: "{}"'.format(
@@ -59,7 +78,8 @@ class PostOrderInterpreter(Interpreter):
 
         node_visitor = NodeVisitor(self)
         try:
-            return node_visitor.visit_with_context(prog)
+            with get_metrics().timer('interpret'):
+                return node_visitor.visit_with_context(prog)
         except InterpreterError as e:
             e.context = node_visitor._context
             raise e from None
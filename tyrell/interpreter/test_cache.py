@@ -0,0 +1,142 @@
+import unittest
+from .. import dsl as D
+from ..metrics import Metrics, set_metrics
+from .cache import EvalCache
+from .error import GeneralError
+from .test_interpreter import BoolInterpreter, spec
+
+
+class CountingInterpreter(BoolInterpreter):
+    def __init__(self):
+        self.num_calls = 0
+
+    def eval_not(self, node, args):
+        self.num_calls += 1
+        return super().eval_not(node, args)
+
+    def eval_and(self, node, args):
+        self.num_calls += 1
+        return super().eval_and(node, args)
+
+
+class TestEvalCache(unittest.TestCase):
+
+    def setUp(self):
+        self._builder = D.Builder(spec)
+
+    def test_shared_subtrees(self):
+        b = self._builder
+        interp = CountingInterpreter()
+        cache = interp.enable_cache()
+        # Two distinct ASTs with the same subtree
+        p = b.from_sexp_string('(and (not (@param 0)) (@param 1))')
+        q = b.from_sexp_string('(not (not (@param 0)))')
+        self.assertEqual(interp.eval(p, [False, True]), True)
+        self.assertEqual(interp.num_calls, 2)
+        self.assertEqual(interp.eval(q, [False, True]), False)
+        self.assertEqual(interp.num_calls, 3)
+        self.assertEqual(cache.num_hits, 1)
+        # Other inputs are evaluated again
+        self.assertEqual(interp.eval(p, [True, True]), False)
+        self.assertEqual(interp.num_calls, 5)
+
+        interp.disable_cache()
+        interp.eval(p, [False, True])
+        self.assertEqual(interp.num_calls, 7)
+
+    def test_lru(self):
+        b = self._builder
+        interp = CountingInterpreter()
+        cache = interp.enable_cache(max_entries=2)
+        p = b.from_sexp_string('(not (@param 0))')
+        interp.eval(p, [False, False])
+        interp.eval(p, [True, False])
+        interp.eval(p, [False, False])
+        self.assertEqual(interp.num_calls, 2)
+        # The least recently used entry is [True, False]
+        interp.eval(p, [True, True])
+        self.assertEqual(len(cache), 2)
+        interp.eval(p, [False, False])
+        self.assertEqual(interp.num_calls, 3)
+        interp.eval(p, [True, False])
+        self.assertEqual(interp.num_calls, 4)
+
+        with self.assertRaises(ValueError):
+            EvalCache(max_entries=0)
+
+    def test_errors(self):
+        b = self._builder
+        interp = BoolInterpreter()
+        cache = interp.enable_cache()
+        p = b.from_sexp_string('(assertTrue (@param 0))')
+        for _ in range(2):
+            with self.assertRaises(GeneralError):
+                interp.eval(p, [False, False])
+        self.assertEqual(len(cache), 0)
+
+    def test_error_context(self):
+        b = self._builder
+        shared = '(and (not (@param 0)) (@param 1))'
+        p = b.from_sexp_string('(or {} (assertTrue (@param 0)))'.format(shared))
+        contexts = []
+        for cached in [False, True]:
+            interp = BoolInterpreter()
+            if cached:
+                interp.enable_cache()
+                interp.eval(b.from_sexp_string(shared), [False, True])
+            with self.assertRaises(GeneralError) as cm:
+                interp.eval(p, [False, True])
+            context = cm.exception.context
+            contexts.append([[str(x) for x in nodes]
+                             for nodes in [context.stack, context.observed, context.evaluated]])
+        # The cached subtree is reported as if it was evaluated again
+        self.assertEqual(contexts[0], contexts[1])
+
+    def test_unhashable_inputs(self):
+        b = self._builder
+        interp = CountingInterpreter()
+        cache = interp.enable_cache()
+        p = b.from_sexp_string('(not (@param 1))')
+        # Unhashable inputs are identified by the object, like the inputs of an example
+        inputs = [[], False]
+        interp.eval(p, inputs)
+        interp.eval(b.from_sexp_string('(not (@param 1))'), inputs)
+        self.assertEqual(interp.num_calls, 1)
+        interp.eval(p, [[], False])
+        self.assertEqual(interp.num_calls, 2)
+
+    def test_max_bytes(self):
+        b = self._builder
+        interp = CountingInterpreter()
+        cache = interp.enable_cache(max_bytes=2, sizeof=lambda x: 1)
+        p = b.from_sexp_string('(and (not (@param 0)) (not (@param 1)))')
+        interp.eval(p, [False, True])
+        self.assertEqual((len(cache), cache.num_bytes), (2, 2))
+        # The values that are larger than the budget are not kept
+        cache = interp.enable_cache(max_bytes=2, sizeof=lambda x: 3)
+        interp.eval(p, [False, True])
+        self.assertEqual((len(cache), cache.num_bytes), (0, 0))
+
+        with self.assertRaises(ValueError):
+            EvalCache(max_bytes=0)
+
+    def test_metrics(self):
+        b = self._builder
+        interp = CountingInterpreter()
+        cache = interp.enable_cache()
+        p = b.from_sexp_string('(and (not (@param 0)) (@param 1))')
+        metrics = Metrics()
+        previous_metrics = set_metrics(metrics)
+        try:
+            interp.eval(p, [False, True])
+            # The whole program is cached, so its subtrees are not looked up
+            interp.eval(p, [False, True])
+        finally:
+            set_metrics(previous_metrics)
+        self.assertEqual(metrics.counter('eval_cache_hits'), 1)
+        self.assertEqual(metrics.counter('eval_cache_misses'), 2)
+        self.assertEqual(cache.hit_rate, 1 / 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
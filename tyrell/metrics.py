@@ -0,0 +1,150 @@
+import json
+import time
+from typing import Callable, Dict
+
+# Phases of a synthesis run that are timed:
+# 'solve' for the solver of the enumerator, 'decode' for building ASTs from models, 'interpret' for the concrete execution of candidates,
+# 'abstract' for checking candidates against the abstract semantics, and 'blame' for expanding blames.
+PHASES = ['solve', 'decode', 'interpret', 'abstract', 'blame']
+# Counters of a synthesis run
+COUNTERS = ['candidates', 'rejected_abstract', 'rejected_concrete', 'rejected_equivalent',
+            'interpreter_errors', 'lemma_clauses', 'solver_checks', 'eval_cache_hits', 'eval_cache_misses',
+            'example_evals', 'example_evals_saved']
+
+
+class _Timer:
+    '''Adds the time spent in a `with` block to a phase. Nested blocks of the same phase are only counted once.'''
+
+    def __init__(self, metrics: 'Metrics', name: str):
+        self._metrics = metrics
+        self._name = name
+        self._start = None
+
+    def __enter__(self):
+        metrics = self._metrics
+        depth = metrics._depth.get(self._name, 0)
+        metrics._depth[self._name] = depth + 1
+        if depth == 0:
+            self._start = metrics._clock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        metrics = self._metrics
+        depth = metrics._depth[self._name] - 1
+        metrics._depth[self._name] = depth
+        if depth == 0:
+            metrics.add_time(self._name, metrics._clock() - self._start)
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+_null_timer = _NullTimer()
+
+
+class Metrics:
+    '''
+    Timers and counters of the phases of synthesis runs, read from a monotonic clock.
+    Components report to the metrics that are installed with `set_metrics()`, which `Synthesizer` does for the duration of a run.
+    '''
+
+    enabled = True
+
+    _clock: Callable[[], float]
+    _counters: Dict[str, int]
+    _times: Dict[str, float]
+    _calls: Dict[str, int]
+    _depth: Dict[str, int]
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self.reset()
+
+    def reset(self) -> None:
+        self._counters = {x: 0 for x in COUNTERS}
+        self._times = {x: 0.0 for x in PHASES}
+        self._calls = {x: 0 for x in PHASES}
+        self._depth = dict()
+
+    def incr(self, name: str, value: int = 1) -> None:
+        self._counters[name] = self._counters.get(name, 0) + value
+
+    def timer(self, name: str):
+        '''A context manager that adds the time spent in it to phase `name`'''
+        return _Timer(self, name)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        self._times[name] = self._times.get(name, 0.0) + seconds
+        self._calls[name] = self._calls.get(name, 0) + 1
+
+    def counter(self, name: str) -> int:
+        return self._counters.get(name, 0)
+
+    def time(self, name: str) -> float:
+        '''Seconds spent in phase `name`'''
+        return self._times.get(name, 0.0)
+
+    def calls(self, name: str) -> int:
+        '''Number of times phase `name` was entered'''
+        return self._calls.get(name, 0)
+
+    def to_dict(self) -> Dict[str, Dict]:
+        return {
+            'counters': dict(self._counters),
+            'phases': {x: {'seconds': self._times[x], 'calls': self._calls.get(x, 0)}
+                       for x in self._times},
+        }
+
+    def to_json(self, indent=None) -> str:
+        return json.dumps(self.to_dict(), indent=indent, sort_keys=True)
+
+    def to_prometheus(self, prefix: str = 'tyrell') -> str:
+        '''The metrics in the Prometheus text exposition format'''
+        lines = []
+        for name in sorted(self._counters):
+            metric = '{}_{}_total'.format(prefix, name)
+            lines.append('# TYPE {} counter'.format(metric))
+            lines.append('{} {}'.format(metric, self._counters[name]))
+        for metric, values in [('{}_phase_seconds_total'.format(prefix), self._times),
+                               ('{}_phase_calls_total'.format(prefix), self._calls)]:
+            lines.append('# TYPE {} counter'.format(metric))
+            for name in sorted(values):
+                lines.append('{}{{phase="{}"}} {}'.format(
+                    metric, name, values[name]))
+        return '\n'.join(lines) + '\n'
+
+
+class NullMetrics(Metrics):
+    '''Metrics that record nothing, which are installed by default so that the instrumentation costs almost nothing'''
+
+    enabled = False
+
+    def incr(self, name: str, value: int = 1) -> None:
+        pass
+
+    def timer(self, name: str):
+        return _null_timer
+
+    def add_time(self, name: str, seconds: float) -> None:
+        pass
+
+
+_current: Metrics = NullMetrics()
+
+
+def get_metrics() -> Metrics:
+    '''The metrics that components report to'''
+    return _current
+
+
+def set_metrics(metrics: Metrics) -> Metrics:
+    '''Install `metrics`, and return the previous ones so that they can be restored'''
+    global _current
+    previous = _current
+    _current = metrics
+    return previous
@@ -1,8 +1,9 @@
 from .parser import LarkError as ParseError
 from .type import Type, EnumType, ValueType
-from .production import Production, EnumProduction, ParamProduction, FunctionProduction
+from .production import Production, EnumProduction, ParamProduction, FunctionProduction, FunctionProperty
 from .predicate import Predicate
 from .spec import TypeSpec, ProductionSpec, ProgramSpec, TyrellSpec
+from .grammar_table import GrammarTable
 from .desugar import ParseTreeProcessingError
 from . import expr
 from .do_parse import parse, parse_file
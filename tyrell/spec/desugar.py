@@ -2,6 +2,7 @@ from ast import literal_eval
 from typing import List, cast
 from .spec import TypeSpec, ProductionSpec, ProgramSpec, PredicateSpec, TyrellSpec
 from .type import Type, EnumType, ValueType
+from .production import FunctionProperty
 from .expr import *
 from .parser import Visitor_Recursive
 from .util import enum_set_domain
@@ -217,9 +218,22 @@ class ProductionCollector(Visitor_Recursive):
             msg = 'Unrecognized expr kind: {}'.format(expr_kind)
             raise NotImplementedError(msg)
 
+    @staticmethod
+    def _process_func_props(tree):
+        ret = []
+        for item in tree.children:
+            pname = str(item.children[0])
+            try:
+                ret.append(FunctionProperty(pname))
+            except ValueError:
+                msg = 'Unknown function property: {}'.format(pname)
+                raise ParseTreeProcessingError(msg)
+        return ret
+
     def func_decl(self, tree):
-        name = str(tree.children[0])
-        tree_body = tree.children[1]
+        properties = self._process_func_props(tree.children[0])
+        name = str(tree.children[1])
+        tree_body = tree.children[2]
         lhs_name = self._process_opt_arg(tree_body.children[0])
         rhs_names = [self._process_opt_arg(x)
                      for x in tree_body.children[1].children]
@@ -229,9 +243,9 @@ class ProductionCollector(Visitor_Recursive):
         rhs = [self._type_spec.get_type_or_raise(x) for x in rhs_names]
         type_map = self._create_type_map([lhs] + rhs)
         constraints = [self._process_expr(index_map, type_map,
-                                          x) for x in tree.children[2].children]
+                                          x) for x in tree.children[3].children]
         self._prod_spec.add_func_production(
-            name=name, lhs=lhs, rhs=rhs, constraints=constraints)
+            name=name, lhs=lhs, rhs=rhs, constraints=constraints, properties=properties)
 
     def collect(self) -> ProductionSpec:
         return self._prod_spec
@@ -0,0 +1,125 @@
+from typing import Tuple, Dict, Union
+from .type import Type
+from .production import Production
+
+# Name of the type that pads the unused children of a node in the SMT enumerators
+EMPTY_TYPE_NAME = 'Empty'
+
+
+class GrammarTable:
+    '''
+    A read-only summary of the productions of a spec, indexed by production id and by type id.
+    Type ids follow the order in which the types are defined.
+    It is meant for hot loops that would otherwise rescan the productions and query them one by one.
+    '''
+
+    _productions: Tuple[Production, ...]
+    _type_names: Tuple[str, ...]
+    _type_ids: Dict[str, int]
+    _is_leaf: Tuple[bool, ...]
+    _is_enum: Tuple[bool, ...]
+    _is_param: Tuple[bool, ...]
+    _is_function: Tuple[bool, ...]
+    _is_empty: Tuple[bool, ...]
+    _arity: Tuple[int, ...]
+    _lhs: Tuple[int, ...]
+    _rhs: Tuple[Tuple[int, ...], ...]
+    _productions_with_lhs: Tuple[Tuple[int, ...], ...]
+
+    def __init__(self, types, productions):
+        type_names = tuple(ty.name for ty in types)
+        type_ids = {name: i for i, name in enumerate(type_names)}
+        prods = sorted(productions, key=lambda p: p.id)
+        for i, prod in enumerate(prods):
+            if prod.id != i:
+                raise ValueError(
+                    'Production ids are not contiguous: {}'.format(prod))
+
+        by_lhs = [[] for _ in type_names]
+        for prod in prods:
+            by_lhs[type_ids[prod.lhs.name]].append(prod.id)
+
+        self._productions = tuple(prods)
+        self._type_names = type_names
+        self._type_ids = type_ids
+        self._is_enum = tuple(p.is_enum() for p in prods)
+        self._is_param = tuple(p.is_param() for p in prods)
+        self._is_function = tuple(p.is_function() for p in prods)
+        self._is_leaf = tuple(not p.is_function() for p in prods)
+        self._is_empty = tuple(p.lhs.name == EMPTY_TYPE_NAME for p in prods)
+        self._lhs = tuple(type_ids[p.lhs.name] for p in prods)
+        # The rhs of a leaf production is its value rather than a list of types
+        self._rhs = tuple(tuple(type_ids[ty.name] for ty in p.rhs) if p.is_function() else ()
+                          for p in prods)
+        self._arity = tuple(len(rhs) for rhs in self._rhs)
+        self._productions_with_lhs = tuple(tuple(ids) for ids in by_lhs)
+
+    @property
+    def productions(self) -> Tuple[Production, ...]:
+        '''All productions, indexed by id'''
+        return self._productions
+
+    @property
+    def type_names(self) -> Tuple[str, ...]:
+        '''All type names, indexed by type id'''
+        return self._type_names
+
+    @property
+    def is_leaf(self) -> Tuple[bool, ...]:
+        return self._is_leaf
+
+    @property
+    def is_enum(self) -> Tuple[bool, ...]:
+        return self._is_enum
+
+    @property
+    def is_param(self) -> Tuple[bool, ...]:
+        return self._is_param
+
+    @property
+    def is_function(self) -> Tuple[bool, ...]:
+        return self._is_function
+
+    @property
+    def is_empty(self) -> Tuple[bool, ...]:
+        '''Whether the production produces the Empty type'''
+        return self._is_empty
+
+    @property
+    def arity(self) -> Tuple[int, ...]:
+        '''The number of children of each production, which is 0 for leaves'''
+        return self._arity
+
+    @property
+    def lhs(self) -> Tuple[int, ...]:
+        '''The type id of the lhs of each production'''
+        return self._lhs
+
+    @property
+    def rhs(self) -> Tuple[Tuple[int, ...], ...]:
+        '''The type ids of the rhs of each production, which is empty for leaves'''
+        return self._rhs
+
+    def num_productions(self) -> int:
+        return len(self._productions)
+
+    def num_types(self) -> int:
+        return len(self._type_names)
+
+    def get_type_id(self, ty: Union[str, Type]) -> int:
+        '''Raise `KeyError` if the type is not defined'''
+        name = ty if isinstance(ty, str) else ty.name
+        try:
+            return self._type_ids[name]
+        except KeyError:
+            msg = 'Cannot find type with name {}'.format(name)
+            raise KeyError(msg) from None
+
+    def get_productions_with_lhs(self, ty: Union[int, str, Type]) -> Tuple[int, ...]:
+        '''Ids of the productions whose lhs is `ty`, which is empty if the type is not defined'''
+        if not isinstance(ty, int):
+            name = ty if isinstance(ty, str) else ty.name
+            ty = self._type_ids.get(name)
+            if ty is None:
+                return ()
+        return self._productions_with_lhs[ty]
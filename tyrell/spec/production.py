@@ -1,5 +1,6 @@
-from typing import List, Any, cast
+from typing import List, Iterable, FrozenSet, Any, cast
 from abc import ABC, abstractmethod
+from enum import Enum, unique
 from .type import Type, EnumType, ValueType
 from .expr import Expr, ExprType
 
@@ -112,12 +113,21 @@ class ParamProduction(Production):
             self._id, self._lhs, self._param_id)
 
 
+@unique
+class FunctionProperty(Enum):
+    '''Algebraic properties that can be declared on a function'''
+    COMMUTATIVE = "commutative"  # f(a, b) == f(b, a)
+    ASSOCIATIVE = "associative"  # f(f(a, b), c) == f(a, f(b, c))
+    IDEMPOTENT = "idempotent"  # f(a, a) == a
+
+
 class FunctionProduction(Production):
     _name: str
     _rhs: List[Type]
     _constraints: List[Expr]
+    _properties: FrozenSet[FunctionProperty]
 
-    def __init__(self, id: int, name: str, lhs: ValueType, rhs: List[Type], constraints: List[Expr] = []):
+    def __init__(self, id: int, name: str, lhs: ValueType, rhs: List[Type], constraints: List[Expr] = [], properties: Iterable[FunctionProperty] = []):
         super().__init__(id, lhs)
         if not isinstance(lhs, ValueType):
             raise ValueError('LHS of FunctionProduction must be a value type')
@@ -128,9 +138,18 @@ class FunctionProduction(Production):
             if constraint.type is not ExprType.BOOL:
                 raise ValueError(
                     'Constraint does not have bool type: "{}"'.format(constraint))
+        properties = frozenset(properties)
+        for prop in properties:
+            if len(rhs) != 2 or rhs[0] != rhs[1]:
+                raise ValueError(
+                    'Function {} must take two arguments of the same type to be {}'.format(name, prop.value))
+            if prop is not FunctionProperty.COMMUTATIVE and lhs != rhs[0]:
+                raise ValueError(
+                    'Function {} must return its argument type to be {}'.format(name, prop.value))
         self._name = name
         self._rhs = rhs
         self._constraints = constraints
+        self._properties = properties
 
     @property
     def rhs(self) -> List[Type]:
@@ -144,6 +163,13 @@ class FunctionProduction(Production):
     def constraints(self) -> List[Expr]:
         return self._constraints
 
+    @property
+    def properties(self) -> FrozenSet[FunctionProperty]:
+        return self._properties
+
+    def has_property(self, prop: FunctionProperty) -> bool:
+        return prop in self._properties
+
     def is_function(self) -> bool:
         return True
 
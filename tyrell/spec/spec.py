@@ -1,7 +1,8 @@
 from typing import Iterable, List, Dict, DefaultDict, Optional, Union, Any
 from collections import defaultdict
 from .type import Type, EnumType, ValueType
-from .production import EnumProduction, ParamProduction, FunctionProduction, Production
+from .grammar_table import GrammarTable
+from .production import EnumProduction, ParamProduction, FunctionProduction, FunctionProperty, Production
 from .expr import Expr
 from .predicate import Predicate
 
@@ -194,7 +195,7 @@ class ProductionSpec:
         self._add_production(prod)
         return prod
 
-    def add_func_production(self, name: str, lhs: ValueType, rhs: List[Type], constraints: List[Expr]=[]) -> FunctionProduction:
+    def add_func_production(self, name: str, lhs: ValueType, rhs: List[Type], constraints: List[Expr]=[], properties: Iterable[FunctionProperty]=[]) -> FunctionProduction:
         '''
         Create a new function production with the given `name`, `lhs`, and `rhs`. Return the created production.
         Raise `ValueError` if a production with the same `name` has already been created
@@ -203,7 +204,7 @@ class ProductionSpec:
             raise ValueError(
                 'Function Production with name {} has already been created'.format(name))
         prod = FunctionProduction(
-            self._get_next_id(), name, lhs, rhs, constraints)
+            self._get_next_id(), name, lhs, rhs, constraints, properties)
         self._func_map[name] = prod
         self._add_production(prod)
         return prod
@@ -287,6 +288,7 @@ class TyrellSpec:
     _prog_spec: ProgramSpec
     _prod_spec: ProductionSpec
     _pred_spec: PredicateSpec
+    _grammar: GrammarTable
 
     def __init__(self,
                  type_spec,
@@ -305,6 +307,7 @@ class TyrellSpec:
         self._prog_spec = prog_spec
         self._prod_spec = prod_spec
         self._pred_spec = pred_spec
+        self._grammar = GrammarTable(type_spec.types(), prod_spec.productions())
 
     @staticmethod
     def _add_enum_productions(prod_spec, enum_tys):
@@ -317,6 +320,11 @@ class TyrellSpec:
         for i, ty in enumerate(input_tys):
             prod_spec.add_param_production(ty, i)
 
+    @property
+    def grammar(self) -> GrammarTable:
+        '''Precomputed tables of the productions, for the performance-sensitive clients'''
+        return self._grammar
+
     # Delegate methods for TypeSpec
     def get_type(self, name: str) -> Optional[Type]:
         return self._type_spec.get_type(name)
@@ -1,6 +1,9 @@
 import unittest
 from .type import EnumType, ValueType
 from .spec import TypeSpec, ProductionSpec, PredicateSpec
+from .production import FunctionProperty
+from .desugar import ParseTreeProcessingError
+from . import parse
 
 
 class TestTyrellSpec(unittest.TestCase):
@@ -46,6 +49,103 @@ class TestTyrellSpec(unittest.TestCase):
         spec.add_func_production(name='base2', lhs=ty1, rhs=[ty0])
         self.assertEqual(len(list(spec.productions())), 3)
 
+    def test_function_properties(self):
+        ty0 = EnumType('Type0')
+        ty1 = ValueType('Type1')
+        spec = ProductionSpec()
+        prod0 = spec.add_func_production(
+            name='plus', lhs=ty1, rhs=[ty1, ty1],
+            properties=[FunctionProperty.COMMUTATIVE, FunctionProperty.ASSOCIATIVE])
+        self.assertTrue(prod0.has_property(FunctionProperty.COMMUTATIVE))
+        self.assertTrue(prod0.has_property(FunctionProperty.ASSOCIATIVE))
+        self.assertFalse(prod0.has_property(FunctionProperty.IDEMPOTENT))
+        prod1 = spec.add_func_production(name='base', lhs=ty1, rhs=[ty0])
+        self.assertEqual(len(prod1.properties), 0)
+
+        with self.assertRaises(ValueError):
+            spec.add_func_production(
+                name='bad', lhs=ty1, rhs=[ty0, ty1], properties=[FunctionProperty.COMMUTATIVE])
+        with self.assertRaises(ValueError):
+            spec.add_func_production(
+                name='bad', lhs=ty1, rhs=[ty0, ty0], properties=[FunctionProperty.ASSOCIATIVE])
+        with self.assertRaises(ValueError):
+            spec.add_func_production(
+                name='bad', lhs=ty1, rhs=[ty1], properties=[FunctionProperty.IDEMPOTENT])
+
+    def test_parse_function_properties(self):
+        spec = parse(r'''
+            enum SmallInt { "0", "1" }
+            value Int;
+            value Bool;
+            program P(Int, Int) -> Bool;
+            @commutative @associative @idempotent
+            func max: Int -> Int, Int;
+            @commutative
+            func eq: Bool -> Int, Int;
+            func const: Int -> SmallInt;
+        ''')
+        max_prod = spec.get_function_production_or_raise('max')
+        self.assertSetEqual(set(max_prod.properties), set(FunctionProperty))
+        eq_prod = spec.get_function_production_or_raise('eq')
+        self.assertSetEqual(set(eq_prod.properties), {
+                            FunctionProperty.COMMUTATIVE})
+
+        with self.assertRaises(ParseTreeProcessingError):
+            parse('''
+                value Int;
+                program P(Int) -> Int;
+                @fast
+                func f: Int -> Int, Int;
+            ''')
+        with self.assertRaises(ParseTreeProcessingError):
+            parse('''
+                value Int;
+                value Bool;
+                program P(Int) -> Bool;
+                @associative
+                func eq: Bool -> Int, Int;
+            ''')
+
+    def test_grammar_table(self):
+        spec = parse(r'''
+            enum SmallInt { "0", "1" }
+            value Int;
+            value Empty;
+            program P(Int) -> Int;
+            func plus: Int -> Int, Int;
+            func const: Int -> SmallInt;
+            func empty: Empty -> Empty;
+        ''')
+        g = spec.grammar
+        self.assertEqual(g.num_productions(), spec.num_productions())
+        self.assertEqual(g.num_types(), spec.num_types())
+        for prod in spec.productions():
+            self.assertIs(g.productions[prod.id], prod)
+            self.assertEqual(g.is_enum[prod.id], prod.is_enum())
+            self.assertEqual(g.is_param[prod.id], prod.is_param())
+            self.assertEqual(g.is_function[prod.id], prod.is_function())
+            self.assertEqual(g.is_leaf[prod.id], not prod.is_function())
+            self.assertEqual(g.type_names[g.lhs[prod.id]], prod.lhs.name)
+
+        plus = spec.get_function_production_or_raise('plus')
+        int_id = g.get_type_id('Int')
+        self.assertEqual(g.arity[plus.id], 2)
+        self.assertTupleEqual(g.rhs[plus.id], (int_id, int_id))
+        param = spec.get_param_production_or_raise(0)
+        self.assertEqual(g.arity[param.id], 0)
+        self.assertTupleEqual(g.rhs[param.id], ())
+
+        empty = spec.get_function_production_or_raise('empty')
+        self.assertListEqual([p for p in range(g.num_productions()) if g.is_empty[p]],
+                             [empty.id])
+        self.assertTupleEqual(g.get_productions_with_lhs('Int'),
+                              tuple(p.id for p in spec.get_productions_with_lhs('Int')))
+        self.assertTupleEqual(g.get_productions_with_lhs(int_id),
+                              g.get_productions_with_lhs(spec.output))
+        self.assertTupleEqual(g.get_productions_with_lhs('NotAType'), ())
+        with self.assertRaises(KeyError):
+            g.get_type_id('NotAType')
+
     def test_predicate(self):
         spec = PredicateSpec()
         pred0 = spec.add_predicate('f', ['abc', 3, False])
@@ -0,0 +1,19 @@
+import os
+import json
+from typing import Any
+
+
+def write_json(path: str, obj: Any, **kwargs) -> None:
+    '''
+    Write `obj` to `path` as JSON, with the keyword arguments of `json.dump()`.
+    The file is replaced at once, so that a concurrent reader never sees a partial write.
+    '''
+    tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(obj, f, **kwargs)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
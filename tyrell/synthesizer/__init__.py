@@ -1 +1,5 @@
-from .synthesizer import Synthesizer
+from .synthesizer import Synthesizer, SynthesisResult
+from .sketch_parallel import SketchParallelSynthesizer
+from .pipelined import PipelinedSynthesizer
+from .portfolio import PortfolioSynthesizer, PortfolioStats
+from .equivalence import ObservationalEquivalenceFilter
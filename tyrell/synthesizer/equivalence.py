@@ -0,0 +1,141 @@
+from collections import OrderedDict
+from typing import Any, Callable, FrozenSet, Hashable, List, Optional, Sequence, Tuple
+from ..decider import Blame
+from ..dsl import Node, dfs
+from ..interpreter import Interpreter, InterpreterError
+from ..logger import get_logger
+
+logger = get_logger('tyrell.synthesizer.equivalence')
+
+# What is known about a subtree: its structural key, number of function applications, depth and the indices of the params it uses
+_Entry = Tuple[Hashable, int, int, FrozenSet[int]]
+
+
+class ObservationalEquivalenceFilter:
+    '''
+    Reject candidates that contain a subtree computing the same values on every example input as another subtree that was seen before,
+    is no larger and uses the same params.
+    Replacing such a subtree by the earlier one gives a program that is no larger, no deeper, indistinguishable on the examples and uses the same inputs,
+    so it is enough to try the latter, provided the enumerator may produce it. The inputs matter because the enumerators only produce programs that use every input.
+    This holds for `SmtEnumerator`, but not for `BidirectEnumerator`, whose sketches fix the function of each line, so the filter is not meant for the latter.
+    The size of a subtree is its number of function applications, like the `loc` of the enumerators. Params alone are never rejected.
+
+    By default the earlier subtree must have the same size, so that the program it gives is enumerated within the same bounds.
+    If `monotone` is set, the programs are assumed to be enumerated by nondecreasing size, e.g. by a loop over `loc` that shares the filter,
+    and subtrees equivalent to strictly smaller ones are rejected as well.
+
+    The values of a subtree on the inputs are its fingerprint, together with its type. At most `max_entries` fingerprints are kept, the least recently used being dropped first.
+    By default a fingerprint is the tuple of values, so subtrees whose values are not hashable are never filtered; `fingerprint` can map such values to a hashable digest.
+    The eval methods of the interpreter are assumed to be deterministic.
+    '''
+
+    _interpreter: Interpreter
+    _inputs: List[List[Any]]
+    _max_entries: int
+    _monotone: bool
+    _fingerprint: Callable[[List[Any]], Hashable]
+    # Fingerprint -> (size, params) -> (structural key, depth) of the shallowest subtree of that size and params seen so far
+    _table: OrderedDict
+
+    def __init__(self, interpreter: Interpreter, inputs: Sequence[List[Any]], max_entries: int = 65536,
+                 fingerprint: Optional[Callable[[List[Any]], Hashable]] = None, monotone: bool = False):
+        '''`inputs` are the inputs of the examples, e.g. `[x.input for x in decider.examples]`'''
+        if max_entries <= 0:
+            raise ValueError(
+                'Maximum number of entries must be positive: {}'.format(max_entries))
+        self._interpreter = interpreter
+        self._inputs = list(inputs)
+        self._max_entries = max_entries
+        self._monotone = monotone
+        self._fingerprint = fingerprint if fingerprint is not None else tuple
+        self._table = OrderedDict()
+        self.num_checked = 0
+        self.num_redundant = 0
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def _evaluate(self, node: Node, args: List[Any], inputs: List[Any]) -> Any:
+        '''The value of `node` on `inputs`, given the values of its children, with the same eval methods as `PostOrderInterpreter`'''
+        interp = self._interpreter
+        if node.is_param():
+            return inputs[node.index]
+        if node.is_enum():
+            method = getattr(interp, 'eval_' + node.type.name, lambda x: x)
+            return method(node.data)
+        method = getattr(interp, 'eval_' + node.name)
+        return interp.apply_eval(method, node, args, inputs)
+
+    def _subtrees(self, prog: Node) -> Optional[List[Tuple[Node, Hashable, _Entry]]]:
+        '''Every subtree of `prog` from the leaves up, with its fingerprint, or `None` if `prog` fails on an input'''
+        # Children come before their parents, and a node that is shared by several parents is only taken once
+        nodes = list({id(x): x for x in reversed(list(dfs(prog)))}.values())
+        values = {x: [] for x in nodes}
+        try:
+            for inputs in self._inputs:
+                current = dict()
+                for node in nodes:
+                    current[node] = self._evaluate(
+                        node, [current[x] for x in node.children], inputs)
+                    values[node].append(current[node])
+        except InterpreterError:
+            # The decider knows better what to do with it
+            return None
+        entries = dict()
+        ret = []
+        for node in nodes:
+            children = [entries[x] for x in node.children]
+            key = (node.production.id,) + tuple(x[0] for x in children)
+            size = int(node.is_apply()) + sum(x[1] for x in children)
+            depth = 1 + max([x[2] for x in children], default=0)
+            params = frozenset([node.index]) if node.is_param() else frozenset().union(*[x[3] for x in children])
+            entries[node] = (key, size, depth, params)
+            if node.is_param():
+                continue
+            try:
+                fp = (node.type.name, self._fingerprint(values[node]))
+                hash(fp)
+            except TypeError:
+                continue
+            ret.append((node, fp, entries[node]))
+        return ret
+
+    def _is_redundant(self, fp: Hashable, key: Hashable, size: int, depth: int, params: FrozenSet[int]) -> bool:
+        seen = self._table.get(fp)
+        if seen is None:
+            return False
+        for (seen_size, seen_params), (seen_key, seen_depth) in seen.items():
+            if seen_key == key or seen_depth > depth or seen_params != params:
+                continue
+            if seen_size == size or (self._monotone and seen_size < size):
+                return True
+        return False
+
+    def check(self, prog: Node) -> Optional[List[List[Blame]]]:
+        '''
+        Return the blame of a redundant subtree of `prog`, which can be passed to `Enumerator.update()`, or `None` if `prog` is worth deciding.
+        The fingerprints of the subtrees of the programs that are worth deciding are remembered.
+        '''
+        self.num_checked += 1
+        subtrees = self._subtrees(prog)
+        if subtrees is None:
+            return None
+        for node, fp, (key, size, depth, params) in subtrees:
+            if self._is_redundant(fp, key, size, depth, params):
+                self.num_redundant += 1
+                self._table.move_to_end(fp)
+                logger.debug(
+                    '{} is observationally equivalent to a subtree seen before'.format(node))
+                return [[Blame(x, x.production) for x in dfs(node)]]
+        for _, fp, (key, size, depth, params) in subtrees:
+            seen = self._table.setdefault(fp, dict())
+            # The shallowest subtree of each size and params is the representative
+            if (size, params) not in seen or depth < seen[(size, params)][1]:
+                seen[(size, params)] = (key, depth)
+            self._table.move_to_end(fp)
+            if len(self._table) > self._max_entries:
+                self._table.popitem(last=False)
+        return None
+
+    def clear(self) -> None:
+        self._table.clear()
@@ -0,0 +1,151 @@
+import time
+import threading
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional, Tuple
+from .synthesizer import SynthesizerBase, analyze_program
+from ..enumerator import Enumerator
+from ..decider import Blame, Decider
+from ..dsl import Node, NodeIndexer
+from ..logger import get_logger
+
+logger = get_logger('tyrell.synthesizer.pipelined')
+
+# The decider of the current worker thread or process
+_worker = threading.local()
+
+
+def _init_worker(make_decider: Callable[[], Decider]) -> None:
+    _worker.decider = make_decider()
+
+
+def _decide(prog: Node, portable: bool) -> Tuple[bool, Any]:
+    '''
+    Analyze `prog` with the decider of the worker.
+    If `portable` is set, the blamed nodes are replaced by their BFS index, since the AST that is sent back to the parent process is a copy.
+    '''
+    accepted, info = analyze_program(_worker.decider, prog)
+    if portable and info is not None and not isinstance(info, str):
+        indexer = NodeIndexer(prog)
+        info = [[(indexer.get_id_or_raise(node), production) for node, production in core]
+                for core in info]
+    return accepted, info
+
+
+class PipelinedSynthesizer(SynthesizerBase):
+    '''
+    Overlap the enumeration of candidates with their analysis.
+    The enumerator keeps up to `max_in_flight` candidates ahead of a pool of deciders, and the blames that come back are fed to the enumerator as soon as they arrive.
+    A candidate that was enumerated before a lemma was learned may be one that the lemma prunes, and it is still analyzed, which is correct but may be wasted work.
+    Such candidates are counted in `num_overlapped`, whether or not the lemma prunes them, so it bounds the work that pipelining may waste.
+    '''
+
+    _make_decider: Callable[[], Decider]
+    _num_workers: int
+    _max_in_flight: int
+    _processes: bool
+
+    def __init__(self, enumerator: Enumerator, make_decider: Callable[[], Decider],
+                 num_workers: int = 1, max_in_flight: Optional[int] = None, processes: bool = True):
+        '''
+        `make_decider` is called once in each worker, so that deciders and their interpreters are never shared.
+        Workers are spawned processes by default, so `make_decider` must be picklable, e.g. a module-level function or a `functools.partial` of one.
+        Without `processes`, they are threads, which avoids copying the ASTs but only overlaps with deciders that release the GIL.
+        Threads are not safe for deciders that use z3, such as `ExampleConstraintDecider`, since they would share the default z3 context with the enumerator.
+        `max_in_flight` bounds the number of candidates that are enumerated but not yet decided, and defaults to twice the number of workers.
+        '''
+        if num_workers <= 0:
+            raise ValueError(
+                'Number of workers must be positive: {}'.format(num_workers))
+        if max_in_flight is None:
+            max_in_flight = 2 * num_workers
+        if max_in_flight <= 0:
+            raise ValueError(
+                'Number of candidates in flight must be positive: {}'.format(max_in_flight))
+        super().__init__(enumerator)
+        self._make_decider = make_decider
+        self._num_workers = num_workers
+        self._max_in_flight = max_in_flight
+        self._processes = processes
+        # statistics of the last call to synthesize(): candidates decided, and those among them that were enumerated before a lemma that was learned while they were in flight
+        self.num_attempts = 0
+        self.num_overlapped = 0
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self) -> float:
+        '''Candidates decided per second in the last call to synthesize()'''
+        if self.elapsed <= 0:
+            return 0.0
+        return self.num_attempts / self.elapsed
+
+    def _make_executor(self):
+        if self._processes:
+            return ProcessPoolExecutor(max_workers=self._num_workers,
+                                       mp_context=multiprocessing.get_context('spawn'),
+                                       initializer=_init_worker, initargs=(self._make_decider,))
+        return ThreadPoolExecutor(max_workers=self._num_workers,
+                                  initializer=_init_worker, initargs=(self._make_decider,))
+
+    def _feedback(self, prog: Node, info: Any) -> bool:
+        '''Update the enumerator with the reason why `prog` is rejected. Returns whether a lemma is learned.'''
+        # The model of the candidate is already blocked, so only blames are worth sending
+        if info is None or isinstance(info, str):
+            return False
+        if self._processes:
+            indexer = NodeIndexer(prog)
+            info = [[Blame(indexer.get_node_or_raise(x), production) for x, production in core]
+                    for core in info]
+        try:
+            self._enumerator.update(info, prog=prog)
+        except KeyError:
+            # Too many candidates were enumerated since this one
+            logger.debug('Dropping the blame of a candidate that is no longer pending: {}'.format(prog))
+            return False
+        return True
+
+    def synthesize(self) -> Optional[Node]:
+        '''
+        Returns an accepted program, or `None` if the enumerator is exhausted.
+        With more than one candidate in flight, it is not necessarily the first accepted program in enumeration order.
+        '''
+        self.num_attempts = 0
+        self.num_overlapped = 0
+        start = time.perf_counter()
+        # number of lemmas learned so far, to tell which candidates were enumerated before a lemma
+        num_lemmas = 0
+        in_flight = dict()
+        exhausted = False
+        executor = self._make_executor()
+        try:
+            while True:
+                while not exhausted and len(in_flight) < self._max_in_flight:
+                    prog = self._enumerator.next()
+                    if prog is None:
+                        exhausted = True
+                        break
+                    logger.debug('Enumerator generated: {}'.format(prog))
+                    # Block the candidate right away, so that the next one differs whatever its verdict
+                    self._enumerator.update()
+                    future = executor.submit(_decide, prog, self._processes)
+                    in_flight[future] = (prog, num_lemmas)
+                if len(in_flight) == 0:
+                    logger.debug('Enumerator is exhausted after {} attempts'.format(
+                        self.num_attempts))
+                    return None
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    prog, lemmas_before = in_flight.pop(future)
+                    accepted, info = future.result()
+                    self.num_attempts += 1
+                    if lemmas_before < num_lemmas:
+                        self.num_overlapped += 1
+                    if accepted:
+                        logger.debug('Program accepted after {} attempts'.format(
+                            self.num_attempts))
+                        return prog
+                    if self._feedback(prog, info):
+                        num_lemmas += 1
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.elapsed = time.perf_counter() - start
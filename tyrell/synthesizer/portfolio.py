@@ -0,0 +1,221 @@
+import os
+import json
+import time
+import traceback
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from .synthesizer import Synthesizer
+from .race import ProcessRace
+from ..enumerator import Enumerator
+from ..decider import Decider
+from ..dsl import Node
+from ..logger import get_logger
+from ..storage import write_json
+
+logger = get_logger('tyrell.synthesizer.portfolio')
+
+# A configuration of the portfolio: how to build the enumerator, and how to build the decider
+Config = Tuple[Callable[[], Enumerator], Callable[[], Decider]]
+
+# How a configuration ended a run:
+# 'win' if its program was returned, 'solved' if it found one too late, 'exhausted' if its enumerator ran out,
+# 'stopped' if it was stopped because another configuration won, 'error' if it failed.
+OUTCOMES = ['win', 'solved', 'exhausted', 'stopped', 'error']
+
+
+class PortfolioStats:
+    '''
+    The outcomes of past portfolio runs per configuration name, optionally kept in a JSON file.
+    A configuration is ranked by its win rate, with Laplace smoothing so that new configurations get a fair chance.
+    '''
+
+    _path: Optional[str]
+    _entries: Dict[str, Dict[str, float]]
+
+    def __init__(self, path: Optional[str] = None):
+        self._path = path
+        self._entries = dict()
+        if path is not None and os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    self._entries = json.load(f)
+            except ValueError:
+                logger.warning(
+                    'Ignoring malformed portfolio statistics in {}'.format(path))
+
+    def _entry(self, name: str) -> Dict[str, float]:
+        entry = self._entries.get(name)
+        if entry is None:
+            entry = dict(runs=0, time=0.0, attempts=0)
+            for outcome in OUTCOMES:
+                entry[outcome] = 0
+            self._entries[name] = entry
+        return entry
+
+    def get(self, name: str) -> Dict[str, float]:
+        '''The number of runs, the number of each outcome, and the total time and attempts of configuration `name`'''
+        return dict(self._entry(name))
+
+    def record(self, name: str, outcome: str, elapsed: float, num_attempts: int) -> None:
+        if outcome not in OUTCOMES:
+            raise ValueError('Unknown outcome: {}'.format(outcome))
+        entry = self._entry(name)
+        entry['runs'] += 1
+        entry[outcome] += 1
+        entry['time'] += elapsed
+        entry['attempts'] += num_attempts
+
+    def win_rate(self, name: str) -> float:
+        entry = self._entry(name)
+        return (entry['win'] + 1) / (entry['runs'] + 2)
+
+    def rank(self, names: Sequence[str], min_runs: int = 0, min_win_rate: float = 0.0) -> List[str]:
+        '''
+        Sort `names` from the highest to the lowest win rate, keeping the original order on ties.
+        Configurations with at least `min_runs` runs whose win rate is below `min_win_rate` are pruned.
+        '''
+        kept = [x for x in names
+                if self._entry(x)['runs'] < min_runs or self.win_rate(x) >= min_win_rate]
+        return sorted(kept, key=lambda x: -self.win_rate(x))
+
+    def save(self) -> None:
+        if self._path is None:
+            return
+        write_json(self._path, self._entries, indent=2, sort_keys=True)
+
+
+def _portfolio_worker(index, make_enumerator, make_decider, results, stop):
+    '''Run one configuration until it finds a solution, runs out of candidates, or `stop` is set'''
+    start = time.perf_counter()
+    num_attempts = 0
+    try:
+        with Synthesizer(make_enumerator(), make_decider()) as synthesizer:
+            prog = synthesizer.enumerator.next()
+            while prog is not None:
+                if stop.is_set():
+                    results.put(('stopped', index, num_attempts,
+                                 time.perf_counter() - start, None))
+                    return
+                num_attempts += 1
+                if synthesizer.try_program(prog):
+                    results.put(('solution', index, num_attempts,
+                                 time.perf_counter() - start, prog))
+                    return
+                prog = synthesizer.enumerator.next()
+        results.put(('exhausted', index, num_attempts,
+                     time.perf_counter() - start, None))
+    except Exception:
+        results.put(('error', index, num_attempts,
+                     time.perf_counter() - start, traceback.format_exc()))
+
+
+class PortfolioSynthesizer:
+    '''
+    Race several configurations of enumerator and decider on the same task, each in its own process.
+    The first accepted program wins and the other configurations are stopped.
+    With `stats`, the outcome of every configuration is recorded, and the portfolio is ordered and pruned by past win rates.
+    '''
+
+    _configs: List[Config]
+    _names: List[str]
+    _stats: Optional[PortfolioStats]
+
+    def __init__(self, configs: Sequence[Config], names: Optional[Sequence[str]] = None,
+                 stats: Optional[PortfolioStats] = None, max_configs: Optional[int] = None,
+                 min_runs: int = 0, min_win_rate: float = 0.0, grace_period: float = 1.0):
+        '''
+        Each configuration is a pair of factories, which must be picklable, see `ProcessRace`.
+        `names` identify the configurations in `stats` and default to `config0`, `config1`, ...
+        Only the `max_configs` configurations with the best win rate run, after those that are pruned by `min_runs` and `min_win_rate`, see `PortfolioStats.rank()`.
+        Configurations check for cancellation between candidates, within the `grace_period` of `ProcessRace`.
+        '''
+        configs = list(configs)
+        if names is None:
+            names = ['config{}'.format(i) for i in range(len(configs))]
+        names = list(names)
+        if len(names) != len(configs):
+            raise ValueError('Expected {} names, got {}'.format(
+                len(configs), len(names)))
+        if len(set(names)) != len(names):
+            raise ValueError('Configuration names must be unique: {}'.format(names))
+        if max_configs is not None and max_configs <= 0:
+            raise ValueError(
+                'Maximum number of configurations must be positive: {}'.format(max_configs))
+        self._configs = configs
+        self._names = names
+        self._stats = stats
+        self._max_configs = max_configs
+        self._min_runs = min_runs
+        self._min_win_rate = min_win_rate
+        self._grace_period = grace_period
+        # statistics of the last call to synthesize(): the name of the winner, and the outcome, attempts and time per configuration
+        self.winner = None
+        self.results = dict()
+
+    def selected(self) -> List[str]:
+        '''The names of the configurations that run, in order of priority'''
+        names = self._names
+        if self._stats is not None:
+            names = self._stats.rank(names, self._min_runs, self._min_win_rate)
+        if self._max_configs is not None:
+            names = names[:self._max_configs]
+        return names
+
+    def synthesize(self) -> Optional[Node]:
+        '''
+        Returns the first program that is accepted by any configuration, or `None` if all of them are exhausted.
+        Raises `RuntimeError` if every configuration fails.
+        '''
+        self.winner = None
+        self.results = dict()
+        names = self.selected()
+        if len(names) == 0:
+            return None
+
+        solution = None
+        errors = []
+        start = time.perf_counter()
+        with ProcessRace(self._grace_period) as race:
+            workers = dict()
+            for name in names:
+                index = self._names.index(name)
+                make_enumerator, make_decider = self._configs[index]
+                workers[name] = race.start(_portfolio_worker, index, make_enumerator, make_decider)
+            logger.debug('Started portfolio of {}'.format(names))
+
+            for kind, index, num_attempts, elapsed, payload in race.messages():
+                name = self._names[index]
+                outcome = kind
+                if kind == 'solution':
+                    if solution is None:
+                        solution = payload
+                        self.winner = name
+                        outcome = 'win'
+                        logger.debug('Configuration {} won after {} attempts'.format(
+                            name, num_attempts))
+                    else:
+                        outcome = 'solved'
+                elif kind == 'error':
+                    errors.append('{}:\n{}'.format(name, payload))
+                self.results[name] = dict(
+                    outcome=outcome, attempts=num_attempts, time=elapsed)
+                if len(self.results) == len(workers):
+                    break
+                if solution is not None:
+                    race.stop()
+
+        # The configurations that never reported were terminated, or crashed
+        elapsed = time.perf_counter() - start
+        for name in workers:
+            if name not in self.results:
+                outcome = 'stopped' if solution is not None else 'error'
+                self.results[name] = dict(outcome=outcome, attempts=0, time=elapsed)
+        if self._stats is not None:
+            for name, result in self.results.items():
+                self._stats.record(
+                    name, result['outcome'], result['time'], result['attempts'])
+            self._stats.save()
+
+        if solution is None and all(x['outcome'] == 'error' for x in self.results.values()):
+            raise RuntimeError('All portfolio configurations failed:\n{}'.format(
+                '\n'.join(errors) if len(errors) > 0 else 'the workers crashed'))
+        return solution
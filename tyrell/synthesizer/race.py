@@ -0,0 +1,77 @@
+import time
+import queue
+import multiprocessing
+from typing import Any, Callable, Iterator, List, Optional
+
+
+class ProcessRace:
+    '''
+    Worker processes that race on a task and report their messages to a shared queue, until one of them wins and the others are stopped.
+    Workers are spawned rather than forked, so that they do not share the z3 context, hence their targets and arguments must be picklable,
+    e.g. module-level functions or `functools.partial` of them.
+    Workers are expected to check the stop event between units of work, and those that do not stop within `grace_period` seconds are terminated.
+    '''
+
+    _grace_period: float
+    _workers: List[multiprocessing.Process]
+    _deadline: Optional[float]
+
+    def __init__(self, grace_period: float = 1.0):
+        self._grace_period = grace_period
+        self._context = multiprocessing.get_context('spawn')
+        self._results = self._context.Queue()
+        self._stop = self._context.Event()
+        self._workers = []
+        self._deadline = None
+
+    @property
+    def context(self):
+        '''The multiprocessing context of the workers, for the queues they share besides the result queue'''
+        return self._context
+
+    @property
+    def workers(self) -> List[multiprocessing.Process]:
+        return self._workers
+
+    def start(self, target: Callable, *args: Any) -> multiprocessing.Process:
+        '''Start a worker that runs `target(*args, results, stop)`'''
+        worker = self._context.Process(target=target, args=args + (self._results, self._stop), daemon=True)
+        worker.start()
+        self._workers.append(worker)
+        return worker
+
+    def messages(self) -> Iterator[Any]:
+        '''
+        The messages of the workers as they arrive.
+        They end once the workers are stopped and the grace period is over, or once every worker is gone without reporting anything more.
+        '''
+        while True:
+            if self._deadline is not None and time.monotonic() >= self._deadline:
+                return
+            try:
+                yield self._results.get(timeout=0.1)
+            except queue.Empty:
+                # A worker that crashed never reports
+                if not any(worker.is_alive() for worker in self._workers):
+                    return
+
+    def stop(self) -> None:
+        '''Ask the workers to stop, and start the grace period'''
+        if not self._stop.is_set():
+            self._stop.set()
+            self._deadline = time.monotonic() + self._grace_period
+
+    def close(self) -> None:
+        '''Stop the workers, and terminate the ones that are still running after the grace period'''
+        self._stop.set()
+        for worker in self._workers:
+            worker.join(self._grace_period)
+            if worker.is_alive():
+                worker.terminate()
+                worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
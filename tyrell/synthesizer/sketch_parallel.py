@@ -0,0 +1,121 @@
+import os
+import traceback
+from typing import Callable, List, Optional
+from .synthesizer import Synthesizer
+from .race import ProcessRace
+from ..dsl import Node
+from ..logger import get_logger
+
+logger = get_logger('tyrell.synthesizer.sketch_parallel')
+
+
+def _sketch_worker(make_synthesizer, sketches, results, stop):
+    '''Explore sketches from the shared queue until it is drained, a solution is found, or `stop` is set'''
+    try:
+        with make_synthesizer() as synthesizer:
+            enumerator = synthesizer.enumerator
+            while not stop.is_set():
+                sketch = sketches.get()
+                if sketch is None:
+                    break
+                enumerator.set_sketch(sketch)
+                num_attempts = 0
+                prog = enumerator.next()
+                while prog is not None and not stop.is_set():
+                    num_attempts += 1
+                    if synthesizer.try_program(prog):
+                        results.put(('solution', sketch, num_attempts, prog))
+                        return
+                    prog = enumerator.next()
+                results.put(('explored', sketch, num_attempts, None))
+    except Exception:
+        results.put(('error', None, 0, traceback.format_exc()))
+    finally:
+        results.put(('done', None, 0, None))
+
+
+class SketchParallelSynthesizer:
+    '''
+    Explore the sketches of a `BidirectEnumerator` in a pool of worker processes.
+    Each worker owns its own synthesizer, takes sketches from a shared queue one at a time, and stops as soon as any worker finds a solution.
+    '''
+
+    _make_synthesizer: Callable[[], Synthesizer]
+    _sketches: List[str]
+    _num_workers: int
+    _grace_period: float
+
+    def __init__(self, make_synthesizer: Callable[[], Synthesizer], sketches: List[str],
+                 num_workers: Optional[int] = None, grace_period: float = 1.0):
+        '''
+        `make_synthesizer` is called once in each worker. Its enumerator must support `set_sketch()`, e.g. a `BidirectEnumerator` without a sketch queue.
+        `make_synthesizer` must be picklable, and the workers that do not stop within `grace_period` after a solution is found are terminated, see `ProcessRace`.
+        '''
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        if num_workers <= 0:
+            raise ValueError(
+                'Number of workers must be positive: {}'.format(num_workers))
+        self._make_synthesizer = make_synthesizer
+        self._sketches = list(sketches)
+        self._num_workers = max(1, min(num_workers, len(self._sketches)))
+        self._grace_period = grace_period
+        # statistics of the last call to synthesize()
+        self.num_attempts = 0
+        self.num_explored = 0
+        self.solution_sketch = None
+
+    @property
+    def num_workers(self):
+        return self._num_workers
+
+    def synthesize(self) -> Optional[Node]:
+        '''
+        Returns the first program that is accepted by any worker, or `None` if all sketches are exhausted.
+        Raises `RuntimeError` if a worker fails before a solution is found.
+        '''
+        self.num_attempts = 0
+        self.num_explored = 0
+        self.solution_sketch = None
+        if len(self._sketches) == 0:
+            return None
+
+        solution = None
+        error = None
+        num_done = 0
+        with ProcessRace(self._grace_period) as race:
+            sketches = race.context.Queue()
+            for sketch in self._sketches:
+                sketches.put(sketch)
+            for _ in range(self._num_workers):
+                sketches.put(None)
+            for _ in range(self._num_workers):
+                race.start(_sketch_worker, self._make_synthesizer, sketches)
+            logger.debug('Started {} sketch workers for {} sketches'.format(
+                self._num_workers, len(self._sketches)))
+
+            for kind, sketch, num_attempts, payload in race.messages():
+                self.num_attempts += num_attempts
+                if kind == 'done':
+                    num_done += 1
+                    if num_done == self._num_workers:
+                        break
+                elif kind == 'explored':
+                    self.num_explored += 1
+                elif kind == 'solution':
+                    self.num_explored += 1
+                    if solution is None:
+                        solution = payload
+                        self.solution_sketch = sketch
+                        logger.debug(
+                            'Solution found with sketch "{}"'.format(sketch))
+                elif kind == 'error' and error is None:
+                    error = payload
+                if solution is not None or error is not None:
+                    race.stop()
+
+        if solution is None and error is not None:
+            raise RuntimeError('A sketch worker failed:\n{}'.format(error))
+        logger.debug('Explored {} sketches with {} attempts'.format(
+            self.num_explored, self.num_attempts))
+        return solution
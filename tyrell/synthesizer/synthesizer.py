@@ -1,57 +1,211 @@
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterator, NamedTuple, Optional, Tuple
 from ..interpreter import InterpreterError
-from ..enumerator import Enumerator
+from ..enumerator import Enumerator, BidirectEnumerator
 from ..decider import Decider
 from ..dsl import Node
+from ..budget import Budget, BudgetExhausted
+from ..metrics import Metrics, NullMetrics, set_metrics, get_metrics
 from ..logger import get_logger
 
 logger = get_logger('tyrell.synthesizer')
 
+# The outcome of `Synthesizer.run()`. `status` is 'solved', 'exhausted' if the enumerator ran out of programs, or 'budget_exhausted',
+# in which case `reason` is the limit that was hit, see `BudgetExhausted`.
+SynthesisResult = NamedTuple('SynthesisResult', [('program', Optional[Node]), ('status', str), ('reason', Optional[str]),
+                                                 ('num_attempts', int), ('elapsed', float)])
 
-class Synthesizer(ABC):
+
+def analyze_program(decider: Decider, prog: Node) -> Tuple[bool, Any]:
+    '''
+    Analyze `prog` with `decider`. Returns whether it is accepted and, if it is not, the reason that can be used to update the enumerator.
+    '''
+    metrics = get_metrics()
+    metrics.incr('candidates')
+    try:
+        res = decider.analyze(prog)
+        if res.is_ok():
+            return True, None
+        info = res.why()
+        logger.debug('Program rejected. Reason: {}'.format(info))
+    except InterpreterError as e:
+        metrics.incr('interpreter_errors')
+        info = decider.analyze_interpreter_error(e)
+        logger.debug('Interpreter failed. Reason: {}'.format(info))
+    return False, info
+
+
+class SynthesizerBase:
+    '''What every synthesizer has: an enumerator, which is closed along with the synthesizer'''
 
     _enumerator: Enumerator
-    _decider: Decider
 
-    def __init__(self, enumerator: Enumerator, decider: Decider):
+    def __init__(self, enumerator: Enumerator):
         self._enumerator = enumerator
-        self._decider = decider
 
     @property
     def enumerator(self):
         return self._enumerator
 
+    def close(self) -> None:
+        '''Release the resources held by the enumerator'''
+        self._enumerator.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class Synthesizer(SynthesizerBase, ABC):
+
+    _decider: Decider
+
+    def __init__(self, enumerator: Enumerator, decider: Decider, budget: Optional[Budget] = None,
+                 metrics: Optional[Metrics] = None, equivalence=None):
+        '''
+        `budget` limits every call to `run()` and `synthesize()`. It is passed to the enumerator and to the interpreter of the decider, if it has one.
+        `metrics` accumulate the timers and counters of every run, and are installed with `set_metrics()` while it lasts.
+        `equivalence` is an optional `ObservationalEquivalenceFilter` that blocks candidates before they reach the decider.
+        It cannot be used with a `BidirectEnumerator`, whose sketches may not admit the equivalent program that the filter relies on.
+        '''
+        if equivalence is not None and isinstance(enumerator, BidirectEnumerator):
+            raise ValueError(
+                'Observational equivalence cannot be used with a sketch-based enumerator')
+        super().__init__(enumerator)
+        self._decider = decider
+        self._budget = budget
+        self._metrics = metrics if metrics is not None else NullMetrics()
+        self._equivalence = equivalence
+
     @property
     def decider(self):
         return self._decider
 
+    @property
+    def budget(self):
+        return self._budget
+
+    @property
+    def metrics(self):
+        return self._metrics
+
+    @property
+    def equivalence(self):
+        return self._equivalence
+
     def synthesize(self):
         '''
         A convenient method to enumerate ASTs until the result passes the analysis.
-        Returns the synthesized program, or `None` if the synthesis failed.
+        Returns the synthesized program, or `None` if the synthesis failed or ran out of budget.
         '''
+        return self.run().program
+
+    def solutions(self, k: Optional[int] = None) -> Iterator[Node]:
+        '''
+        A generator of up to `k` accepted programs, or of all of them if `k` is `None`.
+        Each program is blocked in the enumerator before it is yielded and the enumerator keeps its state in between,
+        so that the next solution costs no more than continuing the search. The budget, if any, covers the whole generation.
+        '''
+        if k is not None and k <= 0:
+            raise ValueError(
+                'Number of solutions must be positive: {}'.format(k))
+        budget = self._budget
+        if budget is not None:
+            budget.start()
+            self._set_budget(budget)
+        previous_metrics = set_metrics(self._metrics)
         num_attempts = 0
-        prog = self._enumerator.next()
-        while prog is not None:
-            num_attempts += 1
-            logger.debug('Enumerator generated: {}'.format(prog))
-            try:
-                res = self._decider.analyze(prog)
-                if res.is_ok():
+        num_solutions = 0
+        try:
+            prog = self._enumerator.next()
+            while prog is not None:
+                if budget is not None:
+                    budget.attempt()
+                num_attempts += 1
+                if self.try_program(prog):
+                    num_solutions += 1
+                    logger.debug('Solution {} accepted after {} attempts'.format(
+                        num_solutions, num_attempts))
+                    self._enumerator.update()
+                    # The caller may run its own synthesis in between
+                    set_metrics(previous_metrics)
+                    yield prog
+                    previous_metrics = set_metrics(self._metrics)
+                    if num_solutions == k:
+                        return
+                prog = self._enumerator.next()
+            logger.debug('Enumerator is exhausted after {} attempts'.format(
+                num_attempts))
+        except BudgetExhausted as e:
+            logger.debug('Budget exhausted after {} attempts: {}'.format(
+                num_attempts, e))
+        finally:
+            set_metrics(previous_metrics)
+            if budget is not None:
+                self._set_budget(None)
+
+    def _set_budget(self, budget: Optional[Budget]) -> None:
+        self._enumerator.set_budget(budget)
+        interpreter = getattr(self._decider, 'interpreter', None)
+        if interpreter is not None:
+            interpreter.set_budget(budget)
+
+    def run(self) -> SynthesisResult:
+        '''
+        Enumerate ASTs until the result passes the analysis, the enumerator is exhausted, or the budget runs out.
+        '''
+        budget = self._budget
+        if budget is not None:
+            budget.start()
+            self._set_budget(budget)
+        previous_metrics = set_metrics(self._metrics)
+        start = time.perf_counter()
+        num_attempts = 0
+        try:
+            prog = self._enumerator.next()
+            while prog is not None:
+                if budget is not None:
+                    budget.attempt()
+                num_attempts += 1
+                if self.try_program(prog):
                     logger.debug(
                         'Program accepted after {} attempts'.format(num_attempts))
-                    return prog
-                else:
-                    info = res.why()
-                    logger.debug('Program rejected. Reason: {}'.format(info))
-                    self._enumerator.update(info)
-                    prog = self._enumerator.next()
-            except InterpreterError as e:
-                info = self._decider.analyze_interpreter_error(e)
-                logger.debug('Interpreter failed. Reason: {}'.format(info))
-                self._enumerator.update(info)
+                    return SynthesisResult(prog, 'solved', None, num_attempts, time.perf_counter() - start)
                 prog = self._enumerator.next()
-        logger.debug(
-            'Enumerator is exhausted after {} attempts'.format(num_attempts))
-        return None
+            logger.debug(
+                'Enumerator is exhausted after {} attempts'.format(num_attempts))
+            return SynthesisResult(None, 'exhausted', None, num_attempts, time.perf_counter() - start)
+        except BudgetExhausted as e:
+            reason = e.reason
+            # A solver check that is cut short by the deadline is out of time rather than over the solver timeout
+            remaining = budget.remaining_time() if budget is not None else None
+            if reason == 'solver' and remaining is not None and remaining <= 0:
+                reason = 'time'
+            logger.debug('Budget exhausted after {} attempts: {}'.format(
+                num_attempts, e))
+            return SynthesisResult(None, 'budget_exhausted', reason, num_attempts, time.perf_counter() - start)
+        finally:
+            set_metrics(previous_metrics)
+            if budget is not None:
+                self._set_budget(None)
+
+    def try_program(self, prog: Node) -> bool:
+        '''
+        Analyze a single AST from the enumerator. Returns whether it is accepted.
+        If it is rejected, the enumerator is updated with the reason.
+        '''
+        logger.debug('Enumerator generated: {}'.format(prog))
+        if self._equivalence is not None:
+            blame = self._equivalence.check(prog)
+            if blame is not None:
+                get_metrics().incr('rejected_equivalent')
+                self._enumerator.update(blame)
+                return False
+        accepted, info = analyze_program(self._decider, prog)
+        if accepted:
+            return True
+        self._enumerator.update(info)
+        return False
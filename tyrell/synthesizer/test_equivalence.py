@@ -0,0 +1,207 @@
+import unittest
+from .. import spec as S
+from ..dsl import Builder
+from ..enumerator import SmtEnumerator, BidirectEnumerator
+from ..decider import Example, ExampleDecider
+from ..interpreter import PostOrderInterpreter
+from ..metrics import Metrics
+from .synthesizer import Synthesizer
+from .equivalence import ObservationalEquivalenceFilter
+from .test_sketch_parallel import PipelineInterpreter, sketches, spec_str
+
+spec = S.parse(spec_str)
+
+toy_spec = S.parse(r'''
+    enum SmallInt {
+      "0", "1", "2"
+    }
+    value Int;
+    value Empty;
+
+    program Toy(Int, Int) -> Int;
+    func const: Int -> SmallInt;
+    func plus: Int -> Int, Int;
+    func mult: Int -> Int, Int;
+    func empty: Empty -> Empty;
+''')
+
+
+class ToyInterpreter(PostOrderInterpreter):
+    def eval_SmallInt(self, v):
+        return int(v)
+
+    def eval_const(self, node, args):
+        return args[0]
+
+    def eval_plus(self, node, args):
+        return args[0] + args[1]
+
+    def eval_mult(self, node, args):
+        return args[0] * args[1]
+
+
+class CountingInterpreter(ToyInterpreter):
+    def __init__(self):
+        self.num_plus = 0
+
+    def eval_plus(self, node, args):
+        self.num_plus += 1
+        return super().eval_plus(node, args)
+
+
+def make_filter(inputs, **kwargs):
+    return ObservationalEquivalenceFilter(PipelineInterpreter(), inputs, **kwargs)
+
+
+def make_synthesizer(outputs, equivalence, loc=3):
+    return Synthesizer(
+        enumerator=SmtEnumerator(spec, depth=loc + 1, loc=loc),
+        decider=ExampleDecider(
+            interpreter=PipelineInterpreter(),
+            examples=[Example(input=[x], output=y) for x, y in outputs]
+        ),
+        metrics=Metrics(),
+        equivalence=equivalence
+    )
+
+
+class TestObservationalEquivalenceFilter(unittest.TestCase):
+
+    def setUp(self):
+        self.builder = Builder(spec)
+
+    def test_check(self):
+        equivalence = make_filter([[1], [3]])
+        prog = self.builder.from_sexp_string('(inc (dbl (neg (@param 0))))')
+        self.assertIsNone(equivalence.check(prog))
+        # neg(dbl(x)) computes dbl(neg(x)), which was seen with the same size
+        prog = self.builder.from_sexp_string('(inc (neg (dbl (@param 0))))')
+        blame = equivalence.check(prog)
+        self.assertEqual(len(blame), 1)
+        self.assertEqual(sorted(str(x.node) for x in blame[0]),
+                         ['@param0', 'dbl(@param0)', 'neg(dbl(@param0))'])
+        # The same subtree is not redundant with itself
+        prog = self.builder.from_sexp_string('(neg (dbl (neg (@param 0))))')
+        self.assertIsNone(equivalence.check(prog))
+        self.assertEqual(equivalence.num_checked, 3)
+        self.assertEqual(equivalence.num_redundant, 1)
+
+    def test_monotone(self):
+        # inc(neg(neg(x))) computes inc(x), which is smaller
+        prog = self.builder.from_sexp_string('(inc (neg (neg (@param 0))))')
+        equivalence = make_filter([[1], [3]])
+        self.assertIsNone(equivalence.check(prog))
+        equivalence = make_filter([[1], [3]], monotone=True)
+        equivalence.check(self.builder.from_sexp_string('(inc (@param 0))'))
+        self.assertIsNotNone(equivalence.check(prog))
+
+    def test_inputs(self):
+        # dbl(x) and inc(x) only agree on input 1
+        equivalence = make_filter([[1]])
+        self.assertIsNone(equivalence.check(
+            self.builder.from_sexp_string('(dbl (@param 0))')))
+        self.assertIsNotNone(equivalence.check(
+            self.builder.from_sexp_string('(neg (inc (@param 0)))')))
+        equivalence = make_filter([[1], [3]])
+        self.assertIsNone(equivalence.check(
+            self.builder.from_sexp_string('(dbl (@param 0))')))
+        self.assertIsNone(equivalence.check(
+            self.builder.from_sexp_string('(neg (inc (@param 0)))')))
+
+    def test_max_entries(self):
+        equivalence = make_filter([[1]], max_entries=2)
+        equivalence.check(self.builder.from_sexp_string('(inc (@param 0))'))
+        equivalence.check(self.builder.from_sexp_string(
+            '(dbl (neg (@param 0)))'))
+        self.assertEqual(len(equivalence), 2)
+        # The fingerprint of inc(x) was dropped, so dbl(x) is not recognized
+        self.assertIsNone(equivalence.check(
+            self.builder.from_sexp_string('(dbl (@param 0))')))
+        self.assertLessEqual(len(equivalence), 2)
+        equivalence.clear()
+        self.assertEqual(len(equivalence), 0)
+        with self.assertRaises(ValueError):
+            make_filter([[1]], max_entries=0)
+
+    def test_params(self):
+        # With equal inputs, plus(x, x) computes plus(x, y), but a program that drops y is never enumerated
+        outputs = [([x, x], 4 * x) for x in [1, 2, 3]]
+        equivalence = ObservationalEquivalenceFilter(
+            ToyInterpreter(), [x for x, _ in outputs])
+        synthesizer = Synthesizer(
+            enumerator=SmtEnumerator(toy_spec, depth=4, loc=3),
+            decider=ExampleDecider(
+                interpreter=ToyInterpreter(),
+                examples=[Example(input=x, output=y) for x, y in outputs]
+            ),
+            equivalence=equivalence
+        )
+        self.assertEqual(synthesizer.run().status, 'solved')
+        # Params alone are never redundant
+        equivalence = make_filter([[1]])
+        self.assertIsNone(equivalence.check(self.builder.from_sexp_string('(@param 0)')))
+        self.assertEqual(len(equivalence), 0)
+
+    def test_shared_nodes(self):
+        interpreter = CountingInterpreter()
+        equivalence = ObservationalEquivalenceFilter(interpreter, [[1, 2], [3, 4]])
+        builder = Builder(toy_spec)
+        shared = builder.from_sexp_string('(plus (@param 0) (@param 1))')
+        self.assertIsNone(equivalence.check(builder.make_apply('mult', [shared, shared])))
+        # The shared node is evaluated once per input
+        self.assertEqual(interpreter.num_plus, 2)
+        self.assertEqual(len(equivalence), 2)
+
+    def test_sketches(self):
+        with self.assertRaises(ValueError):
+            Synthesizer(
+                enumerator=BidirectEnumerator(spec, depth=3, loc=2, sk_queue=list(sketches)),
+                decider=ExampleDecider(
+                    interpreter=PipelineInterpreter(),
+                    examples=[Example(input=[1], output=0)]
+                ),
+                equivalence=make_filter([[1]])
+            )
+
+    def test_synthesizer(self):
+        outputs = [(1, 4), (3, 8)]
+        equivalence = make_filter([[x] for x, _ in outputs])
+        res = make_synthesizer(outputs, equivalence).run()
+        self.assertEqual(res.status, 'solved')
+        self.assertEqual(str(res.program), 'inc(inc(dbl(@param0)))')
+
+    def test_exhausted(self):
+        outputs = [(1, 100), (3, 7)]
+        baseline = make_synthesizer(outputs, None)
+        self.assertEqual(baseline.run().status, 'exhausted')
+        equivalence = make_filter([[x] for x, _ in outputs])
+        synthesizer = make_synthesizer(outputs, equivalence)
+        self.assertEqual(synthesizer.run().status, 'exhausted')
+        self.assertGreater(synthesizer.metrics.counter('rejected_equivalent'), 0)
+        self.assertEqual(synthesizer.metrics.counter('rejected_equivalent'),
+                         equivalence.num_redundant)
+        # Redundant candidates never reach the decider
+        self.assertLess(synthesizer.metrics.counter('candidates'),
+                        baseline.metrics.counter('candidates'))
+
+    def test_sweep(self):
+        # dbl(inc(x)) is found at loc 2, and is not equivalent to anything smaller
+        outputs = [(1, 4), (3, 8)]
+        equivalence = make_filter([[x] for x, _ in outputs], monotone=True)
+        for loc in range(1, 3):
+            res = make_synthesizer(outputs, equivalence, loc=loc).run()
+        self.assertEqual(str(res.program), 'dbl(inc(@param0))')
+        # Unsolvable within loc 3: the larger programs are only tried modulo equivalence
+        outputs = [(1, 100), (3, 7)]
+        counts = []
+        for monotone in [False, True]:
+            equivalence = make_filter([[x] for x, _ in outputs], monotone=monotone)
+            for loc in range(1, 4):
+                res = make_synthesizer(outputs, equivalence, loc=loc).run()
+                self.assertEqual(res.status, 'exhausted')
+            counts.append(equivalence.num_checked - equivalence.num_redundant)
+        self.assertLess(counts[1], counts[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from .. import spec as S
+from ..enumerator import BidirectEnumerator
+from ..decider import Decider, Example, ExampleDecider, bad
+from .pipelined import PipelinedSynthesizer
+from .test_sketch_parallel import PipelineInterpreter, sketches, spec_str
+
+
+def make_decider(outputs):
+    return ExampleDecider(
+        interpreter=PipelineInterpreter(),
+        examples=[Example(input=[x], output=y) for x, y in outputs]
+    )
+
+
+def make_dbl_inc():
+    return make_decider([(1, 4), (3, 8)])
+
+
+def make_unsolvable():
+    return make_decider([(1, 100), (3, 7)])
+
+
+class NegFirstDecider(Decider):
+    '''Reject everything, and blame the first line if it is a neg'''
+
+    def __init__(self):
+        pass
+
+    def analyze(self, ast):
+        first = ast.args[0]
+        if first.name == 'neg':
+            return bad([[(first, first.production)]])
+        return bad()
+
+
+def make_enumerator(sk_queue=None):
+    if sk_queue is None:
+        sk_queue = sketches
+    return BidirectEnumerator(S.parse(spec_str), depth=3, loc=2, sk_queue=list(sk_queue))
+
+
+class TestPipelinedSynthesizer(unittest.TestCase):
+
+    def test_solution(self):
+        for processes in [False, True]:
+            with PipelinedSynthesizer(make_enumerator(), make_dbl_inc,
+                                      num_workers=2, processes=processes) as synthesizer:
+                prog = synthesizer.synthesize()
+                self.assertEqual(str(prog), 'dbl(inc(@param0))')
+                self.assertGreater(synthesizer.num_attempts, 0)
+                self.assertGreater(synthesizer.throughput, 0)
+
+    def test_exhausted(self):
+        synthesizer = PipelinedSynthesizer(
+            make_enumerator(), make_unsolvable, num_workers=2, max_in_flight=3, processes=False)
+        self.assertIsNone(synthesizer.synthesize())
+        self.assertEqual(synthesizer.num_attempts, len(sketches))
+
+    def test_blames(self):
+        sk_queue = ['neg inc', 'neg dbl', 'inc neg']
+        for processes in [False, True]:
+            # One candidate at a time learns the lemma before the second sketch
+            synthesizer = PipelinedSynthesizer(
+                make_enumerator(sk_queue), NegFirstDecider, max_in_flight=1, processes=processes)
+            self.assertIsNone(synthesizer.synthesize())
+            self.assertEqual(synthesizer.num_attempts, 2)
+            self.assertEqual(synthesizer.enumerator.num_lemmas, 1)
+            self.assertEqual(synthesizer.num_overlapped, 0)
+
+        # Candidates that are already in flight are still decided
+        synthesizer = PipelinedSynthesizer(
+            make_enumerator(sk_queue), NegFirstDecider, max_in_flight=3, processes=False)
+        self.assertIsNone(synthesizer.synthesize())
+        self.assertEqual(synthesizer.num_attempts, 3)
+        self.assertGreaterEqual(synthesizer.num_overlapped, 1)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            PipelinedSynthesizer(make_enumerator(), make_dbl_inc, num_workers=0)
+        with self.assertRaises(ValueError):
+            PipelinedSynthesizer(make_enumerator(), make_dbl_inc, max_in_flight=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
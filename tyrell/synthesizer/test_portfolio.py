@@ -0,0 +1,92 @@
+import os
+import shutil
+import tempfile
+import unittest
+from .. import spec as S
+from ..enumerator import BidirectEnumerator, RandomEnumerator
+from .portfolio import PortfolioSynthesizer, PortfolioStats
+from .test_pipelined import make_dbl_inc, make_unsolvable
+from .test_sketch_parallel import sketches, spec_str
+
+
+def make_bidirect():
+    return BidirectEnumerator(S.parse(spec_str), depth=3, loc=2, sk_queue=list(sketches))
+
+
+def make_random():
+    # Never runs out of candidates
+    return RandomEnumerator(S.parse(spec_str), max_depth=3, seed=0)
+
+
+def make_broken():
+    raise ValueError('Cannot build the enumerator')
+
+
+class TestPortfolioSynthesizer(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'stats.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_race(self):
+        synthesizer = PortfolioSynthesizer(
+            [(make_random, make_unsolvable), (make_bidirect, make_dbl_inc)],
+            names=['random', 'bidirect'], grace_period=0.5)
+        prog = synthesizer.synthesize()
+        self.assertEqual(str(prog), 'dbl(inc(@param0))')
+        self.assertEqual(synthesizer.winner, 'bidirect')
+        self.assertEqual(synthesizer.results['bidirect']['outcome'], 'win')
+        self.assertEqual(synthesizer.results['random']['outcome'], 'stopped')
+
+    def test_exhausted(self):
+        synthesizer = PortfolioSynthesizer(
+            [(make_bidirect, make_unsolvable), (make_broken, make_unsolvable)])
+        self.assertIsNone(synthesizer.synthesize())
+        self.assertIsNone(synthesizer.winner)
+        self.assertEqual(synthesizer.results['config0']['outcome'], 'exhausted')
+        self.assertEqual(synthesizer.results['config0']['attempts'], len(sketches))
+        self.assertEqual(synthesizer.results['config1']['outcome'], 'error')
+
+        synthesizer = PortfolioSynthesizer([(make_broken, make_unsolvable)])
+        with self.assertRaises(RuntimeError):
+            synthesizer.synthesize()
+
+    def test_stats(self):
+        configs = [(make_random, make_unsolvable), (make_bidirect, make_dbl_inc)]
+        names = ['random', 'bidirect']
+        for _ in range(2):
+            synthesizer = PortfolioSynthesizer(
+                configs, names=names, stats=PortfolioStats(self.path), grace_period=0.5)
+            synthesizer.synthesize()
+        stats = PortfolioStats(self.path)
+        self.assertEqual(stats.get('bidirect')['runs'], 2)
+        self.assertEqual(stats.get('bidirect')['win'], 2)
+        self.assertEqual(stats.get('random')['stopped'], 2)
+        self.assertEqual(stats.rank(names), ['bidirect', 'random'])
+        self.assertEqual(stats.rank(names, min_runs=2, min_win_rate=0.5), ['bidirect'])
+
+        # The best configuration alone
+        synthesizer = PortfolioSynthesizer(
+            configs, names=names, stats=stats, max_configs=1)
+        self.assertEqual(synthesizer.selected(), ['bidirect'])
+        self.assertEqual(str(synthesizer.synthesize()), 'dbl(inc(@param0))')
+        self.assertEqual(list(synthesizer.results), ['bidirect'])
+
+        with self.assertRaises(ValueError):
+            stats.record('random', 'lost', 0.0, 0)
+
+    def test_invalid(self):
+        configs = [(make_bidirect, make_dbl_inc)]
+        with self.assertRaises(ValueError):
+            PortfolioSynthesizer(configs, names=['a', 'b'])
+        with self.assertRaises(ValueError):
+            PortfolioSynthesizer(configs * 2, names=['a', 'a'])
+        with self.assertRaises(ValueError):
+            PortfolioSynthesizer(configs, max_configs=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import time
+import unittest
+from .race import ProcessRace
+
+
+def _report(value, results, stop):
+    results.put(value)
+
+
+def _wait_for_stop(results, stop):
+    stop.wait()
+    results.put('stopped')
+
+
+def _ignore_stop(results, stop):
+    time.sleep(60)
+
+
+class TestProcessRace(unittest.TestCase):
+
+    def test_messages(self):
+        with ProcessRace() as race:
+            race.start(_report, 1)
+            race.start(_report, 2)
+            # The messages end once every worker is gone
+            self.assertCountEqual(list(race.messages()), [1, 2])
+
+    def test_stop(self):
+        with ProcessRace(grace_period=5.0) as race:
+            race.start(_wait_for_stop)
+            race.stop()
+            self.assertEqual(next(race.messages()), 'stopped')
+        self.assertFalse(race.workers[0].is_alive())
+
+    def test_terminate(self):
+        start = time.monotonic()
+        with ProcessRace(grace_period=0.1) as race:
+            race.start(_ignore_stop)
+            race.stop()
+            self.assertEqual(list(race.messages()), [])
+        self.assertFalse(race.workers[0].is_alive())
+        self.assertLess(time.monotonic() - start, 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+from .. import spec as S
+from ..interpreter import PostOrderInterpreter
+from ..enumerator import BidirectEnumerator
+from ..decider import Example, ExampleDecider
+from .synthesizer import Synthesizer
+from .sketch_parallel import SketchParallelSynthesizer
+
+spec_str = r'''
+    value Table;
+
+    program Pipeline(Table) -> Table;
+    func inc: Table -> Table;
+    func dbl: Table -> Table;
+    func neg: Table -> Table;
+'''
+sketches = [x + ' ' + y for x in ['neg', 'inc', 'dbl']
+            for y in ['neg', 'inc', 'dbl']]
+
+
+class PipelineInterpreter(PostOrderInterpreter):
+    def eval_inc(self, node, args):
+        return args[0] + 1
+
+    def eval_dbl(self, node, args):
+        return args[0] * 2
+
+    def eval_neg(self, node, args):
+        return -args[0]
+
+
+def make_synthesizer(outputs):
+    # Runs in the worker processes, so everything is built from scratch
+    return Synthesizer(
+        enumerator=BidirectEnumerator(S.parse(spec_str), depth=3, loc=2),
+        decider=ExampleDecider(
+            interpreter=PipelineInterpreter(),
+            examples=[Example(input=[x], output=y) for x, y in outputs]
+        )
+    )
+
+
+def make_dbl_inc():
+    return make_synthesizer([(1, 4), (3, 8)])
+
+
+def make_unsolvable():
+    return make_synthesizer([(1, 100), (3, 7)])
+
+
+def make_broken():
+    raise ValueError('Cannot build the synthesizer')
+
+
+class TestSketchParallelSynthesizer(unittest.TestCase):
+
+    def test_solution(self):
+        synthesizer = SketchParallelSynthesizer(
+            make_dbl_inc, sketches, num_workers=2)
+        prog = synthesizer.synthesize()
+        self.assertEqual(str(prog), 'dbl(inc(@param0))')
+        self.assertEqual(synthesizer.solution_sketch, 'inc dbl')
+        self.assertGreater(synthesizer.num_attempts, 0)
+
+    def test_exhausted(self):
+        synthesizer = SketchParallelSynthesizer(
+            make_unsolvable, sketches, num_workers=2)
+        self.assertIsNone(synthesizer.synthesize())
+        self.assertEqual(synthesizer.num_explored, len(sketches))
+        self.assertEqual(synthesizer.num_attempts, len(sketches))
+
+    def test_worker_error(self):
+        synthesizer = SketchParallelSynthesizer(
+            make_broken, sketches, num_workers=2)
+        with self.assertRaises(RuntimeError):
+            synthesizer.synthesize()
+
+    def test_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            SketchParallelSynthesizer(make_dbl_inc, sketches, num_workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
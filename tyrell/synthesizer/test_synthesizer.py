@@ -0,0 +1,47 @@
+import unittest
+from ..budget import Budget
+from ..metrics import Metrics, get_metrics
+from ..test_budget import make_synthesizer
+from .test_sketch_parallel import sketches
+
+# Programs of two lines that map 1 to -2
+solutions = ['dbl(neg(@param0))', 'neg(dbl(@param0))', 'neg(inc(@param0))']
+
+
+class TestSolutions(unittest.TestCase):
+
+    def test_all(self):
+        synthesizer = make_synthesizer([(1, -2)], None)
+        progs = [str(x) for x in synthesizer.solutions()]
+        self.assertEqual(sorted(progs), solutions)
+
+    def test_k(self):
+        metrics = Metrics()
+        synthesizer = make_synthesizer([(1, -2)], None, metrics=metrics)
+        gen = synthesizer.solutions(k=2)
+        first = str(next(gen))
+        # Metrics are only installed while the generator runs
+        self.assertIsNot(get_metrics(), metrics)
+        attempts = metrics.counter('candidates')
+        second = str(next(gen))
+        self.assertNotEqual(first, second)
+        self.assertIn(second, solutions)
+        # The search goes on from where it stopped
+        self.assertLess(metrics.counter('candidates') - attempts, len(sketches))
+        with self.assertRaises(StopIteration):
+            next(gen)
+        with self.assertRaises(ValueError):
+            next(synthesizer.solutions(k=0))
+
+    def test_budget(self):
+        synthesizer = make_synthesizer([(1, -2)], Budget(max_attempts=1))
+        self.assertLessEqual(len(list(synthesizer.solutions())), 1)
+        self.assertIsNone(synthesizer.enumerator.budget)
+
+    def test_unsolvable(self):
+        synthesizer = make_synthesizer([(1, 100)], None)
+        self.assertEqual(list(synthesizer.solutions()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
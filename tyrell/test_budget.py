@@ -0,0 +1,144 @@
+import unittest
+from z3 import Ints, Solver
+from . import spec as S
+from .budget import Budget, BudgetExhausted, check_sat
+from .enumerator import BidirectEnumerator
+from .decider import Example, ExampleDecider
+from .synthesizer import Synthesizer
+from .synthesizer.test_sketch_parallel import PipelineInterpreter, sketches, spec_str
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class RecordingSolver(Solver):
+    '''Remembers the timeouts it is given'''
+
+    def __init__(self):
+        super().__init__()
+        self.timeouts = []
+
+    def set(self, *args, **keys):
+        if len(args) == 2 and args[0] == 'timeout':
+            self.timeouts.append(args[1])
+        super().set(*args, **keys)
+
+
+class SlowInterpreter(PipelineInterpreter):
+    '''Every call takes a second of the fake clock'''
+
+    def __init__(self, clock):
+        self._clock = clock
+
+    def eval_inc(self, node, args):
+        self._clock.now += 1.0
+        return super().eval_inc(node, args)
+
+
+def make_synthesizer(outputs, budget, interpreter=None, metrics=None):
+    return Synthesizer(
+        enumerator=BidirectEnumerator(
+            S.parse(spec_str), depth=3, loc=2, sk_queue=list(sketches)),
+        decider=ExampleDecider(
+            interpreter=interpreter or PipelineInterpreter(),
+            examples=[Example(input=[x], output=y) for x, y in outputs]
+        ),
+        budget=budget,
+        metrics=metrics
+    )
+
+
+class TestBudget(unittest.TestCase):
+
+    def test_solved(self):
+        synthesizer = make_synthesizer([(1, 4), (3, 8)], Budget(max_attempts=100))
+        res = synthesizer.run()
+        self.assertEqual(res.status, 'solved')
+        self.assertEqual(str(res.program), 'dbl(inc(@param0))')
+        self.assertIsNone(res.reason)
+
+    def test_attempts(self):
+        synthesizer = make_synthesizer([(1, 100)], Budget(max_attempts=3))
+        res = synthesizer.run()
+        self.assertEqual(res.status, 'budget_exhausted')
+        self.assertEqual(res.reason, 'attempts')
+        self.assertEqual(res.num_attempts, 3)
+        self.assertIsNone(res.program)
+        # Each run starts over
+        self.assertEqual(synthesizer.run().num_attempts, 3)
+
+        res = make_synthesizer([(1, 100)], None).run()
+        self.assertEqual(res.status, 'exhausted')
+        self.assertEqual(res.num_attempts, len(sketches))
+
+    def test_deadline(self):
+        clock = FakeClock()
+        budget = Budget(time_limit=2.5, clock=clock)
+        synthesizer = make_synthesizer(
+            [(1, 100)], budget, interpreter=SlowInterpreter(clock))
+        res = synthesizer.run()
+        # The interpreter notices the deadline in the middle of a candidate
+        self.assertEqual(res.reason, 'time')
+        self.assertLess(res.num_attempts, len(sketches))
+        self.assertIsNone(synthesizer.decider.interpreter.budget)
+        self.assertIsNone(synthesizer.enumerator.budget)
+
+    def test_memory(self):
+        res = make_synthesizer([(1, 100)], Budget(max_memory=1)).run()
+        self.assertEqual(res.reason, 'memory')
+        self.assertEqual(res.num_attempts, 0)
+
+    def test_solver_timeout(self):
+        x, y, z = Ints('x y z')
+        solver = Solver()
+        solver.add(x * x * x + y * y * y == z * z * z, x > 1000, y > 1000, z > 1000)
+        budget = Budget(solver_timeout=0.05)
+        budget.start()
+        budget.configure(solver)
+        with self.assertRaises(BudgetExhausted) as cm:
+            check_sat(solver)
+        self.assertEqual(cm.exception.reason, 'solver')
+
+    def test_check_sat_deadline(self):
+        clock = FakeClock()
+        budget = Budget(time_limit=10, clock=clock)
+        budget.start()
+        solver = RecordingSolver()
+        check_sat(solver, budget=budget)
+        clock.now = 6.0
+        check_sat(solver, budget=budget)
+        # Each check only gets the time that is left
+        self.assertEqual(solver.timeouts, [10000, 4000])
+        clock.now = 10.0
+        with self.assertRaises(BudgetExhausted):
+            check_sat(solver, budget=budget)
+        self.assertEqual(len(solver.timeouts), 2)
+
+    def test_solver_timeout_ms(self):
+        clock = FakeClock()
+        budget = Budget(time_limit=10, solver_timeout=30, clock=clock)
+        # The deadline only counts once the run starts
+        self.assertEqual(budget.solver_timeout_ms(), 30000)
+        budget.start()
+        self.assertEqual(budget.solver_timeout_ms(), 10000)
+        clock.now = 9.5
+        self.assertEqual(budget.solver_timeout_ms(), 500)
+        clock.now = 10.0
+        with self.assertRaises(BudgetExhausted):
+            budget.check()
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Budget(time_limit=0)
+        with self.assertRaises(ValueError):
+            Budget(max_attempts=-1)
+        self.assertIsNone(Budget().solver_timeout_ms())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import json
+import unittest
+from .metrics import Metrics, NullMetrics, get_metrics
+from .test_budget import FakeClock, make_synthesizer
+from .synthesizer.test_sketch_parallel import sketches
+
+
+class TestMetrics(unittest.TestCase):
+
+    def test_timers(self):
+        clock = FakeClock()
+        metrics = Metrics(clock=clock)
+        with metrics.timer('interpret'):
+            clock.now += 1.0
+            # Nested timers of the same phase are not counted twice
+            with metrics.timer('interpret'):
+                clock.now += 2.0
+            with metrics.timer('abstract'):
+                clock.now += 4.0
+        self.assertEqual(metrics.time('interpret'), 7.0)
+        self.assertEqual(metrics.calls('interpret'), 1)
+        self.assertEqual(metrics.time('abstract'), 4.0)
+        metrics.incr('candidates')
+        metrics.incr('lemma_clauses', 3)
+        self.assertEqual(metrics.counter('candidates'), 1)
+        self.assertEqual(metrics.counter('lemma_clauses'), 3)
+        metrics.reset()
+        self.assertEqual(metrics.counter('lemma_clauses'), 0)
+        self.assertEqual(metrics.time('interpret'), 0.0)
+
+    def test_export(self):
+        metrics = Metrics(clock=FakeClock())
+        metrics.incr('candidates', 2)
+        metrics.add_time('solve', 1.5)
+        data = json.loads(metrics.to_json())
+        self.assertEqual(data['counters']['candidates'], 2)
+        self.assertEqual(data['phases']['solve'], {'seconds': 1.5, 'calls': 1})
+        text = metrics.to_prometheus()
+        self.assertIn('# TYPE tyrell_candidates_total counter\ntyrell_candidates_total 2\n', text)
+        self.assertIn('tyrell_phase_seconds_total{phase="solve"} 1.5\n', text)
+        self.assertIn('tyrell_phase_calls_total{phase="solve"} 1\n', text)
+
+    def test_null(self):
+        metrics = NullMetrics()
+        with metrics.timer('solve'):
+            metrics.incr('candidates')
+        self.assertFalse(metrics.enabled)
+        self.assertEqual(metrics.counter('candidates'), 0)
+        self.assertEqual(metrics.calls('solve'), 0)
+        self.assertIsInstance(get_metrics(), NullMetrics)
+
+    def test_synthesizer(self):
+        synthesizer = make_synthesizer([(1, 100)], None)
+        self.assertFalse(synthesizer.metrics.enabled)
+        metrics = Metrics()
+        synthesizer = make_synthesizer([(1, 100)], None, metrics=metrics)
+        previous = get_metrics()
+        self.assertIsNone(synthesizer.synthesize())
+        self.assertIs(get_metrics(), previous)
+        self.assertEqual(metrics.counter('candidates'), len(sketches))
+        self.assertEqual(metrics.counter('rejected_concrete'), len(sketches))
+        # One more check finds that the last sketch is exhausted
+        self.assertGreater(metrics.counter('solver_checks'), len(sketches))
+        self.assertEqual(metrics.calls('decode'), len(sketches))
+        self.assertEqual(metrics.calls('interpret'), len(sketches))
+
+
+if __name__ == '__main__':
+    unittest.main()
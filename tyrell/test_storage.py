@@ -0,0 +1,26 @@
+import os
+import json
+import tempfile
+import unittest
+from .storage import write_json
+
+
+class TestStorage(unittest.TestCase):
+
+    def test_write_json(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'entries.json')
+            write_json(path, {'b': 1, 'a': [2]}, sort_keys=True)
+            write_json(path, {'c': 3})
+            with open(path, 'r') as f:
+                self.assertEqual(json.load(f), {'c': 3})
+            # A failed write leaves the file as it was, and no temporary file behind
+            with self.assertRaises(TypeError):
+                write_json(path, {'d': object()})
+            with open(path, 'r') as f:
+                self.assertEqual(json.load(f), {'c': 3})
+            self.assertEqual(os.listdir(directory), ['entries.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()